@@ -45,7 +45,9 @@ async def chat_stream(
     """
 
     return StreamingResponse(
-        stream_graph_events(user_id, chat_data.messages, session),
+        stream_graph_events(
+            user_id, chat_data.messages, session, chat_data.hybrid_search
+        ),
     )
 
 
@@ -16,6 +16,9 @@ from services.document import (
     upload_documents,
     delete_documents,
     update_document_user_groups,
+    get_ingestion_job_status,
+    cancel_ingestion_job,
+    retry_ingestion_job,
 )
 from schemas.schemas import CustomAPIResponse
 
@@ -78,19 +81,101 @@ async def upload_document(
         CustomException: 인증되지 않은 사용자인 경우 발생.
 
     Returns:
-        CustomAPIResponse: 업로드 성공을 나타내는 빈 응답.
+        CustomAPIResponse: 생성된 수집 작업 ID를 포함한 응답.
     """
 
-    await upload_documents(
+    job_id = await upload_documents(
         datasource=documents_data.datasource,
         user_groups=documents_data.user_groups,
         document_urls=documents_data.document_urls,
         session=session,
+        incremental=documents_data.incremental,
+        chunk_strategy=documents_data.chunk_strategy,
+        user_id=user_id,
     )
 
+    return CustomAPIResponse(data=job_id)
+
+
+@docs_router.get("/jobs/{job_id}", response_model=CustomAPIResponse)
+async def get_ingestion_job(
+    job_id: str,
+    user_id: str = Depends(validate_token),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    문서 수집 작업의 진행 상태를 조회합니다. (문서별 진행 상태, 청크 수, 처리량, 에러)
+
+    Args:
+        job_id (str): 수집 작업 ID.
+        user_id (str, optional): 토큰에서 검증된 사용자 ID. Defaults to Depends(validate_token).
+        session (AsyncSession, optional): 데이터베이스 세션. Defaults to Depends(get_session).
+
+    Raises:
+        CustomException: 인증되지 않은 사용자이거나 작업이 존재하지 않는 경우 발생.
+
+    Returns:
+        CustomAPIResponse: 작업 상태를 포함한 응답.
+    """
+
+    job_status = await get_ingestion_job_status(job_id=job_id, session=session)
+
+    return CustomAPIResponse(data=job_status)
+
+
+@docs_router.post("/jobs/{job_id}/cancel", response_model=CustomAPIResponse)
+async def cancel_job(
+    job_id: str,
+    user_id: str = Depends(validate_token),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    문서 수집 작업을 취소합니다. 이미 처리된 문서는 유지됩니다.
+
+    Args:
+        job_id (str): 수집 작업 ID.
+        user_id (str, optional): 토큰에서 검증된 사용자 ID. Defaults to Depends(validate_token).
+        session (AsyncSession, optional): 데이터베이스 세션. Defaults to Depends(get_session).
+
+    Raises:
+        CustomException: 인증되지 않은 사용자이거나 작업이 존재하지 않는 경우 발생.
+
+    Returns:
+        CustomAPIResponse: 취소 성공을 나타내는 빈 응답.
+    """
+
+    await cancel_ingestion_job(job_id=job_id, session=session)
+
     return CustomAPIResponse()
 
 
+@docs_router.post("/jobs/{job_id}/retry", response_model=CustomAPIResponse)
+async def retry_job(
+    job_id: str,
+    user_id: str = Depends(validate_token),
+    session: AsyncSession = Depends(get_session),
+):
+    """
+    문서 수집 작업에서 실패하거나 취소된 문서만 다시 처리합니다.
+    페이지 ID를 추출할 수 없던 URL은 실패 상태로 남습니다.
+
+    Args:
+        job_id (str): 수집 작업 ID.
+        user_id (str, optional): 토큰에서 검증된 사용자 ID. Defaults to Depends(validate_token).
+        session (AsyncSession, optional): 데이터베이스 세션. Defaults to Depends(get_session).
+
+    Raises:
+        CustomException: 인증되지 않은 사용자이거나 작업이 존재하지 않는 경우 발생.
+
+    Returns:
+        CustomAPIResponse: 다시 처리할 작업 페이지 ID 목록을 포함한 응답.
+    """
+
+    retry_page_ids = await retry_ingestion_job(job_id=job_id, session=session)
+
+    return CustomAPIResponse(data=retry_page_ids)
+
+
 @docs_router.post("/delete", response_model=CustomAPIResponse)
 async def delete_document(
     documents_data: DeleteDocumentRequest,
@@ -0,0 +1,40 @@
+"""
+서버 내부 지표(캐시 적중률 등)를 조회하는 API 엔드포인트를 제공합니다.
+지표는 요청을 처리한 uvicorn 워커 프로세스 기준입니다.
+"""
+
+from fastapi import APIRouter, Depends
+from services.auth import validate_token
+from services.embedding_cache import get_embedding_cache
+from services.query_embedding_cache import get_query_embedding_cache
+from schemas.schemas import CustomAPIResponse
+
+
+metrics_router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@metrics_router.get("/cache", response_model=CustomAPIResponse)
+async def get_cache_metrics(user_id: str = Depends(validate_token)):
+    """
+    질의 임베딩 캐시와 임베딩 캐시(SQLite)의 적중률 및 절약 시간을 조회합니다.
+
+    Args:
+        user_id (str, optional): 토큰에서 검증된 사용자 ID. Defaults to Depends(validate_token).
+
+    Raises:
+        CustomException: 인증되지 않은 사용자인 경우 발생.
+
+    Returns:
+        CustomAPIResponse: 캐시별 지표를 포함한 응답. 비활성화된 캐시는 None.
+    """
+
+    query_embedding_cache = get_query_embedding_cache()
+    embedding_cache = get_embedding_cache()
+    return CustomAPIResponse(
+        data={
+            "query_embedding": (
+                query_embedding_cache.stats if query_embedding_cache else None
+            ),
+            "embedding": embedding_cache.stats if embedding_cache else None,
+        }
+    )
@@ -13,6 +13,8 @@ class ChatRequest(BaseModel):
     """
 
     messages: list[str]
+    # 하이브리드(dense + BM25) 검색 사용 여부. None이면 서버 설정(HYBRID_SEARCH_ENABLED)을 따름
+    hybrid_search: Optional[bool] = None
 
 
 class GetConversationListResponse(BaseModel):
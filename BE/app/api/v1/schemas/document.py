@@ -2,8 +2,9 @@
 문서(Document) API 엔드포인트에서 사용되는 Pydantic 스키마를 정의합니다.
 """
 
+import datetime
 from pydantic import BaseModel
-from db.models import DataSource
+from db.models import ChunkStrategy, DataSource, JobStatus
 
 
 class UploadDocumentRequest(BaseModel):
@@ -14,6 +15,8 @@ class UploadDocumentRequest(BaseModel):
     datasource: DataSource
     user_groups: list[str]
     document_urls: list[str]
+    incremental: bool = True
+    chunk_strategy: ChunkStrategy = ChunkStrategy.CHARACTER
 
 
 class DeleteDocumentRequest(BaseModel):
@@ -33,3 +36,68 @@ class UpdateDocuemntRequest(BaseModel):
     datasource: DataSource
     page_id: str
     user_groups: list[str] | None = None
+
+
+class DocumentResponse(BaseModel):
+    """
+    등록된 문서와 하위 페이지를 포함한 동기화 상태 응답 스키마입니다.
+    """
+
+    id: str
+    page_id: str
+    datasource: DataSource
+    user_groups: list[str]
+    chunk_strategy: ChunkStrategy = ChunkStrategy.CHARACTER
+    created_date: datetime.datetime | None = None
+    update_date: datetime.datetime | None = None
+    page_count: int = 0
+    chunk_count: int = 0
+    last_edited_time: str | None = None
+    last_ingested_date: datetime.datetime | None = None
+    is_latest: bool = True
+
+
+class IngestionJobPageResponse(BaseModel):
+    """
+    수집 작업 내 개별 문서의 진행 상태 응답 스키마입니다.
+    """
+
+    id: str
+    url: str
+    page_id: str
+    status: JobStatus
+    attempts: int
+    page_count: int
+    chunk_count: int
+    embedded_count: int
+    upserted_count: int
+    deleted_count: int
+    embed_throughput: float
+    upsert_throughput: float
+    error: str | None = None
+    started_date: datetime.datetime | None = None
+    finished_date: datetime.datetime | None = None
+
+
+class IngestionJobResponse(BaseModel):
+    """
+    수집 작업 상태 조회 응답 스키마입니다.
+    처리량(throughput)은 초당 청크 수입니다.
+    """
+
+    id: str
+    status: JobStatus
+    datasource: DataSource
+    user_groups: list[str]
+    incremental: bool
+    chunk_strategy: ChunkStrategy
+    page_status_counts: dict[str, int]
+    chunk_count: int
+    embedded_count: int
+    upserted_count: int
+    deleted_count: int
+    embed_throughput: float
+    upsert_throughput: float
+    pages: list[IngestionJobPageResponse]
+    created_date: datetime.datetime | None = None
+    finished_date: datetime.datetime | None = None
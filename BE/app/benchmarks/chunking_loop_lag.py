@@ -0,0 +1,108 @@
+"""
+청킹이 이벤트 루프를 막는 시간을 측정하는 벤치마크.
+합성 페이지 텍스트를 (1) 이벤트 루프 스레드에서, (2) 프로세스 풀에서 청킹하는 동안
+짧은 주기로 깨어나는 ticker task의 지연(loop lag)을 측정하고, 두 방식의 청킹 결과가 같은지 확인.
+
+수집 파이프라인과 같이 페이지 단위(`--group 1`, 큐에 쌓인 페이지를 묶는 경우는
+`--group CHUNKING_BATCH_PAGES`)로 청킹하며, 페이지 크기는 1 ~ 2 * `--blocks` 블록으로 다양하게 생성.
+`CHUNKING_INLINE_MAX_CHARS` 이하의 페이지는 풀 모드에서도 이벤트 루프 스레드에서 청킹됨.
+
+실행 (BE/app 디렉토리에서):
+    python -m benchmarks.chunking_loop_lag --pages 500 --group 1 --workers 4
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from core.config import settings
+from utils import chunking
+
+TICK_INTERVAL = 0.005
+
+
+def make_corpora(pages: int, blocks_per_page: int, seed: int = 0) -> list[str]:
+    rnd = random.Random(seed)
+    words = ["노션", "문서", "검색", "임베딩", "chunk", "vector", "query", "page"]
+    corpora = []
+    for _ in range(pages):
+        blocks = [
+            " ".join(rnd.choice(words) for _ in range(rnd.randint(5, 80)))
+            + rnd.choice([".", "", ". "])
+            for _ in range(rnd.randint(1, blocks_per_page * 2))
+        ]
+        corpora.append("\n".join(blocks))
+    return corpora
+
+
+async def measure(
+    corpora: list[str], workers: int, group_pages: int
+) -> tuple[list, float, float]:
+    """청킹 결과, 소요 시간, 최대 loop lag(초) 반환."""
+    settings.CHUNKING_WORKERS = workers
+    chunking.shutdown_chunking_executor()
+    if workers > 0:
+        # 프로세스 시작 비용은 측정에서 제외
+        loop = asyncio.get_running_loop()
+        executor = chunking.get_chunking_executor()
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(executor, chunking.split_corpora, corpora[:1])
+                for _ in range(workers * 2)
+            ]
+        )
+
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal max_lag
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_INTERVAL)
+            max_lag = max(max_lag, time.perf_counter() - start - TICK_INTERVAL)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK_INTERVAL)
+    start = time.perf_counter()
+    # 수집 파이프라인의 chunk stage처럼 페이지(묶음)씩 청킹
+    results = []
+    for group_start in range(0, len(corpora), group_pages):
+        group_end = group_start + group_pages
+        results.extend(await chunking.asplit_corpora(corpora[group_start:group_end]))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticker_task
+    chunking.shutdown_chunking_executor()
+    return results, elapsed, max_lag
+
+
+async def main(args: argparse.Namespace) -> None:
+    corpora = make_corpora(args.pages, args.blocks)
+    pooled = sum(len(c) > settings.CHUNKING_INLINE_MAX_CHARS for c in corpora)
+    print(
+        f"pages={args.pages}, chars={sum(len(c) for c in corpora):,}, "
+        f"max page chars={max(len(c) for c in corpora):,}, "
+        f"pages over inline limit={pooled}"
+    )
+
+    inline_result, inline_time, inline_lag = await measure(corpora, 0, args.group)
+    print(f"inline : {inline_time:7.3f}s, max loop lag {inline_lag * 1000:8.1f}ms")
+
+    pool_result, pool_time, pool_lag = await measure(corpora, args.workers, args.group)
+    print(
+        f"pool({args.workers}): {pool_time:7.3f}s, max loop lag {pool_lag * 1000:8.1f}ms"
+    )
+
+    print(f"identical chunks: {inline_result == pool_result}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--blocks", type=int, default=80, help="페이지당 평균 블록 수")
+    parser.add_argument(
+        "--group", type=int, default=1, help="한 번에 청킹하는 페이지 수"
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    asyncio.run(main(parser.parse_args()))
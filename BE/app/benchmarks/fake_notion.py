@@ -0,0 +1,336 @@
+"""
+Notion API 없이 수집(ingestion)을 벤치마크/검증하기 위한 `notion_client.AsyncClient` 대체 모듈.
+NotionDataLoader가 사용하는 API(`blocks.children.list`, `pages.retrieve`, `search`)만 구현하며,
+녹화한 JSON fixture를 재생하거나 크기와 깊이를 지정한 합성 페이지 트리를 생성함.
+응답 지연(latency)과 429(rate limited) 응답을 주입할 수 있음.
+
+fixture 녹화 (BE/app 디렉토리에서, NOTION_API_KEY 필요):
+    python -m benchmarks.fake_notion <page_id> fixtures/page.json
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import random
+from typing import Any, Dict, List, Optional
+import httpx
+from notion_client import AsyncClient
+from notion_client.errors import APIErrorCode, APIResponseError
+
+PAGE_SIZE = 100
+
+_WORDS = ["노션", "문서", "검색", "임베딩", "chunk", "vector", "query", "page"]
+_TEXT_BLOCK_TYPES = ["paragraph"] * 6 + ["bulleted_list_item", "numbered_list_item"]
+
+
+def _api_error(status_code: int, code: APIErrorCode, message: str, **headers):
+    response = httpx.Response(
+        status_code,
+        headers=headers,
+        text=message,
+        request=httpx.Request("GET", "https://api.notion.com/v1/fake"),
+    )
+    return APIResponseError(response, message, code)
+
+
+def _rich_text(text: str) -> List[Dict[str, Any]]:
+    return [{"type": "text", "plain_text": text}]
+
+
+class _Endpoint:
+    def __init__(self, client: "FakeNotionClient"):
+        self.client = client
+
+
+class _ChildrenEndpoint(_Endpoint):
+    async def list(
+        self,
+        block_id: str,
+        start_cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        await self.client._before_request("blocks.children.list")
+        if block_id not in self.client.children:
+            raise _api_error(
+                404, APIErrorCode.ObjectNotFound, f"Could not find block {block_id}"
+            )
+        children = self.client.children[block_id]
+        start = int(start_cursor or 0)
+        end = start + min(page_size, PAGE_SIZE)
+        has_more = end < len(children)
+        return {
+            "object": "list",
+            "results": children[start:end],
+            "next_cursor": str(end) if has_more else None,
+            "has_more": has_more,
+        }
+
+
+class _BlocksEndpoint(_Endpoint):
+    def __init__(self, client: "FakeNotionClient"):
+        super().__init__(client)
+        self.children = _ChildrenEndpoint(client)
+
+
+class _PagesEndpoint(_Endpoint):
+    async def retrieve(self, page_id: str) -> Dict[str, Any]:
+        await self.client._before_request("pages.retrieve")
+        if page_id not in self.client.page_data:
+            raise _api_error(
+                404, APIErrorCode.ObjectNotFound, f"Could not find page {page_id}"
+            )
+        return self.client.page_data[page_id]
+
+
+class FakeNotionClient:
+    """
+    메모리에 저장된 페이지/블록으로 Notion API 응답을 흉내내는 클라이언트.
+
+    Args:
+        page_data: page_id -> `pages.retrieve` 응답
+        children: block_id(페이지 포함) -> 자식 블록 목록 (커서 페이지네이션은 자동 처리)
+        latency: 요청마다 대기하는 시간(초)
+        jitter: `latency`에 더해지는 0 ~ `jitter`초의 무작위 지연
+        rate_limit_ratio: 429 응답을 반환할 확률 (0 ~ 1)
+        retry_after: 429 응답의 `retry-after` 헤더 값(초)
+    """
+
+    def __init__(
+        self,
+        page_data: Dict[str, Dict[str, Any]],
+        children: Dict[str, List[Dict[str, Any]]],
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit_ratio: float = 0.0,
+        retry_after: float = 0.0,
+        seed: int = 0,
+    ):
+        self.page_data = page_data
+        self.children = children
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        # API별 요청 수 (429 응답 포함)
+        self.requests: Dict[str, int] = {}
+        self.rate_limited = 0
+
+        self.blocks = _BlocksEndpoint(self)
+        self.pages = _PagesEndpoint(self)
+
+    @classmethod
+    def from_fixture(cls, path: str, **kwargs) -> "FakeNotionClient":
+        """`record`로 녹화한 JSON fixture를 재생하는 클라이언트 생성."""
+        with open(path, encoding="utf-8") as f:
+            fixture = json.load(f)
+        return cls(page_data=fixture["pages"], children=fixture["children"], **kwargs)
+
+    @classmethod
+    def synthetic(
+        cls,
+        pages: int,
+        depth: int,
+        blocks_per_page: int = 40,
+        fanout: int = 4,
+        seed: int = 0,
+        root_page_id: str = "root",
+        **kwargs,
+    ) -> "FakeNotionClient":
+        """
+        `root_page_id`를 루트로 최대 `depth` 단계, 총 `pages`개의 하위 페이지 트리를 생성.
+        각 페이지는 heading으로 나뉜 섹션, 목록, 자식을 가진 toggle 블록으로 구성됨.
+        """
+        rnd = random.Random(seed)
+        page_data: Dict[str, Dict[str, Any]] = {}
+        children: Dict[str, List[Dict[str, Any]]] = {}
+        base_time = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+        block_count = 0
+
+        def sentence() -> str:
+            return " ".join(rnd.choice(_WORDS) for _ in range(rnd.randint(5, 60)))
+
+        def block(
+            block_type: str, text: str, parent: Dict[str, str], has_children=False
+        ) -> Dict[str, Any]:
+            nonlocal block_count
+            block_count += 1
+            return {
+                "object": "block",
+                "id": f"block-{block_count}",
+                "type": block_type,
+                "parent": parent,
+                "has_children": has_children,
+                block_type: {"rich_text": _rich_text(text)},
+            }
+
+        def add_page(page_id: str, title: str, parent: Dict[str, str]) -> None:
+            edited = base_time + datetime.timedelta(minutes=len(page_data))
+            page_data[page_id] = {
+                "object": "page",
+                "id": page_id,
+                "parent": parent,
+                "last_edited_time": edited.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "properties": {
+                    "title": {
+                        "id": "title",
+                        "type": "title",
+                        "title": _rich_text(title),
+                    }
+                },
+            }
+            page_parent = {"type": "page_id", "page_id": page_id}
+            page_blocks = []
+            for i in range(blocks_per_page):
+                if i % 10 == 0:
+                    level = 1 if i == 0 else rnd.choice([2, 3])
+                    page_blocks.append(
+                        block(
+                            f"heading_{level}", f"{title} 섹션 {i // 10}", page_parent
+                        )
+                    )
+                elif i % 10 == 5:
+                    toggle = block("toggle", sentence(), page_parent, has_children=True)
+                    toggle_parent = {"type": "block_id", "block_id": toggle["id"]}
+                    children[toggle["id"]] = [
+                        block("paragraph", sentence(), toggle_parent) for _ in range(3)
+                    ]
+                    page_blocks.append(toggle)
+                else:
+                    page_blocks.append(
+                        block(rnd.choice(_TEXT_BLOCK_TYPES), sentence(), page_parent)
+                    )
+            children[page_id] = page_blocks
+
+        add_page(root_page_id, "root", {"type": "workspace", "workspace": True})
+        # 너비 우선으로 depth 제한 안에서 하위 페이지 생성
+        frontier = [(root_page_id, 0)]
+        created = 0
+        while frontier and created < pages:
+            parent_id, level = frontier.pop(0)
+            if level >= depth:
+                continue
+            for _ in range(fanout):
+                if created >= pages:
+                    break
+                created += 1
+                page_id = f"page-{created}"
+                title = f"page {created}"
+                add_page(page_id, title, {"type": "page_id", "page_id": parent_id})
+                children[parent_id].append(
+                    {
+                        "object": "block",
+                        "id": page_id,
+                        "type": "child_page",
+                        "parent": {"type": "page_id", "page_id": parent_id},
+                        "has_children": True,
+                        "child_page": {"title": title},
+                    }
+                )
+                frontier.append((page_id, level + 1))
+
+        return cls(page_data=page_data, children=children, seed=seed, **kwargs)
+
+    async def _before_request(self, api: str) -> None:
+        self.requests[api] = self.requests.get(api, 0) + 1
+        delay = self.latency + (
+            self.random.uniform(0, self.jitter) if self.jitter else 0
+        )
+        if delay:
+            await asyncio.sleep(delay)
+        if self.rate_limit_ratio and self.random.random() < self.rate_limit_ratio:
+            self.rate_limited += 1
+            raise _api_error(
+                429,
+                APIErrorCode.RateLimited,
+                "Rate limited",
+                **{"retry-after": str(self.retry_after)},
+            )
+
+    async def search(
+        self,
+        filter: Optional[Dict[str, Any]] = None,
+        sort: Optional[Dict[str, Any]] = None,
+        start_cursor: Optional[str] = None,
+        page_size: int = PAGE_SIZE,
+    ) -> Dict[str, Any]:
+        """페이지를 최근 수정 순으로 반환 (`get_edited_pages` 용도)."""
+        await self._before_request("search")
+        results = sorted(
+            self.page_data.values(),
+            key=lambda page: page["last_edited_time"],
+            reverse=not sort or sort.get("direction") == "descending",
+        )
+        start = int(start_cursor or 0)
+        end = start + min(page_size, PAGE_SIZE)
+        has_more = end < len(results)
+        return {
+            "object": "list",
+            "results": results[start:end],
+            "next_cursor": str(end) if has_more else None,
+            "has_more": has_more,
+        }
+
+    @property
+    def block_count(self) -> int:
+        return sum(len(blocks) for blocks in self.children.values())
+
+
+async def record(notion: AsyncClient, page_id: str, path: str) -> None:
+    """
+    실제 Notion API로 `page_id` 하위 페이지/블록 트리 전체를 조회해서 fixture로 저장.
+    하위 페이지까지 순차적으로 조회하므로 Notion 요청 제한(초당 3회)을 넘지 않도록 대기함.
+    """
+    pages: Dict[str, Dict[str, Any]] = {}
+    children: Dict[str, List[Dict[str, Any]]] = {}
+
+    async def call(func, **kwargs) -> Dict[str, Any]:
+        while True:
+            try:
+                return await func(**kwargs)
+            except APIResponseError as e:
+                if e.code != APIErrorCode.RateLimited:
+                    raise
+                await asyncio.sleep(float(e.headers.get("retry-after", 1)))
+
+    pages[page_id] = await call(notion.pages.retrieve, page_id=page_id)
+    stack = [page_id]
+    while stack:
+        block_id = stack.pop()
+        blocks, cursor = [], None
+        while True:
+            response = await call(
+                notion.blocks.children.list,
+                block_id=block_id,
+                **({"start_cursor": cursor} if cursor else {}),
+            )
+            blocks.extend(response.get("results", []))
+            cursor = response.get("next_cursor")
+            if not cursor:
+                break
+        children[block_id] = blocks
+
+        for block in blocks:
+            if block.get("type") == "child_page":
+                pages[block["id"]] = await call(
+                    notion.pages.retrieve, page_id=block["id"]
+                )
+            if block.get("has_children"):
+                stack.append(block["id"])
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"pages": pages, "children": children}, f, ensure_ascii=False)
+    print(f"recorded {len(pages)} pages, {sum(map(len, children.values()))} blocks")
+
+
+if __name__ == "__main__":
+    from core.config import settings
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("page_id")
+    parser.add_argument("path")
+    args = parser.parse_args()
+    asyncio.run(
+        record(AsyncClient(auth=settings.NOTION_API_KEY), args.page_id, args.path)
+    )
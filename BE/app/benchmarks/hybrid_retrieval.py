@@ -0,0 +1,106 @@
+"""
+dense 검색과 하이브리드(dense + BM25, RRF) 검색의 recall@k와 지연을 비교하는 벤치마크.
+운영 컬렉션에서 청크를 뽑아 각 청크의 식별자성 단어(숫자/대문자/밑줄을 포함하거나 긴 단어)로
+정확한 용어 질의를 만들고, 원래 청크의 페이지가 상위 k개 결과에 포함되는지로 recall을 계산함.
+컬렉션에 sparse 벡터가 있어야 함 (없으면 `scripts.migrate_embedding_dimension`으로 새 컬렉션 생성).
+
+실행 (BE/app 디렉토리에서):
+    python -m benchmarks.hybrid_retrieval --queries 100 --k 5
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import time
+from schemas.schemas import DocumentMetadata
+from services.gemini import GeminiService
+from services.qdrant_service import QdrantService
+from utils.bm25 import query_sparse_embedding
+
+_TERM_PATTERN = re.compile(r"\w+")
+
+
+def exact_term(content: str) -> str | None:
+    """청크에서 고유명사/코드명처럼 보이는 단어 하나 (없으면 가장 긴 단어)."""
+    words = [word for word in _TERM_PATTERN.findall(content) if len(word) >= 4]
+    if not words:
+        return None
+    identifiers = [
+        word
+        for word in words
+        if any(char.isdigit() or char.isupper() or char == "_" for char in word)
+    ]
+    return max(identifiers or words, key=len)
+
+
+async def load_queries(
+    qdrant: QdrantService, limit: int, seed: int
+) -> list[tuple[str, str]]:
+    """(질의 단어, 정답 page_id) 목록."""
+    records, _ = await qdrant.client.scroll(
+        collection_name=qdrant.collection_name,
+        limit=limit * 5,
+        with_payload=True,
+        with_vectors=False,
+    )
+    queries = []
+    for record in random.Random(seed).sample(records, len(records)):
+        term = exact_term(record.payload.get("content") or "")
+        if term:
+            queries.append((term, record.payload.get("page_id")))
+        if len(queries) == limit:
+            break
+    return queries
+
+
+async def search(
+    qdrant: QdrantService,
+    queries: list[tuple[str, str]],
+    embeddings: list[list[float]],
+    k: int,
+    hybrid: bool,
+) -> tuple[float, list[float]]:
+    """recall@k와 질의별 지연(초) 반환."""
+    hits, latencies = 0, []
+    for (term, page_id), embedding in zip(queries, embeddings):
+        start = time.perf_counter()
+        results = await qdrant.query_document(
+            embedding=embedding,
+            metadata=DocumentMetadata(),
+            limit=k,
+            sparse_embedding=query_sparse_embedding(term) if hybrid else None,
+        )
+        latencies.append(time.perf_counter() - start)
+        hits += any(result.metadata.page_id == page_id for result in results)
+    return hits / len(queries), sorted(latencies)
+
+
+async def main(args: argparse.Namespace) -> None:
+    qdrant = QdrantService()
+    if not await qdrant.has_sparse_vectors():
+        raise SystemExit(f"{qdrant.collection_name} has no sparse vectors")
+
+    queries = await load_queries(qdrant, args.queries, args.seed)
+    if not queries:
+        raise SystemExit(f"{qdrant.collection_name} has no usable chunks")
+    embeddings = await GeminiService().generate_embeddings(
+        contents=[term for term, _ in queries], task="RETRIEVAL_QUERY"
+    )
+    print(f"queries={len(queries)}, k={args.k}, collection={qdrant.collection_name}")
+
+    for name, hybrid in (("dense", False), ("hybrid (RRF)", True)):
+        recall, latencies = await search(qdrant, queries, embeddings, args.k, hybrid)
+        print(
+            f"{name:12s}: recall@{args.k} {recall:.3f}, "
+            f"p50 {latencies[len(latencies) // 2] * 1000:7.2f}ms, "
+            f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,109 @@
+"""
+Notion API 없이 NotionDataLoader의 크롤링 + 청킹 처리량을 측정하는 벤치마크.
+FakeNotionClient(합성 페이지 트리 또는 녹화한 fixture)를 주입해서 페이지/초, 청크/초,
+요청 수, 429 재시도 수, 최대 메모리 사용량(peak RSS)을 출력.
+임베딩/업로드는 외부 API 비용이 크므로 측정에서 제외.
+
+실행 (BE/app 디렉토리에서):
+    python -m benchmarks.ingestion_throughput --pages 200 --depth 3 --latency 0.05
+    python -m benchmarks.ingestion_throughput --fixture fixtures/page.json --root <page_id>
+"""
+
+import argparse
+import asyncio
+import resource
+import sys
+import time
+from core.config import settings
+from db.models import ChunkStrategy
+from utils import chunking, data_loader
+from utils.rate_limiter import TokenBucketRateLimiter
+from benchmarks.fake_notion import FakeNotionClient
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS (MB). 청킹 프로세스 풀 워커는 포함하지 않음."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def make_client(args: argparse.Namespace) -> FakeNotionClient:
+    options = dict(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_ratio=args.rate_limit_ratio,
+        retry_after=args.retry_after,
+    )
+    if args.fixture:
+        return FakeNotionClient.from_fixture(args.fixture, **options)
+    return FakeNotionClient.synthetic(
+        pages=args.pages,
+        depth=args.depth,
+        blocks_per_page=args.blocks,
+        fanout=args.fanout,
+        root_page_id=args.root,
+        **options,
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    settings.NOTION_CONCURRENT_CRAWL = not args.sequential
+    settings.NOTION_CRAWL_CONCURRENCY = args.concurrency
+    settings.CHUNKING_WORKERS = args.workers
+    # 실제 Notion 요청 제한(초당 3회) 대신 벤치마크용 제한 사용
+    data_loader.notion_rate_limiter = TokenBucketRateLimiter(
+        rate=args.rps, capacity=max(1, args.rps)
+    )
+
+    notion = make_client(args)
+    loader = data_loader.NotionDataLoader(notion=notion)
+    print(
+        f"pages={len(notion.page_data)}, blocks={notion.block_count:,}, "
+        f"crawl={'sequential' if args.sequential else f'concurrent({args.concurrency})'}, "
+        f"chunking={args.chunk_strategy.value}"
+    )
+
+    start = time.perf_counter()
+    documents = await loader.get_documents(
+        page_id=args.root,
+        recursive_page=True,
+        chunk_strategy=args.chunk_strategy,
+    )
+    elapsed = time.perf_counter() - start
+    chunking.shutdown_chunking_executor()
+
+    page_count = len({document.page_id for document in documents})
+    print(f"elapsed   : {elapsed:8.3f}s")
+    print(f"pages/sec : {page_count / elapsed:8.1f} ({page_count} pages)")
+    print(f"chunks/sec: {len(documents) / elapsed:8.1f} ({len(documents)} chunks)")
+    print(f"requests  : {sum(notion.requests.values())} {notion.requests}")
+    print(f"429 retry : {notion.rate_limited}")
+    print(f"peak RSS  : {peak_rss_mb():8.1f}MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--fixture", help="녹화한 fixture 경로 (없으면 합성 페이지 트리)"
+    )
+    parser.add_argument("--root", default="root", help="수집을 시작할 페이지 ID")
+    parser.add_argument("--pages", type=int, default=200, help="합성 하위 페이지 수")
+    parser.add_argument("--depth", type=int, default=3, help="합성 페이지 트리 깊이")
+    parser.add_argument("--fanout", type=int, default=4)
+    parser.add_argument("--blocks", type=int, default=40, help="페이지당 블록 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="요청당 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.1)
+    parser.add_argument("--rps", type=float, default=100.0, help="초당 요청 수 제한")
+    parser.add_argument("--sequential", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=0, help="청킹 프로세스 수")
+    parser.add_argument(
+        "--chunk-strategy",
+        type=ChunkStrategy,
+        choices=list(ChunkStrategy),
+        default=ChunkStrategy.CHARACTER,
+    )
+    asyncio.run(main(parser.parse_args()))
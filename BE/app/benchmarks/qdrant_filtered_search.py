@@ -0,0 +1,113 @@
+"""
+사용자 그룹(ACL) 필터를 적용한 검색의 지연 시간을 payload 인덱스 유무에 따라 비교하는 벤치마크.
+임시 컬렉션에 여러 사용자 그룹에 속한 무작위 벡터를 업로드하고,
+채팅 질의와 같은 경로(`QdrantService.query_document`)로 검색함.
+
+실행 (BE/app 디렉토리에서):
+    python -m benchmarks.qdrant_filtered_search --points 1000000 --groups 40 --dimension 256
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from qdrant_client import models
+from core.config import settings
+from schemas.schemas import DocumentInput, DocumentMetadata
+from services.qdrant_service import QdrantService
+
+UPLOAD_CHUNK_SIZE = 10_000
+
+
+def random_vector(rnd: random.Random, dimension: int) -> list[float]:
+    return [rnd.uniform(-1, 1) for _ in range(dimension)]
+
+
+async def upload(
+    qdrant: QdrantService, points: int, groups: list[str], dimension: int
+) -> None:
+    rnd = random.Random(0)
+    for start in range(0, points, UPLOAD_CHUNK_SIZE):
+        await qdrant.upsert_document(
+            [
+                DocumentInput(
+                    id=str(uuid.UUID(int=rnd.getrandbits(128))),
+                    embedding=random_vector(rnd, dimension),
+                    metadata=DocumentMetadata(
+                        content=f"chunk {i}",
+                        datasource="notion",
+                        page_id=f"page-{i // 50}",
+                        updated_at="2025-01-01T00:00:00.000Z",
+                        user_groups=rnd.sample(groups, rnd.randint(1, 3)),
+                    ),
+                )
+                for i in range(start, min(start + UPLOAD_CHUNK_SIZE, points))
+            ],
+            wait=False,
+        )
+        print(f"uploaded {min(start + UPLOAD_CHUNK_SIZE, points)} points", end="\r")
+    await qdrant.wait_for_upserts()
+    print()
+
+
+async def measure(
+    qdrant: QdrantService, queries: int, groups: list[str], dimension: int
+) -> list[float]:
+    """사용자 그룹 1~2개로 필터링한 검색의 지연(초) 목록 반환."""
+    rnd = random.Random(1)
+    latencies = []
+    for _ in range(queries):
+        metadata = DocumentMetadata(
+            datasource="notion", user_groups=rnd.sample(groups, rnd.randint(1, 2))
+        )
+        start = time.perf_counter()
+        await qdrant.query_document(
+            embedding=random_vector(rnd, dimension), metadata=metadata
+        )
+        latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+
+def report(name: str, latencies: list[float]) -> None:
+    print(
+        f"{name:12s}: p50 {latencies[len(latencies) // 2] * 1000:8.2f}ms, "
+        f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:8.2f}ms, "
+        f"max {latencies[-1] * 1000:8.2f}ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    qdrant = QdrantService()
+    qdrant.collection_name = f"{settings.QDRANT_COLLECTION_NAME}_filter_benchmark"
+    qdrant.vector_size = args.dimension
+    groups = [str(uuid.UUID(int=i)) for i in range(args.groups)]
+    print(
+        f"points={args.points}, groups={args.groups}, dimension={args.dimension}, "
+        f"queries={args.queries}"
+    )
+
+    try:
+        await qdrant.client.delete_collection(qdrant.collection_name)
+        await qdrant.client.create_collection(
+            collection_name=qdrant.collection_name,
+            vectors_config=models.VectorParams(
+                size=args.dimension, distance=qdrant.distance_metric
+            ),
+        )
+        await upload(qdrant, args.points, groups, args.dimension)
+        report("no index", await measure(qdrant, args.queries, groups, args.dimension))
+
+        await qdrant.ensure_payload_indexes()
+        report("indexed", await measure(qdrant, args.queries, groups, args.dimension))
+    finally:
+        await qdrant.client.delete_collection(qdrant.collection_name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--groups", type=int, default=40)
+    parser.add_argument("--dimension", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
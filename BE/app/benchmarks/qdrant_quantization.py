@@ -0,0 +1,142 @@
+"""
+Qdrant 저장 설정(양자화, 원본 벡터 디스크 저장, rescore/oversampling)별 recall@k와 검색 지연을 측정하는 벤치마크.
+운영 컬렉션에서 청크 벡터를 읽어 설정별 임시 컬렉션에 업로드하고,
+일부 청크 벡터를 질의로 사용해 정확 검색(exact) 결과 대비 recall@k를 계산함.
+
+실행 (BE/app 디렉토리에서):
+    python -m benchmarks.qdrant_quantization --limit 20000 --queries 200 --k 10
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from qdrant_client import models
+from core.config import settings
+from schemas.schemas import DocumentInput, DocumentMetadata
+from services.qdrant_service import QdrantService
+
+# (이름, 양자화, 원본 벡터 디스크 저장, rescore, oversampling)
+MODES = [
+    ("float32", "none", False, True, None),
+    ("float32 on-disk", "none", True, True, None),
+    ("scalar", "scalar", False, False, None),
+    ("scalar on-disk + rescore", "scalar", True, True, 2.0),
+    ("binary", "binary", False, False, None),
+    ("binary on-disk + rescore", "binary", True, True, 3.0),
+]
+
+
+async def load_corpus(qdrant: QdrantService, limit: int) -> list[DocumentInput]:
+    documents, offset = [], None
+    while len(documents) < limit:
+        records, offset = await qdrant.client.scroll(
+            collection_name=qdrant.collection_name,
+            limit=min(1000, limit - len(documents)),
+            offset=offset,
+            with_payload=True,
+            with_vectors=True,
+        )
+        documents.extend(
+            DocumentInput(
+                id=str(record.id),
+                embedding=QdrantService.dense_vector(record.vector),
+                metadata=DocumentMetadata(**record.payload),
+            )
+            for record in records
+        )
+        if offset is None:
+            break
+    return documents
+
+
+async def wait_until_indexed(qdrant: QdrantService) -> None:
+    while True:
+        info = await qdrant.client.get_collection(qdrant.collection_name)
+        if info.status == models.CollectionStatus.GREEN:
+            return
+        await asyncio.sleep(1)
+
+
+async def search(
+    qdrant: QdrantService,
+    queries: list[list[float]],
+    k: int,
+    search_params: models.SearchParams | None,
+) -> tuple[list[set[str]], list[float]]:
+    """질의별 상위 k개 point ID와 지연(초) 반환."""
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        response = await qdrant.client.query_points(
+            collection_name=qdrant.collection_name,
+            query=query,
+            limit=k,
+            search_params=search_params,
+        )
+        latencies.append(time.perf_counter() - start)
+        results.append({str(point.id) for point in response.points})
+    return results, latencies
+
+
+async def main(args: argparse.Namespace) -> None:
+    source = QdrantService()
+    documents = await load_corpus(source, args.limit)
+    queries = [
+        document.embedding
+        for document in random.Random(0).sample(
+            documents, min(args.queries, len(documents))
+        )
+    ]
+    print(
+        f"corpus={len(documents)} points from {source.collection_name}, "
+        f"queries={len(queries)}, k={args.k}"
+    )
+
+    truth = None
+    for name, quantization, on_disk, rescore, oversampling in MODES:
+        qdrant = QdrantService()
+        qdrant.collection_name = (
+            f"{settings.QDRANT_COLLECTION_NAME}_quantization_benchmark"
+        )
+        qdrant.vector_size = len(documents[0].embedding)
+        qdrant.quantization = quantization
+        qdrant.vectors_on_disk = on_disk
+        qdrant.search_rescore = rescore
+        qdrant.search_oversampling = oversampling
+        try:
+            await qdrant.client.delete_collection(qdrant.collection_name)
+            await qdrant.get_or_create_collection()
+            await qdrant.upsert_document(documents)
+            await wait_until_indexed(qdrant)
+
+            if truth is None:
+                truth, _ = await search(
+                    qdrant, queries, args.k, models.SearchParams(exact=True)
+                )
+            results, latencies = await search(
+                qdrant, queries, args.k, qdrant._search_params()
+            )
+        finally:
+            await qdrant.client.delete_collection(qdrant.collection_name)
+
+        recall = statistics.mean(
+            len(result & expected) / len(expected)
+            for result, expected in zip(results, truth)
+            if expected
+        )
+        latencies.sort()
+        print(
+            f"{name:26s}: recall@{args.k} {recall:.3f}, "
+            f"p50 {latencies[len(latencies) // 2] * 1000:7.2f}ms, "
+            f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=int, default=20000, help="사용할 청크 수")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,75 @@
+"""
+Qdrant 업로드 배치 크기/동시 요청 수/wait 설정별 처리량(points/sec)을 측정하는 벤치마크.
+설정된 Qdrant 서버에 임시 컬렉션을 만들어 무작위 벡터를 업로드한 뒤 삭제함.
+
+실행 (BE/app 디렉토리에서):
+    python -m benchmarks.qdrant_upsert --points 20000 --batch-sizes 64,256,1024 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from core.config import settings
+from schemas.schemas import DocumentInput, DocumentMetadata
+from services.qdrant_service import QdrantService
+
+
+def make_documents(count: int, dimension: int, seed: int = 0) -> list[DocumentInput]:
+    rnd = random.Random(seed)
+    return [
+        DocumentInput(
+            id=str(uuid.UUID(int=rnd.getrandbits(128))),
+            embedding=[rnd.uniform(-1, 1) for _ in range(dimension)],
+            metadata=DocumentMetadata(
+                content=f"chunk {i}", datasource="notion", page_id=f"page-{i // 20}"
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+async def measure(
+    qdrant: QdrantService, documents: list[DocumentInput], wait: bool
+) -> float:
+    """업로드(및 `wait=False`일 때 반영 확인)에 걸린 시간(초) 반환."""
+    await qdrant.client.delete_collection(qdrant.collection_name)
+    await qdrant.get_or_create_collection()
+    start = time.perf_counter()
+    await qdrant.upsert_document(documents, wait=wait)
+    await qdrant.wait_for_upserts()
+    return time.perf_counter() - start
+
+
+async def main(args: argparse.Namespace) -> None:
+    qdrant = QdrantService()
+    qdrant.collection_name = f"{settings.QDRANT_COLLECTION_NAME}_upsert_benchmark"
+    qdrant.vector_size = args.dimension
+    qdrant.upsert_concurrency = args.concurrency
+    documents = make_documents(args.points, args.dimension)
+    print(
+        f"points={args.points}, dimension={args.dimension}, "
+        f"concurrency={args.concurrency}, server={qdrant.url}"
+    )
+
+    try:
+        for batch_size in map(int, args.batch_sizes.split(",")):
+            qdrant.upsert_batch_size = batch_size
+            for wait in (True, False):
+                elapsed = await measure(qdrant, documents, wait)
+                print(
+                    f"batch_size={batch_size:5d}, wait={str(wait):5s}: "
+                    f"{elapsed:7.3f}s, {args.points / elapsed:9.1f} points/sec"
+                )
+    finally:
+        await qdrant.client.delete_collection(qdrant.collection_name)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--dimension", type=int, default=settings.VECTOR_SIZE)
+    parser.add_argument("--batch-sizes", default="64,256,1024")
+    parser.add_argument("--concurrency", type=int, default=4)
+    asyncio.run(main(parser.parse_args()))
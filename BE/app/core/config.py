@@ -25,8 +25,138 @@ class Settings(BaseSettings):
 
     QDRANT_SERVER: Optional[str] = "http://localhost:6333"
     QDRANT_COLLECTION_NAME: Optional[str] = "test_collection"
+    # 임베딩 차원. 3072보다 작으면 앞쪽 차원만 남기고 다시 정규화 (Matryoshka truncation)
+    # 변경 시 `python -m scripts.migrate_embedding_dimension`으로 새 컬렉션에 다시 저장
     VECTOR_SIZE: Optional[int] = 3072
     DISTANCE_METRIC: Literal["DOT", "COSINE", "EUCLID", "MANHATTAN"] = "COSINE"
+    # Qdrant 컬렉션 저장 설정 (시작 시 기존 컬렉션에도 반영)
+    # none: float32 원본 벡터만 사용 / scalar: int8 양자화 / binary: 1bit 양자화
+    QDRANT_QUANTIZATION: Literal["none", "scalar", "binary"] = "none"
+    QDRANT_QUANTIZATION_ALWAYS_RAM: bool = True
+    # True이면 원본 벡터를 디스크에 저장 (양자화 벡터만 메모리에 유지)
+    QDRANT_VECTORS_ON_DISK: bool = False
+    # None이면 Qdrant 기본값 사용
+    QDRANT_HNSW_M: Optional[int] = None
+    QDRANT_HNSW_EF_CONSTRUCT: Optional[int] = None
+    QDRANT_HNSW_ON_DISK: bool = False
+    # Qdrant 검색 설정 (양자화 사용 시 oversampling 배수만큼 후보를 뽑아 원본 벡터로 재정렬)
+    QDRANT_SEARCH_HNSW_EF: Optional[int] = None
+    QDRANT_SEARCH_RESCORE: bool = True
+    QDRANT_SEARCH_OVERSAMPLING: Optional[float] = None
+
+    # 검색 설정 (반환할 청크 수 / 최소 유사도 점수, None이면 제한 없음)
+    RETRIEVAL_TOP_K: int = 10
+    RETRIEVAL_SCORE_THRESHOLD: Optional[float] = None
+    # MMR 다양화: 후보 RETRIEVAL_MMR_FETCH_K개 중 질의 유사도와 다양성을 함께 고려해 TOP_K개 선택
+    # (lambda가 1이면 질의 유사도만, 0이면 다양성만 고려)
+    RETRIEVAL_MMR_ENABLED: bool = False
+    RETRIEVAL_MMR_FETCH_K: int = 20
+    RETRIEVAL_MMR_LAMBDA: float = 0.7
+
+    # 답변 생성 전 로컬 reranker로 컨텍스트를 다시 정렬하고 상위 TOP_N개를 유지
+    # (토큰 예산은 답변 프롬프트 생성 시 PROMPT_MAX_TOKENS 기준으로 한 번에 배분)
+    # (bm25: 후보 집합 기준 BM25 / cross_encoder: RERANK_MODEL_PATH의 로컬 CrossEncoder 모델)
+    RERANK_ENABLED: bool = False
+    RERANKER: Literal["bm25", "cross_encoder"] = "bm25"
+    RERANK_MODEL_PATH: Optional[str] = None
+    RERANK_TOP_N: int = 5
+
+    # 답변 프롬프트 전체 토큰 예산 (시스템 프롬프트 + 질문 + 대화 내역 + 컨텍스트)
+    # 예산을 넘으면 대화 내역을 오래된 순으로 HISTORY_MIN까지 줄인 뒤, 순위가 낮은 컨텍스트부터 제외.
+    # 컨텍스트가 쓰지 않은 예산은 HISTORY_MAX를 넘더라도 대화 내역에 배분
+    PROMPT_MAX_TOKENS: int = 8000
+    PROMPT_HISTORY_MAX_TOKENS: int = 2000
+    PROMPT_HISTORY_MIN_TOKENS: int = 500
+
+    # 하이브리드 검색: dense 검색과 BM25 sparse 검색 결과를 Qdrant에서 RRF로 결합
+    # (채팅 요청마다 켜고 끌 수 있음, 각 검색은 후보 HYBRID_PREFETCH_K개를 가져옴)
+    HYBRID_SEARCH_ENABLED: bool = False
+    HYBRID_PREFETCH_K: int = 50
+    # BM25 파라미터 (평균 청크 길이는 bm25.tokenize 기준 토큰 수)
+    BM25_K1: float = 1.2
+    BM25_B: float = 0.75
+    BM25_AVG_DOC_TOKENS: int = 200
+
+    # Qdrant 업로드 설정 (요청 1회당 최대 point 수 / 동시 요청 수 / 배치별 재시도 횟수)
+    QDRANT_UPSERT_BATCH_SIZE: int = 256
+    QDRANT_UPSERT_CONCURRENCY: int = 4
+    QDRANT_UPSERT_MAX_RETRIES: int = 3
+    # False이면 인덱싱 완료를 기다리지 않고, 수집이 끝날 때 한 번만 반영 완료를 확인
+    QDRANT_UPSERT_WAIT: bool = True
+
+    # Notion 크롤링 설정 (Notion API 평균 허용량: 초당 3회)
+    NOTION_CONCURRENT_CRAWL: bool = True
+    NOTION_CRAWL_CONCURRENCY: int = 8
+    # 동시에 탐색(블록 조회 ~ 청킹 큐 전달)할 수 있는 최대 페이지 수
+    NOTION_CRAWL_MAX_ACTIVE_PAGES: int = 4
+    NOTION_REQUESTS_PER_SECOND: float = 3.0
+    NOTION_RATE_LIMIT_BURST: int = 3
+
+    # 임베딩 provider (gemini: Gemini API / sentence_transformers: 로컬 모델 / hashing: 테스트용)
+    EMBEDDING_PROVIDER: Literal["gemini", "sentence_transformers", "hashing"] = "gemini"
+    EMBEDDING_LOCAL_MODEL_PATH: Optional[str] = None
+    EMBEDDING_LOCAL_THREADS: int = 2
+    EMBEDDING_LOCAL_BATCH_SIZE: int = 32
+    EMBEDDING_LOCAL_QUERY_PREFIX: str = ""
+    EMBEDDING_LOCAL_DOCUMENT_PREFIX: str = ""
+
+    # 임베딩 배치 설정 (embed_content 1회 호출당 최대 청크 수 / 동시 호출 수)
+    EMBEDDING_BATCH_SIZE: int = 100
+    EMBEDDING_MAX_CONCURRENCY: int = 4
+
+    # 임베딩 캐시 설정 (로컬 SQLite, 최대 항목 수 초과 시 LRU 삭제)
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str = ".cache/embedding_cache.sqlite3"
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 200_000
+
+    # 질의 임베딩 메모리 캐시 (LRU + TTL, 항목 수와 메모리 중 먼저 넘는 한도에서 삭제)
+    QUERY_EMBEDDING_CACHE_ENABLED: bool = True
+    QUERY_EMBEDDING_CACHE_MAX_ENTRIES: int = 10_000
+    QUERY_EMBEDDING_CACHE_MAX_MB: float = 64.0
+    QUERY_EMBEDDING_CACHE_TTL: float = 3600.0
+    # 메모리 캐시에 없으면 SQLite 임베딩 캐시를 조회 (같은 서버의 uvicorn 워커끼리 공유)
+    QUERY_EMBEDDING_CACHE_SHARED: bool = True
+
+    # 의미 기반 답변 캐시 (같은 사용자 그룹의 유사한 질문에 이전 답변을 재사용)
+    # 참고한 페이지가 답변 저장 이후 바뀌었으면 적중으로 보지 않음
+    ANSWER_CACHE_ENABLED: bool = False
+    ANSWER_CACHE_SIMILARITY_THRESHOLD: float = 0.95
+    ANSWER_CACHE_TTL: float = 86400.0
+    ANSWER_CACHE_MAX_ENTRIES: int = 10_000
+    # TTL/최대 항목 수를 넘은 답변을 정리하는 최소 간격(초). 그 사이에는 최대 항목 수를 잠시 넘을 수 있음
+    ANSWER_CACHE_EVICT_INTERVAL: float = 300.0
+
+    # 백그라운드 문서 수집 작업 워커 수
+    INGESTION_WORKER_CONCURRENCY: int = 2
+    # 크롤링된 페이지 중 청킹 대기 가능한 최대 페이지 수 (초과 시 크롤링 대기)
+    INGESTION_PAGE_QUEUE_SIZE: int = 16
+    # 작업 진행 상황을 DB에 기록하는 최소 간격(초)
+    INGESTION_PROGRESS_INTERVAL: float = 2.0
+    # 처리 중인 페이지의 lease 갱신 간격(초)과 만료 시간(초).
+    # 만료된 페이지만 다른 워커(프로세스)가 대기 상태로 되돌려 다시 처리함 (만료 시간 > 갱신 간격)
+    INGESTION_HEARTBEAT_INTERVAL: float = 15.0
+    INGESTION_LEASE_SECONDS: float = 90.0
+    # 업로드가 끝난 페이지를 체크포인트로 기록하여 중단된 작업 재개 시 다시 크롤링하지 않음
+    INGESTION_CHECKPOINT_ENABLED: bool = True
+
+    # 청킹 프로세스 풀 설정 (0이면 이벤트 루프 스레드에서 청킹)
+    CHUNKING_WORKERS: int = 2
+    CHUNKING_BATCH_PAGES: int = 8
+    # 이 글자 수 이하의 입력은 프로세스 풀을 거치지 않고 바로 청킹 (1 ~ 2ms 이내).
+    # 수집 파이프라인은 페이지(또는 큐에 쌓인 몇 페이지) 단위로 청킹하므로 한 페이지 크기 기준
+    CHUNKING_INLINE_MAX_CHARS: int = 20_000
+    # structure 청킹 전략의 청크 크기 (추정 토큰 수)
+    STRUCTURE_CHUNK_MAX_TOKENS: int = 512
+    STRUCTURE_CHUNK_MIN_TOKENS: int = 128
+    STRUCTURE_CHUNK_OVERLAP_TOKENS: int = 32
+
+    # 등록된 문서의 변경 감지 동기화 (활성화 시 동기화 상태가 있는 페이지는 질의마다 mcp로 최신성 검증을 하지 않음)
+    DOCUMENT_SYNC_ENABLED: bool = False
+    DOCUMENT_SYNC_INTERVAL: float = 300.0
+    # 여러 워커 프로세스 중 lease를 얻은 하나만 동기화를 실행 (lease 만료 시간(초), 동기화 간격보다 길게)
+    DOCUMENT_SYNC_LEASE_SECONDS: float = 600.0
+    # 동기화로 만든 수집 작업의 완료 여부 확인 간격(초)
+    DOCUMENT_SYNC_POLL_INTERVAL: float = 5.0
 
     INIT_USER_GROUP_NAME: str
     INIT_USER_GROUP_AUTHORITY_LEVEL: str
@@ -24,6 +24,8 @@ class ExceptionCase(Enum):
     DB_INIT_ERROR = (status.HTTP_500_INTERNAL_SERVER_ERROR, "6001")
     DB_OP_ERROR = (status.HTTP_500_INTERNAL_SERVER_ERROR, "6002")
 
+    JOB_NOT_FOUND = (status.HTTP_404_NOT_FOUND, "7001")
+
     VECTOR_DB_INIT_ERROR = (
         status.HTTP_500_INTERNAL_SERVER_ERROR,
         "8001",
@@ -4,7 +4,7 @@ DocumentTB 모델에 대한 데이터베이스 CRUD(Create, Read, Update, Delete
 
 from sqlmodel import select, and_
 from core.exception import CustomException, ExceptionCase
-from db.models import DocumentTB
+from db.models import ChunkStrategy, DocumentTB
 from db.database import AsyncSession
 
 
@@ -108,16 +108,21 @@ async def delete_document_info_by_page_id(
 
 
 async def update_document_info(
-    session: AsyncSession, datasource: str, page_id: str, user_groups: list[str]
+    session: AsyncSession,
+    datasource: str,
+    page_id: str,
+    user_groups: list[str],
+    chunk_strategy: ChunkStrategy | None = None,
 ):
     """
-    특정 문서 정보의 사용자 그룹을 수정합니다.
+    특정 문서 정보의 사용자 그룹(및 청킹 전략)을 수정합니다.
 
     Args:
         session (AsyncSession): 데이터베이스 세션.
         datasource (str): 수정할 문서의 데이터 소스.
         page_id (str): 수정할 문서의 페이지 ID.
         user_groups (list[str]): 새로 할당할 사용자 그룹 목록.
+        chunk_strategy (ChunkStrategy | None, optional): 새 청킹 전략. None이면 유지.
 
     Returns:
         DocumentTB: 수정된 문서 정보 객체.
@@ -129,6 +134,8 @@ async def update_document_info(
         result = await session.exec(statement)
         document = result.first()
         document.user_groups = user_groups
+        if chunk_strategy:
+            document.chunk_strategy = chunk_strategy
 
         session.add(document)
         await session.commit()
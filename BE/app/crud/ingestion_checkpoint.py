@@ -0,0 +1,93 @@
+"""
+IngestionCheckpoint 모델에 대한 데이터베이스 CRUD(Create, Read, Update, Delete) 작업을 정의합니다.
+"""
+
+from sqlmodel import select, delete, and_
+from core.exception import CustomException, ExceptionCase
+from db.models import IngestionCheckpoint
+from db.database import AsyncSession
+from schemas.schemas import PageCheckpoint
+
+
+async def get_ingestion_checkpoints(
+    session: AsyncSession, job_page_id: str
+) -> dict[str, PageCheckpoint]:
+    """
+    작업 페이지에서 업로드가 끝난 페이지들의 체크포인트를 조회합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job_page_id (str): 작업 페이지 ID.
+
+    Returns:
+        dict[str, PageCheckpoint]: 페이지 ID -> 체크포인트.
+    """
+    try:
+        statement = select(IngestionCheckpoint).where(
+            IngestionCheckpoint.job_page_id == job_page_id
+        )
+        result = await session.exec(statement)
+        return {
+            checkpoint.page_id: PageCheckpoint(**checkpoint.model_dump())
+            for checkpoint in result.all()
+        }
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def save_ingestion_checkpoint(
+    session: AsyncSession, job_page_id: str, checkpoint: PageCheckpoint
+):
+    """
+    페이지의 체크포인트를 생성하거나 수정합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job_page_id (str): 작업 페이지 ID.
+        checkpoint (PageCheckpoint): 업로드가 끝난 페이지 정보.
+
+    Returns:
+        IngestionCheckpoint: 저장된 체크포인트 객체.
+    """
+    try:
+        statement = select(IngestionCheckpoint).where(
+            and_(
+                IngestionCheckpoint.job_page_id == job_page_id,
+                IngestionCheckpoint.page_id == checkpoint.page_id,
+            )
+        )
+        result = await session.exec(statement)
+        row = result.first() or IngestionCheckpoint(
+            job_page_id=job_page_id, page_id=checkpoint.page_id
+        )
+        row.updated_at = checkpoint.updated_at
+        row.content_hash = checkpoint.content_hash
+        row.chunk_count = checkpoint.chunk_count
+        row.child_page_ids = checkpoint.child_page_ids
+        session.add(row)
+        await session.commit()
+        return row
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def delete_ingestion_checkpoints(session: AsyncSession, job_page_id: str):
+    """
+    작업 페이지의 체크포인트를 모두 삭제합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job_page_id (str): 작업 페이지 ID.
+
+    Returns:
+        bool: 성공 시 True.
+    """
+    try:
+        statement = delete(IngestionCheckpoint).where(
+            IngestionCheckpoint.job_page_id == job_page_id
+        )
+        await session.exec(statement)
+        await session.commit()
+        return True
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
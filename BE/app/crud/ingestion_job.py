@@ -0,0 +1,329 @@
+"""
+IngestionJob, IngestionJobPage 모델에 대한 데이터베이스 CRUD(Create, Read, Update, Delete) 작업을 정의합니다.
+"""
+
+import datetime
+from sqlmodel import select, update, and_, or_
+from core.exception import CustomException, ExceptionCase
+from db.models import IngestionJob, IngestionJobPage, JobStatus
+from db.database import AsyncSession
+
+
+async def create_ingestion_job(
+    session: AsyncSession, job: IngestionJob, pages: list[IngestionJobPage]
+):
+    """
+    수집 작업과 작업에 포함된 페이지들을 한 번에 생성합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job (IngestionJob): 생성할 작업 객체.
+        pages (list[IngestionJobPage]): 작업에 포함될 페이지 객체 목록.
+
+    Returns:
+        IngestionJob: 생성된 작업 객체.
+    """
+    try:
+        session.add(job)
+        for page in pages:
+            page.job_id = job.id
+            session.add(page)
+        await session.commit()
+        await session.refresh(job)
+        return job
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def get_ingestion_job(session: AsyncSession, job_id: str):
+    """
+    ID를 기준으로 수집 작업을 조회합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job_id (str): 조회할 작업의 ID.
+
+    Returns:
+        IngestionJob | None: 조회된 작업 객체 또는 None.
+    """
+    try:
+        statement = select(IngestionJob).where(IngestionJob.id == job_id)
+        result = await session.exec(statement)
+        return result.first()
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def get_ingestion_job_pages(session: AsyncSession, job_id: str):
+    """
+    특정 수집 작업에 포함된 페이지 목록을 조회합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job_id (str): 작업 ID.
+
+    Returns:
+        list[IngestionJobPage]: 작업 페이지 객체 목록.
+    """
+    try:
+        statement = select(IngestionJobPage).where(IngestionJobPage.job_id == job_id)
+        result = await session.exec(statement)
+        return result.all()
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def get_ingestion_job_page(session: AsyncSession, job_page_id: str):
+    """
+    ID를 기준으로 작업 페이지를 조회합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job_page_id (str): 조회할 작업 페이지의 ID.
+
+    Returns:
+        IngestionJobPage | None: 조회된 작업 페이지 객체 또는 None.
+    """
+    try:
+        statement = select(IngestionJobPage).where(IngestionJobPage.id == job_page_id)
+        result = await session.exec(statement)
+        return result.first()
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def get_pending_job_page_ids(session: AsyncSession) -> list[str]:
+    """
+    취소되지 않은 작업에서 처리 대기 중인 페이지 ID 목록을 조회합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+
+    Returns:
+        list[str]: 작업 페이지 ID 목록.
+    """
+    try:
+        statement = (
+            select(IngestionJobPage.id)
+            .join(IngestionJob)
+            .where(
+                and_(
+                    IngestionJobPage.status == JobStatus.PENDING,
+                    IngestionJob.status != JobStatus.CANCELLED,
+                )
+            )
+            .order_by(IngestionJob.created_date)
+        )
+        result = await session.exec(statement)
+        return result.all()
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def claim_ingestion_job_page(
+    session: AsyncSession, job_page_id: str, worker_id: str
+) -> bool:
+    """
+    대기 중인 작업 페이지를 처리 중 상태로 변경하고 처리하는 워커와 lease 시각을 기록합니다.
+    조건부 UPDATE를 사용하므로 여러 워커가 같은 페이지를 동시에 처리하지 않습니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job_page_id (str): 처리할 작업 페이지 ID.
+        worker_id (str): 페이지를 처리할 워커 ID.
+
+    Returns:
+        bool: 상태 변경에 성공하면 True.
+    """
+    try:
+        now = datetime.datetime.now(datetime.timezone.utc)
+        statement = (
+            update(IngestionJobPage)
+            .where(
+                and_(
+                    IngestionJobPage.id == job_page_id,
+                    IngestionJobPage.status == JobStatus.PENDING,
+                )
+            )
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=IngestionJobPage.attempts + 1,
+                error=None,
+                started_date=now,
+                finished_date=None,
+                worker_id=worker_id,
+                heartbeat_at=now,
+            )
+        )
+        result = await session.exec(statement)
+        await session.commit()
+        return result.rowcount == 1
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def heartbeat_ingestion_job_page(
+    session: AsyncSession, job_page_id: str, worker_id: str
+) -> bool:
+    """
+    처리 중인 작업 페이지의 lease를 갱신합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job_page_id (str): 작업 페이지 ID.
+        worker_id (str): 페이지를 처리 중인 워커 ID.
+
+    Returns:
+        bool: 아직 이 워커가 처리 중이면 True. lease가 만료되어 다른 워커가 가져갔으면 False.
+    """
+    try:
+        statement = (
+            update(IngestionJobPage)
+            .where(
+                and_(
+                    IngestionJobPage.id == job_page_id,
+                    IngestionJobPage.status == JobStatus.RUNNING,
+                    IngestionJobPage.worker_id == worker_id,
+                )
+            )
+            .values(heartbeat_at=datetime.datetime.now(datetime.timezone.utc))
+        )
+        result = await session.exec(statement)
+        await session.commit()
+        return result.rowcount == 1
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def reset_expired_job_pages(
+    session: AsyncSession, lease_seconds: float
+) -> list[str]:
+    """
+    lease가 만료된(처리하던 워커가 종료된) 처리 중 작업 페이지를 대기 상태로 되돌립니다.
+    다른 워커가 처리 중인 페이지는 lease를 계속 갱신하므로 되돌리지 않습니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        lease_seconds (float): lease 만료 시간(초).
+
+    Returns:
+        list[str]: 대기 상태로 되돌린 작업 페이지 ID 목록.
+    """
+    try:
+        expired_before = datetime.datetime.now(
+            datetime.timezone.utc
+        ) - datetime.timedelta(seconds=lease_seconds)
+        statement = select(IngestionJobPage).where(
+            and_(
+                IngestionJobPage.status == JobStatus.RUNNING,
+                or_(
+                    IngestionJobPage.heartbeat_at.is_(None),
+                    IngestionJobPage.heartbeat_at < expired_before,
+                ),
+            )
+        )
+        result = await session.exec(statement)
+        pages = result.all()
+        if not pages:
+            return []
+
+        # 조회와 변경 사이에 lease가 갱신된 페이지는 제외되도록 같은 조건으로 UPDATE
+        page_ids = [page.id for page in pages]
+        await session.exec(
+            update(IngestionJobPage)
+            .where(
+                and_(
+                    IngestionJobPage.id.in_(page_ids),
+                    IngestionJobPage.status == JobStatus.RUNNING,
+                    or_(
+                        IngestionJobPage.heartbeat_at.is_(None),
+                        IngestionJobPage.heartbeat_at < expired_before,
+                    ),
+                )
+            )
+            .values(status=JobStatus.PENDING, worker_id=None)
+        )
+        await session.commit()
+        return page_ids
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def update_ingestion_job_pages_status(
+    session: AsyncSession,
+    job_id: str,
+    from_status: list[JobStatus],
+    to_status: JobStatus,
+    require_page_id: bool = False,
+) -> list[str]:
+    """
+    특정 작업에서 주어진 상태의 페이지들을 다른 상태로 변경합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job_id (str): 작업 ID.
+        from_status (list[JobStatus]): 변경 대상 페이지의 현재 상태 목록.
+        to_status (JobStatus): 변경할 상태.
+        require_page_id (bool, optional): True이면 페이지 ID가 없는(URL 파싱 실패) 페이지는 제외. Defaults to False.
+
+    Returns:
+        list[str]: 상태가 변경된 작업 페이지 ID 목록.
+    """
+    try:
+        statement = select(IngestionJobPage).where(
+            and_(
+                IngestionJobPage.job_id == job_id,
+                IngestionJobPage.status.in_(from_status),
+            )
+        )
+        if require_page_id:
+            statement = statement.where(IngestionJobPage.page_id != "")
+        result = await session.exec(statement)
+        pages = result.all()
+        for page in pages:
+            page.status = to_status
+            session.add(page)
+        await session.commit()
+        return [page.id for page in pages]
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def update_ingestion_job(session: AsyncSession, job: IngestionJob):
+    """
+    수집 작업 정보를 수정합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job (IngestionJob): 수정할 작업 객체.
+
+    Returns:
+        IngestionJob: 수정된 작업 객체.
+    """
+    try:
+        session.add(job)
+        await session.commit()
+        await session.refresh(job)
+        return job
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def update_ingestion_job_page(session: AsyncSession, page: IngestionJobPage):
+    """
+    작업 페이지 정보를 수정합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        page (IngestionJobPage): 수정할 작업 페이지 객체.
+
+    Returns:
+        IngestionJobPage: 수정된 작업 페이지 객체.
+    """
+    try:
+        session.add(page)
+        await session.commit()
+        await session.refresh(page)
+        return page
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
@@ -0,0 +1,207 @@
+"""
+PageSyncState 모델에 대한 데이터베이스 CRUD(Create, Read, Update, Delete) 작업을 정의합니다.
+"""
+
+import datetime
+from sqlmodel import select, delete, update, and_
+from core.exception import CustomException, ExceptionCase
+from db.models import PageSyncState
+from db.database import AsyncSession
+from schemas.schemas import PageSyncInfo
+
+
+async def get_page_sync_states(
+    session: AsyncSession, datasource: str, page_ids: list[str]
+):
+    """
+    페이지 ID 목록에 해당하는 페이지 동기화 상태를 조회합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        datasource (str): 데이터 소스.
+        page_ids (list[str]): 조회할 페이지 ID 목록.
+
+    Returns:
+        list[PageSyncState]: 페이지 동기화 상태 객체 목록.
+    """
+    try:
+        if not page_ids:
+            return []
+        statement = select(PageSyncState).where(
+            and_(
+                PageSyncState.datasource == datasource,
+                PageSyncState.page_id.in_(page_ids),
+            )
+        )
+        result = await session.exec(statement)
+        return result.all()
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def get_page_sync_states_by_root(
+    session: AsyncSession, datasource: str | None, root_page_ids: list[str]
+):
+    """
+    등록 문서(루트 페이지)로부터 수집된 모든 페이지의 동기화 상태를 조회합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        datasource (str | None): 데이터 소스. None이면 모든 데이터 소스.
+        root_page_ids (list[str]): 루트 페이지 ID 목록.
+
+    Returns:
+        list[PageSyncState]: 페이지 동기화 상태 객체 목록.
+    """
+    try:
+        if not root_page_ids:
+            return []
+        statement = select(PageSyncState).where(
+            PageSyncState.root_page_id.in_(root_page_ids)
+        )
+        if datasource:
+            statement = statement.where(PageSyncState.datasource == datasource)
+        result = await session.exec(statement)
+        return result.all()
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def save_page_sync_states(
+    session: AsyncSession,
+    datasource: str,
+    root_page_id: str,
+    pages: list[PageSyncInfo],
+):
+    """
+    수집이 끝난 페이지들의 동기화 상태를 생성하거나 수정합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        datasource (str): 데이터 소스.
+        root_page_id (str): 페이지를 수집한 등록 문서의 페이지 ID.
+        pages (list[PageSyncInfo]): 수집된 페이지 정보 목록.
+
+    Returns:
+        bool: 성공 시 True.
+    """
+    try:
+        if not pages:
+            return True
+        now = datetime.datetime.now(datetime.timezone.utc)
+        states = {
+            state.page_id: state
+            for state in await get_page_sync_states(
+                session, datasource, [page.page_id for page in pages]
+            )
+        }
+        for page in pages:
+            state = states.get(page.page_id) or PageSyncState(
+                datasource=datasource, page_id=page.page_id, root_page_id=root_page_id
+            )
+            # 수집 중 더 최신 수정이 감지된 경우 그 시간을 유지
+            if not state.last_edited_time or (
+                page.updated_at and page.updated_at > state.last_edited_time
+            ):
+                state.last_edited_time = page.updated_at
+            state.ingested_edited_time = page.updated_at
+            state.content_hash = page.content_hash
+            state.chunk_count = page.chunk_count
+            state.last_ingested_date = now
+            session.add(state)
+        await session.commit()
+        return True
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def mark_page_edited(
+    session: AsyncSession, datasource: str, page_ids: list[str], last_edited_time: str
+):
+    """
+    데이터 소스에서 감지한 페이지의 최신 수정 시간을 기록합니다.
+    수집이 끝나기 전까지 질의 시 해당 페이지를 최신이 아닌 것으로 판단할 수 있습니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        datasource (str): 데이터 소스.
+        page_ids (list[str]): 페이지 ID 목록.
+        last_edited_time (str): 감지된 수정 시간.
+
+    Returns:
+        bool: 성공 시 True.
+    """
+    try:
+        statement = (
+            update(PageSyncState)
+            .where(
+                and_(
+                    PageSyncState.datasource == datasource,
+                    PageSyncState.page_id.in_(page_ids),
+                )
+            )
+            .values(last_edited_time=last_edited_time)
+        )
+        await session.exec(statement)
+        await session.commit()
+        return True
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def delete_page_sync_states_by_root(
+    session: AsyncSession, datasource: str, root_page_ids: list[str]
+):
+    """
+    등록 문서(루트 페이지)로부터 수집된 페이지들의 동기화 상태를 삭제합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        datasource (str): 데이터 소스.
+        root_page_ids (list[str]): 루트 페이지 ID 목록.
+
+    Returns:
+        bool: 성공 시 True.
+    """
+    try:
+        statement = delete(PageSyncState).where(
+            and_(
+                PageSyncState.datasource == datasource,
+                PageSyncState.root_page_id.in_(root_page_ids),
+            )
+        )
+        await session.exec(statement)
+        await session.commit()
+        return True
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def delete_page_sync_states(
+    session: AsyncSession, datasource: str, page_ids: list[str]
+):
+    """
+    페이지 ID 목록에 해당하는 페이지 동기화 상태를 삭제합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        datasource (str): 데이터 소스.
+        page_ids (list[str]): 삭제할 페이지 ID 목록.
+
+    Returns:
+        bool: 성공 시 True.
+    """
+    try:
+        if not page_ids:
+            return True
+        statement = delete(PageSyncState).where(
+            and_(
+                PageSyncState.datasource == datasource,
+                PageSyncState.page_id.in_(page_ids),
+            )
+        )
+        await session.exec(statement)
+        await session.commit()
+        return True
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
@@ -0,0 +1,132 @@
+"""
+DataSourceSyncState 모델에 대한 데이터베이스 CRUD(Create, Read, Update, Delete) 작업을 정의합니다.
+"""
+
+import datetime
+from sqlmodel import select, update, and_, or_
+from sqlalchemy.exc import IntegrityError
+from core.exception import CustomException, ExceptionCase
+from db.models import DataSourceSyncState
+from db.database import AsyncSession
+
+
+async def get_sync_state(session: AsyncSession, datasource: str):
+    """
+    데이터 소스의 동기화 상태를 조회합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        datasource (str): 데이터 소스.
+
+    Returns:
+        DataSourceSyncState | None: 조회된 동기화 상태 객체 또는 None.
+    """
+    try:
+        statement = select(DataSourceSyncState).where(
+            DataSourceSyncState.datasource == datasource
+        )
+        result = await session.exec(statement)
+        return result.first()
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def save_sync_state(session: AsyncSession, sync_state: DataSourceSyncState):
+    """
+    데이터 소스의 동기화 상태를 생성하거나 수정합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        sync_state (DataSourceSyncState): 저장할 동기화 상태 객체.
+
+    Returns:
+        DataSourceSyncState: 저장된 동기화 상태 객체.
+    """
+    try:
+        session.add(sync_state)
+        await session.commit()
+        await session.refresh(sync_state)
+        return sync_state
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def acquire_sync_lease(
+    session: AsyncSession, datasource: str, owner: str, lease_seconds: float
+) -> bool:
+    """
+    데이터 소스 동기화 lease를 획득하거나 연장합니다.
+    lease가 없거나 만료되었거나 이미 같은 소유자인 경우에만 조건부 UPDATE로 획득하므로,
+    여러 프로세스 중 하나만 동기화를 실행합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        datasource (str): 데이터 소스.
+        owner (str): lease를 획득할 프로세스 ID.
+        lease_seconds (float): lease 유지 시간(초).
+
+    Returns:
+        bool: lease를 획득(연장)했으면 True.
+    """
+    try:
+        if not await get_sync_state(session, datasource):
+            try:
+                session.add(DataSourceSyncState(datasource=datasource))
+                await session.commit()
+            except IntegrityError:
+                # 다른 프로세스가 먼저 생성한 경우
+                await session.rollback()
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        statement = (
+            update(DataSourceSyncState)
+            .where(
+                and_(
+                    DataSourceSyncState.datasource == datasource,
+                    or_(
+                        DataSourceSyncState.lease_owner.is_(None),
+                        DataSourceSyncState.lease_owner == owner,
+                        DataSourceSyncState.lease_expires_at < now,
+                    ),
+                )
+            )
+            .values(
+                lease_owner=owner,
+                lease_expires_at=now + datetime.timedelta(seconds=lease_seconds),
+            )
+        )
+        result = await session.exec(statement)
+        await session.commit()
+        return result.rowcount == 1
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
+
+
+async def release_sync_lease(session: AsyncSession, datasource: str, owner: str):
+    """
+    보유 중인 데이터 소스 동기화 lease를 해제합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        datasource (str): 데이터 소스.
+        owner (str): lease를 보유한 프로세스 ID.
+
+    Returns:
+        bool: 성공 시 True.
+    """
+    try:
+        statement = (
+            update(DataSourceSyncState)
+            .where(
+                and_(
+                    DataSourceSyncState.datasource == datasource,
+                    DataSourceSyncState.lease_owner == owner,
+                )
+            )
+            .values(lease_owner=None, lease_expires_at=None)
+        )
+        await session.exec(statement)
+        await session.commit()
+        return True
+    except Exception as e:
+        raise CustomException(exception_case=ExceptionCase.DB_OP_ERROR, detail=str(e))
@@ -6,10 +6,19 @@
 from typing import AsyncGenerator
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import Column, inspect, text
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError
-from db.models import UserGroup, User
+from db.models import (
+    DataSourceSyncState,
+    DocumentTB,
+    IngestionJob,
+    IngestionJobPage,
+    UserGroup,
+    User,
+)
 from utils import hash_handler
 from core.exception import CustomException, ExceptionCase
 from core.config import settings
@@ -23,14 +32,47 @@ engine = create_async_engine(database_url, echo=True)
 # 비동기 세션 생성기
 async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# create_all은 이미 있는 테이블을 변경하지 않으므로, 기존 테이블에 추가한 컬럼은 여기에 등록.
+# 컬럼이 없으면 ALTER TABLE로 추가하며, NOT NULL 컬럼은 server_default가 있어야 함
+ADDED_COLUMNS: list[Column] = [
+    DocumentTB.__table__.c.chunk_strategy,
+    IngestionJob.__table__.c.root_page_id,
+    IngestionJobPage.__table__.c.worker_id,
+    IngestionJobPage.__table__.c.heartbeat_at,
+    DataSourceSyncState.__table__.c.lease_owner,
+    DataSourceSyncState.__table__.c.lease_expires_at,
+]
+
+
+def _add_missing_columns(conn: Connection) -> None:
+    inspector = inspect(conn)
+    preparer = conn.dialect.identifier_preparer
+    for column in ADDED_COLUMNS:
+        table_name = column.table.name
+        existing = {item["name"] for item in inspector.get_columns(table_name)}
+        if column.name in existing:
+            continue
+        ddl = (
+            f"ALTER TABLE {preparer.quote(table_name)} "
+            f"ADD COLUMN {preparer.quote(column.name)} "
+            f"{column.type.compile(dialect=conn.dialect)}"
+        )
+        if column.server_default is not None:
+            ddl += f" DEFAULT '{column.server_default.arg}'"
+        ddl += " NULL" if column.nullable else " NOT NULL"
+        conn.execute(text(ddl))
+        print(f"Added column {table_name}.{column.name}")
+
 
 async def init_db():
     """
     데이터베이스의 모든 테이블을 생성합니다.
-    SQLModel.metadata.create_all을 사용하여 정의된 모든 SQLModel 테이블을 생성합니다.
+    SQLModel.metadata.create_all을 사용하여 정의된 모든 SQLModel 테이블을 생성하고,
+    기존 테이블에 없는 컬럼(`ADDED_COLUMNS`)을 추가합니다.
     """
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
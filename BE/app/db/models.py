@@ -9,7 +9,15 @@ import uuid
 from typing import List, Optional
 
 from sqlmodel import SQLModel, Field, Relationship, JSON
-from sqlalchemy import Column, DateTime, func, Enum as SAEnum, Text, CHAR
+from sqlalchemy import (
+    Column,
+    DateTime,
+    func,
+    Enum as SAEnum,
+    Text,
+    CHAR,
+    UniqueConstraint,
+)
 
 
 class DataSource(str, enum.Enum):
@@ -20,6 +28,15 @@ class DataSource(str, enum.Enum):
     NOTION = "notion"
 
 
+class ChunkStrategy(str, enum.Enum):
+    """
+    문서 수집 시 사용하는 청킹 전략을 나타내는 Enum입니다.
+    """
+
+    CHARACTER = "character"  # 글자 수 기준 청킹
+    STRUCTURE = "structure"  # 블록 구조(heading) 기준 청킹
+
+
 class AuthorityLevel(str, enum.Enum):
     """
     사용자 그룹의 권한 수준을 나타내는 Enum입니다.
@@ -251,6 +268,94 @@ class DocumentTB(SQLModel, table=True):
         sa_column=Column(JSON, index=True),
         description="문서에 접근 가능한 사용자 그룹 ID 목록",
     )
+    chunk_strategy: ChunkStrategy = Field(
+        default=ChunkStrategy.CHARACTER,
+        # 기존 테이블에 추가된 컬럼이므로 기존 행은 기본 전략(CHARACTER)으로 채움 (db.database.ADDED_COLUMNS)
+        sa_column=Column(
+            SAEnum(ChunkStrategy),
+            nullable=False,
+            server_default=ChunkStrategy.CHARACTER.name,
+        ),
+        description="문서 수집 시 사용한 청킹 전략 (변경 감지 동기화에도 사용)",
+    )
+    created_date: datetime.datetime = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=False
+        ),
+        description="생성 날짜",
+    )
+    update_date: datetime.datetime = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True),
+            server_default=func.now(),
+            onupdate=func.now(),
+            nullable=False,
+        ),
+        description="마지막 수정일",
+    )
+
+
+class JobStatus(str, enum.Enum):
+    """
+    문서 수집(ingestion) 작업 및 작업 내 페이지의 처리 상태를 나타내는 Enum입니다.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    SKIPPED = "skipped"  # 내용이 바뀌지 않았거나 중복된 문서 (성공으로 취급)
+
+
+class IngestionJob(SQLModel, table=True):
+    """
+    백그라운드 문서 수집 작업을 저장하는 테이블 모델입니다.
+    IngestionJobPage와 일대다 관계를 가집니다.
+    """
+
+    id: str = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(
+            CHAR(36),
+            primary_key=True,
+            index=True,
+            nullable=False,
+        ),
+        description="작업 고유 식별 UUID",
+    )
+    datasource: str = Field(
+        sa_column=Column(SAEnum(DataSource), nullable=False),
+        description="데이터 출처 (예: notion)",
+    )
+    user_groups: list[str] = Field(
+        sa_column=Column(JSON),
+        description="수집한 문서에 접근 가능한 사용자 그룹 ID 목록",
+    )
+    incremental: bool = Field(default=True, description="변경된 청크만 업로드할지 여부")
+    chunk_strategy: ChunkStrategy = Field(
+        default=ChunkStrategy.CHARACTER,
+        sa_column=Column(
+            SAEnum(ChunkStrategy),
+            nullable=False,
+            server_default=ChunkStrategy.CHARACTER.name,
+        ),
+        description="청킹 전략",
+    )
+    root_page_id: Optional[str] = Field(
+        default=None,
+        description="변경 감지 동기화 작업이면 페이지가 속한 등록 문서의 페이지 ID (페이지 단위로 수집)",
+    )
+    status: JobStatus = Field(
+        default=JobStatus.PENDING,
+        sa_column=Column(SAEnum(JobStatus), nullable=False, index=True),
+        description="작업 상태",
+    )
+    user_id: Optional[str] = Field(
+        default=None, foreign_key="user.id", description="작업을 요청한 사용자 ID"
+    )
     created_date: datetime.datetime = Field(
         default=None,
         sa_column=Column(
@@ -268,3 +373,204 @@ class DocumentTB(SQLModel, table=True):
         ),
         description="마지막 수정일",
     )
+    finished_date: Optional[datetime.datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+        description="작업 종료 날짜",
+    )
+
+    # IngestionJobPage와의 일대다 관계
+    pages: List["IngestionJobPage"] = Relationship(
+        back_populates="job", sa_relationship_kwargs={"cascade": "all, delete"}
+    )
+
+
+class IngestionJobPage(SQLModel, table=True):
+    """
+    수집 작업에 포함된 개별 문서(URL)의 처리 상태와 통계를 저장하는 테이블 모델입니다.
+    IngestionJob과 다대일 관계를 가집니다.
+    """
+
+    id: str = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(
+            CHAR(36),
+            primary_key=True,
+            index=True,
+            nullable=False,
+        ),
+        description="작업 페이지 고유 식별 UUID",
+    )
+    job_id: str = Field(
+        foreign_key="ingestionjob.id", index=True, description="페이지가 속한 작업 ID"
+    )
+    url: str = Field(sa_column=Column(Text, nullable=False), description="문서 URL")
+    page_id: str = Field(index=True, description="데이터 소스 내 문서의 고유 ID")
+    status: JobStatus = Field(
+        default=JobStatus.PENDING,
+        sa_column=Column(SAEnum(JobStatus), nullable=False, index=True),
+        description="페이지 처리 상태",
+    )
+    attempts: int = Field(default=0, description="처리 시도 횟수")
+    page_count: int = Field(
+        default=0, description="수집된 페이지 수 (하위 페이지 포함)"
+    )
+    chunk_count: int = Field(default=0, description="생성된 청크 수")
+    embedded_count: int = Field(default=0, description="임베딩한 청크 수")
+    upserted_count: int = Field(default=0, description="벡터 DB에 업로드한 청크 수")
+    deleted_count: int = Field(default=0, description="벡터 DB에서 삭제한 청크 수")
+    crawl_seconds: float = Field(default=0.0, description="크롤링 소요 시간(초)")
+    embed_seconds: float = Field(default=0.0, description="임베딩 소요 시간(초)")
+    upsert_seconds: float = Field(default=0.0, description="업로드 소요 시간(초)")
+    error: Optional[str] = Field(
+        default=None, sa_column=Column(Text, nullable=True), description="에러 메시지"
+    )
+    started_date: Optional[datetime.datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+        description="처리 시작 날짜",
+    )
+    finished_date: Optional[datetime.datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+        description="처리 종료 날짜",
+    )
+    worker_id: Optional[str] = Field(
+        default=None, description="페이지를 처리 중인 워커 ID (호스트:PID:난수)"
+    )
+    heartbeat_at: Optional[datetime.datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+        description="처리 중인 워커가 마지막으로 lease를 갱신한 시각",
+    )
+
+    # IngestionJob과의 다대일 관계
+    job: IngestionJob = Relationship(back_populates="pages")
+
+
+class DataSourceSyncState(SQLModel, table=True):
+    """
+    데이터 소스별 변경 감지 동기화 상태를 저장하는 테이블 모델입니다.
+    마지막으로 반영한 문서 수정 시간(high-water mark) 이후에 수정된 문서만 다시 수집합니다.
+    """
+
+    datasource: str = Field(
+        sa_column=Column(
+            SAEnum(DataSource),
+            primary_key=True,
+            nullable=False,
+        ),
+        description="데이터 출처 (예: notion)",
+    )
+    last_edited_time: Optional[str] = Field(
+        default=None,
+        description="마지막 동기화에 반영된 문서 수정 시간 (ISO 8601, high-water mark)",
+    )
+    synced_page_count: int = Field(
+        default=0, description="마지막 동기화에서 다시 수집한 페이지 수"
+    )
+    last_synced_date: Optional[datetime.datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+        description="마지막 동기화 날짜",
+    )
+    lease_owner: Optional[str] = Field(
+        default=None, description="동기화를 실행 중인 프로세스 ID (호스트:PID:난수)"
+    )
+    lease_expires_at: Optional[datetime.datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+        description="동기화 lease 만료 시각",
+    )
+
+
+class PageSyncState(SQLModel, table=True):
+    """
+    벡터 DB에 수집된 페이지(하위 페이지 포함)별 동기화 상태를 저장하는 테이블 모델입니다.
+    원격 호출 없이 페이지의 최신 여부, 청크 수, 내용 변경 여부를 확인할 수 있습니다.
+    """
+
+    __table_args__ = (UniqueConstraint("datasource", "page_id"),)
+
+    id: str = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(
+            CHAR(36),
+            primary_key=True,
+            index=True,
+            nullable=False,
+        ),
+        description="페이지 동기화 상태 고유 식별 UUID",
+    )
+    datasource: str = Field(
+        sa_column=Column(
+            SAEnum(DataSource),
+            nullable=False,
+            index=True,
+        ),
+        description="데이터 출처 (예: notion)",
+    )
+    page_id: str = Field(index=True, description="청크가 속한 페이지의 ID")
+    root_page_id: str = Field(
+        index=True, description="페이지를 수집한 등록 문서(DocumentTB)의 페이지 ID"
+    )
+    last_edited_time: Optional[str] = Field(
+        default=None, description="데이터 소스에서 확인된 최신 수정 시간"
+    )
+    ingested_edited_time: Optional[str] = Field(
+        default=None, description="벡터 DB에 수집된 버전의 수정 시간"
+    )
+    content_hash: Optional[str] = Field(
+        default=None, description="수집된 페이지 청크 내용의 해시"
+    )
+    chunk_count: int = Field(default=0, description="벡터 DB에 저장된 청크 수")
+    last_ingested_date: Optional[datetime.datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), nullable=True),
+        description="마지막 수집 날짜",
+    )
+
+
+class IngestionCheckpoint(SQLModel, table=True):
+    """
+    수집 작업 페이지 처리 중 업로드까지 끝난 (하위) 페이지를 기록하는 테이블 모델입니다.
+    서버 재시작이나 재시도로 작업 페이지를 다시 처리할 때, 수정되지 않은 완료 페이지는
+    블록을 다시 크롤링/임베딩하지 않고 하위 페이지부터 이어서 처리합니다.
+    작업 페이지가 성공하면 삭제됩니다.
+    """
+
+    __table_args__ = (UniqueConstraint("job_page_id", "page_id"),)
+
+    id: str = Field(
+        default_factory=lambda: str(uuid.uuid4()),
+        sa_column=Column(
+            CHAR(36),
+            primary_key=True,
+            index=True,
+            nullable=False,
+        ),
+        description="체크포인트 고유 식별 UUID",
+    )
+    job_page_id: str = Field(
+        foreign_key="ingestionjobpage.id",
+        index=True,
+        description="체크포인트가 속한 작업 페이지 ID",
+    )
+    page_id: str = Field(description="업로드가 끝난 페이지의 ID")
+    updated_at: Optional[str] = Field(
+        default=None, description="업로드된 버전의 수정 시간"
+    )
+    content_hash: str = Field(description="업로드된 페이지 청크 내용의 해시")
+    chunk_count: int = Field(default=0, description="업로드된 청크 수")
+    child_page_ids: list[str] = Field(
+        default_factory=list,
+        sa_column=Column(JSON),
+        description="페이지에서 발견한 하위 페이지 ID 목록",
+    )
+    created_date: datetime.datetime = Field(
+        default=None,
+        sa_column=Column(
+            DateTime(timezone=True), server_default=func.now(), nullable=False
+        ),
+        description="생성 날짜",
+    )
@@ -2,9 +2,12 @@ import logging
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from core.handler import set_error_handlers
-from api.v1.endpoints import auth, chat, document, user_group
+from api.v1.endpoints import auth, chat, document, metrics, user_group
 from db.database import init_db, init_data
 from services.qdrant_service import QdrantService
+from services.ingestion_job import ingestion_job_manager
+from services.sync_scheduler import document_sync_scheduler
+from utils.chunking import shutdown_chunking_executor
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,7 +24,14 @@ async def lifespan(app: FastAPI):
     print("data init")
     await QdrantService().get_or_create_collection()
     print("qdrant init")
+    await ingestion_job_manager.start()
+    print("ingestion workers start")
+    await document_sync_scheduler.start()
+    print("document sync start")
     yield
+    await document_sync_scheduler.stop()
+    await ingestion_job_manager.stop()
+    shutdown_chunking_executor()
     print("app shutdown")
 
 
@@ -31,5 +41,6 @@ app.include_router(auth.auth_router)
 app.include_router(chat.chat_router)
 app.include_router(document.docs_router)
 app.include_router(user_group.user_group_router)
+app.include_router(metrics.metrics_router)
 
 set_error_handlers(app)
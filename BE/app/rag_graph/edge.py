@@ -6,12 +6,15 @@ from langgraph.graph import START, END
 from langgraph.graph.state import CompiledStateGraph
 from rag_graph.node import (
     refine_question,
+    check_answer_cache,
     decide_context_necessity,
     retrieve_context,
     check_context_latest,
     update_old_context,
+    rerank_context,
     generate_answer,
     should_retrieve_context,
+    is_answer_cached,
 )
 from rag_graph.state import workflow
 from core.exception import CustomException, ExceptionCase
@@ -24,13 +27,20 @@ def get_graph() -> CompiledStateGraph:
     try:
         workflow.add_node("retrieve_context", retrieve_context)
         workflow.add_node("refine_question", refine_question)
+        workflow.add_node("check_answer_cache", check_answer_cache)
         workflow.add_node("decide_context_necessity", decide_context_necessity)
         workflow.add_node("check_context_latest", check_context_latest)
         workflow.add_node("update_old_context", update_old_context)
+        workflow.add_node("rerank_context", rerank_context)
         workflow.add_node("generate_answer", generate_answer)
 
         workflow.add_edge(START, "refine_question")
-        workflow.add_edge("refine_question", "decide_context_necessity")
+        workflow.add_edge("refine_question", "check_answer_cache")
+        workflow.add_conditional_edges(
+            "check_answer_cache",
+            is_answer_cached,
+            {True: END, False: "decide_context_necessity"},
+        )
         workflow.add_conditional_edges(
             "decide_context_necessity",
             should_retrieve_context,
@@ -38,7 +48,8 @@ def get_graph() -> CompiledStateGraph:
         )
         workflow.add_edge("retrieve_context", "check_context_latest")
         workflow.add_edge("check_context_latest", "update_old_context")
-        workflow.add_edge("update_old_context", "generate_answer")
+        workflow.add_edge("update_old_context", "rerank_context")
+        workflow.add_edge("rerank_context", "generate_answer")
         workflow.add_edge("generate_answer", END)
 
         graph = workflow.compile()
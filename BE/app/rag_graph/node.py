@@ -2,20 +2,54 @@
 Langgraph에서 Node를 정의하는 모듈
 """
 
+import logging
+import time
+from typing import List
+from langchain_core.callbacks import adispatch_custom_event
+from langchain_core.runnables import RunnableConfig
 from rag_graph.state import GraphState
 from rag_graph import prompt, output_structure
 from services.gemini import GeminiService
 from services.qdrant_service import QdrantService
 from services.mcp_service import agent
+from services.query_embedding_cache import get_query_embedding_cache
+from services.answer_cache import get_answer_cache
+from services.reranker import get_reranker
 from schemas.schemas import Document, DocumentMetadata
 from utils.data_loader import get_data_loader
+from utils.mmr import mmr_select
+from utils.bm25 import query_sparse_embedding
+from utils.token_counter import estimate_tokens, prompt_token_estimator
+from utils.context_compaction import compact_context
+from core.config import settings
+from crud.page_sync_state import get_page_sync_states
+from db.database import async_session
 from core.exception import CustomException, ExceptionCase
 
 
+logger = logging.getLogger(__name__)
+
 gemini = GeminiService()
 qdrant = QdrantService()
 
 
+async def embed_question(question: str) -> List[float]:
+    """질의 임베딩 생성. 질의 임베딩 캐시가 활성화된 경우 캐시를 거침."""
+    query_embedding_cache = get_query_embedding_cache()
+    if query_embedding_cache:
+        return await query_embedding_cache.get_or_embed(
+            question,
+            model=gemini.embedding_model_name,
+            dimension=gemini.vector_size,
+            embed=lambda text: gemini.generate_embedding(
+                contents=text,
+                task="RETRIEVAL_QUERY",
+                use_cache=settings.QUERY_EMBEDDING_CACHE_SHARED,
+            ),
+        )
+    return await gemini.generate_embedding(contents=question, task="RETRIEVAL_QUERY")
+
+
 async def refine_question(state: GraphState) -> GraphState:
     """
     1. 이전 대화 내역을 바탕으로 쿼리를 재작성 해주는 노드.
@@ -40,6 +74,47 @@ async def refine_question(state: GraphState) -> GraphState:
         )
 
 
+async def check_answer_cache(state: GraphState, config: RunnableConfig) -> GraphState:
+    """
+    1-1. 같은 사용자 그룹의 유사한 질문에 대한 캐시된 답변이 있는지 확인하는 노드.
+    적중하면 저장된 답변을 `cached_answer` 이벤트로 전송하고 그래프를 종료.
+    """
+    try:
+        print("-------------------------")
+        print(check_answer_cache.__name__)
+        print(state)
+        answer_cache = get_answer_cache()
+        user_group = state.get("user_group")
+        if not answer_cache or not user_group:
+            return GraphState(is_answer_cached=False)
+
+        question_embedding = await embed_question(state["question"])
+        answer = await answer_cache.lookup(question_embedding, user_group)
+        if answer is None:
+            return GraphState(
+                question_embedding=question_embedding, is_answer_cached=False
+            )
+
+        await adispatch_custom_event("cached_answer", {"answer": answer}, config=config)
+        return GraphState(answer=answer, is_answer_cached=True)
+    except Exception as e:
+        raise CustomException(
+            exception_case=ExceptionCase.GRAPH_NODE_ERROR,
+            detail=f"Error occured in check_answer_cache: {e}",
+        )
+
+
+def is_answer_cached(state: GraphState) -> bool:
+    """
+    답변 캐시 적중 여부에 따라 다음 노드를 결정하는 라우터.
+    """
+    print("-------------------------")
+    print(is_answer_cached.__name__)
+    print(state)
+
+    return state["is_answer_cached"]
+
+
 async def decide_context_necessity(state: GraphState) -> GraphState:
     """
     2. 쿼리를 보고 컨텍스트 검색이 필요한지 결정하는 노드.
@@ -81,6 +156,8 @@ def should_retrieve_context(state: GraphState) -> bool:
 async def retrieve_context(state: GraphState) -> GraphState:
     """
     3. 쿼리를 바탕으로 컨텍스트를 가져오는 노드.
+    MMR이 활성화된 경우 후보를 더 많이 검색한 뒤 같은 페이지의 중복 청크를 줄이도록 다시 선택.
+    하이브리드 검색은 요청의 `hybrid_search` 값, 없으면 `HYBRID_SEARCH_ENABLED` 설정을 따름.
     """
     try:
         print("-------------------------")
@@ -88,14 +165,33 @@ async def retrieve_context(state: GraphState) -> GraphState:
         print(state)
         question = state["question"]
         user_group = state["user_group"]
+        hybrid_search = state.get("hybrid_search")
+        if hybrid_search is None:
+            hybrid_search = settings.HYBRID_SEARCH_ENABLED
 
-        embedding = await gemini.generate_embedding(
-            contents=question, task="RETRIEVAL_QUERY"
-        )
+        # 답변 캐시 확인 단계에서 만든 임베딩이 있으면 재사용
+        embedding = state.get("question_embedding") or await embed_question(question)
+
+        top_k = settings.RETRIEVAL_TOP_K
+        use_mmr = settings.RETRIEVAL_MMR_ENABLED
         output_documents = await qdrant.query_document(
             embedding=embedding,
             metadata=DocumentMetadata(user_groups=[user_group]),
+            limit=max(top_k, settings.RETRIEVAL_MMR_FETCH_K) if use_mmr else top_k,
+            score_threshold=settings.RETRIEVAL_SCORE_THRESHOLD,
+            with_vectors=use_mmr,
+            sparse_embedding=(
+                query_sparse_embedding(question) if hybrid_search else None
+            ),
         )
+        if use_mmr:
+            selected = mmr_select(
+                embedding,
+                [output_document.embedding for output_document in output_documents],
+                k=top_k,
+                lambda_mult=settings.RETRIEVAL_MMR_LAMBDA,
+            )
+            output_documents = [output_documents[index] for index in selected]
         documents = [
             Document(
                 content=output_document.metadata.content,
@@ -118,6 +214,8 @@ async def check_context_latest(state: GraphState) -> GraphState:
     """
     4. 컨텍스트의 최신성을 검증하는 노드.
     최신이 아닌 컨텍스트는 mcp를 호출해서 최신 정보로 업데이트.
+    변경 감지 동기화가 활성화된 경우 mcp 대신 페이지 동기화 상태 테이블의 수정 시간과 비교하고,
+    동기화 상태가 없는 페이지만 mcp로 검증.
     """
     try:
         print("-------------------------")
@@ -129,6 +227,37 @@ async def check_context_latest(state: GraphState) -> GraphState:
         context = state["context"]
         if not context:
             return GraphState(context=latest_context, old_context=old_context)
+        if settings.DOCUMENT_SYNC_ENABLED:
+            async with async_session() as session:
+                sync_states = {
+                    (datasource, sync_state.page_id): sync_state
+                    for datasource in {document.datasource for document in context}
+                    for sync_state in await get_page_sync_states(
+                        session,
+                        datasource,
+                        [
+                            document.page_id
+                            for document in context
+                            if document.datasource == datasource
+                        ],
+                    )
+                }
+            unsynced_context = []
+            for document in context:
+                sync_state = sync_states.get((document.datasource, document.page_id))
+                if not sync_state:
+                    # 동기화 상태가 없으면(동기화 이전에 수집된 문서 등) mcp로 검증
+                    unsynced_context.append(document)
+                elif (
+                    sync_state.last_edited_time
+                    and sync_state.last_edited_time > document.updated_at
+                ):
+                    old_context.append(document)
+                else:
+                    latest_context.append(document)
+            if not unsynced_context:
+                return GraphState(context=latest_context, old_context=old_context)
+            context = unsynced_context
 
         input_prompt = prompt.check_context_latest(context)
         async with agent.create_agent(
@@ -193,6 +322,43 @@ async def update_old_context(state: GraphState) -> GraphState:
         )
 
 
+async def rerank_context(state: GraphState) -> GraphState:
+    """
+    5-1. 로컬 reranker로 컨텍스트를 다시 정렬하고 상위 `RERANK_TOP_N`개를 남기는 노드.
+    점수가 같은 청크는 검색 순서를 유지하며, 토큰 예산은 답변 프롬프트 생성 시 적용.
+    """
+    try:
+        print("-------------------------")
+        print(rerank_context.__name__)
+        print(state)
+        context = state["context"]
+        if not settings.RERANK_ENABLED or not context:
+            return GraphState(context=context)
+
+        start_time = time.perf_counter()
+        reranker = get_reranker()
+        scores = await reranker.score(
+            state["question"], [document.content for document in context]
+        )
+        ranked = sorted(range(len(context)), key=lambda index: -scores[index])
+
+        reranked_context = [context[index] for index in ranked[: settings.RERANK_TOP_N]]
+
+        logger.info(
+            f"rerank_context ({reranker.name}): {len(context)} -> "
+            f"{len(reranked_context)} chunks, "
+            f"{sum(estimate_tokens(document.content) for document in context)} -> "
+            f"{sum(estimate_tokens(document.content) for document in reranked_context)}"
+            f" tokens, {(time.perf_counter() - start_time) * 1000:.1f}ms"
+        )
+        return GraphState(context=reranked_context)
+    except Exception as e:
+        raise CustomException(
+            exception_case=ExceptionCase.GRAPH_NODE_ERROR,
+            detail=f"Error occured in rerank_context: {e}",
+        )
+
+
 async def generate_answer(state: GraphState) -> GraphState:
     """
     6. 최종 llm 답변 노드.
@@ -205,8 +371,34 @@ async def generate_answer(state: GraphState) -> GraphState:
         context = state["context"]
         messages = state["messages"]
 
+        # 같은 페이지의 청크를 합쳐서 중복 텍스트와 반복되는 출처 URL을 줄임
+        context = compact_context(context)
         input_prompt = prompt.llm_answer(question, messages, context)
+        start_time = time.perf_counter()
         result = await gemini.model.ainvoke(input_prompt)
+        # rerank 등 컨텍스트 축소 효과를 확인하기 위한 생성 시간과 토큰 사용량
+        usage = result.usage_metadata or {}
+        prompt_token_estimator.calibrate(
+            estimated=sum(estimate_tokens(message.content) for message in input_prompt),
+            actual=usage.get("input_tokens"),
+        )
+        logger.info(
+            f"generate_answer: {len(context or [])} chunks, "
+            f"{time.perf_counter() - start_time:.2f}s, "
+            f"input_tokens={usage.get('input_tokens')}, "
+            f"output_tokens={usage.get('output_tokens')}"
+        )
+
+        answer_cache = get_answer_cache()
+        question_embedding = state.get("question_embedding")
+        if answer_cache and question_embedding and state.get("user_group"):
+            answer_cache.store_in_background(
+                question=question,
+                embedding=question_embedding,
+                user_group=state["user_group"],
+                answer=result.content,
+                context=context,
+            )
 
         return GraphState(answer=result)
     except Exception as e:
@@ -2,11 +2,19 @@
 llm 프롬프트 생성 함수 모음
 """
 
+import logging
 from typing import Sequence, Optional, List
+from core.config import settings
 from schemas.schemas import Document
 from utils.datasource_url import context_url
+from utils.token_counter import prompt_token_estimator
 from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage
 
+logger = logging.getLogger(__name__)
+
+# 대화 내역이 없을 때 대신 넣는 문구
+NO_CHAT_HISTORY = "No previous conversation"
+
 
 def refine_question(messages: Sequence[BaseMessage]) -> List[BaseMessage]:
     """
@@ -69,14 +77,38 @@ def get_latest_context() -> Sequence[BaseMessage]:
     return
 
 
+def _fit_recent(lines: List[str], tokens: List[int], limit: int) -> int:
+    """최근 줄부터 `limit` 토큰 안에 들어가는 줄 수."""
+    total = 0
+    for count, line_tokens in enumerate(reversed(tokens)):
+        if total + line_tokens > limit:
+            return count
+        total += line_tokens
+    return len(lines)
+
+
 def llm_answer(
     question: str,
     messages: Sequence[BaseMessage],
     context: Optional[Sequence[Document]],
+    max_tokens: Optional[int] = None,
+    history_max_tokens: Optional[int] = None,
+    history_min_tokens: Optional[int] = None,
 ) -> List[BaseMessage]:
     """
     6. 최종 llm 답변 노드에 사용되는 프롬프트.
+    답변 프롬프트의 토큰 예산을 배분하는 유일한 곳.
+    추정 토큰 수가 `max_tokens`를 넘지 않도록 대화 내역은 최근 메시지부터 `history_max_tokens`까지 남기고,
+    그래도 넘으면 대화 내역을 `history_min_tokens`까지 줄인 뒤 순위가 낮은(뒤쪽) 컨텍스트부터 제외
+    (첫 번째 컨텍스트는 남은 예산만큼 잘라서 항상 포함).
+    컨텍스트가 쓰고 남은 예산은 `history_max_tokens`를 넘더라도 더 오래된 대화 내역에 배분.
     """
+    max_tokens = max_tokens or settings.PROMPT_MAX_TOKENS
+    history_max_tokens = history_max_tokens or settings.PROMPT_HISTORY_MAX_TOKENS
+    history_min_tokens = min(
+        history_min_tokens or settings.PROMPT_HISTORY_MIN_TOKENS, history_max_tokens
+    )
+    estimate = prompt_token_estimator.estimate
 
     system = """### Role and Basic Instructions
 You are a professional AI assistant who answers users' questions based on information stored in a vector database.
@@ -88,31 +120,96 @@ Your job is to generate answers that are accurate, friendly, and helpful, making
 - Please write your answers in clear and understandable sentences.
 - If there is a document that is the basis for your answer, be sure to cite the source at the end of your answer in the format "[Source: {document url}]". If you referenced multiple documents, please cite them all."""  # noqa: E501
 
+    question_part = f"### Question:\n{question}"
+    # 섹션 제목과 구분자 (대화 내역/컨텍스트 줄 사이의 줄바꿈 포함).
+    # 남길 대화 내역이 없으면 대신 들어가는 문구도 미리 예산에서 제외
+    framing = (
+        "### Chat History:\n" + NO_CHAT_HISTORY + "\n\n---\n\n" * 2 + "### Context:\n\n"
+    )
+    available = (
+        max_tokens - estimate(system) - estimate(question_part) - estimate(framing)
+    )
+
+    chat_history_lines = [f"{message.type}: {message.content}" for message in messages]
+    history_tokens = [estimate(line) for line in chat_history_lines]
+    context_prompts = [
+        f"""**Document {i + 1}**
+- datasource_url: {context_url(document.datasource, document.page_id)}
+- content: {document.content}"""
+        for i, document in enumerate(context or [])
+    ]
+    context_tokens = [estimate(context_prompt) for context_prompt in context_prompts]
+
+    # 1. 대화 내역은 최근 메시지부터 history_max_tokens까지
+    history_count = _fit_recent(
+        chat_history_lines, history_tokens, min(history_max_tokens, available)
+    )
+    # 2. 예산을 넘으면 대화 내역을 history_min_tokens까지 줄임
+    if (
+        sum(history_tokens[len(history_tokens) - history_count :]) + sum(context_tokens)
+        > available
+    ):
+        history_count = _fit_recent(
+            chat_history_lines,
+            history_tokens,
+            max(history_min_tokens, available - sum(context_tokens)),
+        )
+    history_used = sum(history_tokens[len(history_tokens) - history_count :])
+    # 3. 그래도 넘으면 순위가 낮은 컨텍스트부터 제외
+    context_count = len(context_prompts)
+    while context_count and history_used + sum(context_tokens[:context_count]) > max(
+        available, 0
+    ):
+        context_count -= 1
+    # 가장 관련 있는 문서 하나도 들어가지 않으면 남은 예산만큼 잘라서 포함
+    remaining = available - history_used
+    if context_prompts and not context_count and remaining > 0:
+        keep_chars = len(context_prompts[0]) * remaining // context_tokens[0]
+        context_prompts[0] = context_prompts[0][:keep_chars]
+        context_tokens[0] = estimate(context_prompts[0])
+        context_count = 1
+    # 4. 컨텍스트가 쓰지 않은 예산은 대화 내역에 배분
+    history_count = max(
+        history_count,
+        _fit_recent(
+            chat_history_lines,
+            history_tokens,
+            available - sum(context_tokens[:context_count]),
+        ),
+    )
+    history_used = sum(history_tokens[len(history_tokens) - history_count :])
+
     human_prompt_parts = []
 
-    chat_history_lines = []
-    for message in messages:
-        chat_history_lines.append(f"{message.type}: {message.content}")
-    chat_history = "\n".join(chat_history_lines)
+    chat_history = "\n".join(
+        chat_history_lines[len(chat_history_lines) - history_count :]
+    )
     if not chat_history:
-        chat_history = "No previous conversation"
+        chat_history = NO_CHAT_HISTORY
 
     human_prompt_parts.append(f"### Chat History:\n{chat_history}")
-    human_prompt_parts.append(f"### Question:\n{question}")
+    human_prompt_parts.append(question_part)
 
-    if context:
+    if context_count:
         context_parts = []
         context_parts.append("### Context:\n")
-        for i, document in enumerate(context):
-            context_prompt = f"""**Document {i + 1}**
-- datasource_url: {context_url(document.datasource, document.page_id)}
-- content: {document.content}"""
-            context_parts.append(context_prompt)
+        context_parts.extend(context_prompts[:context_count])
         context_str = "\n".join(context_parts)
         human_prompt_parts.append(context_str)
 
     human_prompt = "\n\n---\n\n".join(human_prompt_parts)
 
+    logger.info(
+        f"llm_answer prompt budget: "
+        f"{estimate(system) + estimate(human_prompt)}/{max_tokens} tokens "
+        f"(system {estimate(system)}, question {estimate(question_part)}, "
+        f"history {history_used}/{history_max_tokens} "
+        f"[{history_count}/{len(chat_history_lines)} messages], "
+        f"context {sum(context_tokens[:context_count])} "
+        f"[{context_count}/{len(context_prompts)} documents]), "
+        f"scale {prompt_token_estimator.scale:.2f}"
+    )
+
     return [
         SystemMessage(content=system),
         HumanMessage(content=human_prompt),
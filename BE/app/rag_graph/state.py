@@ -2,7 +2,7 @@
 Langgraph의 사용자 정의 state를 정의하는 모듈.
 """
 
-from typing import Annotated, Sequence
+from typing import Annotated, List, Optional, Sequence
 from typing_extensions import TypedDict
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
@@ -15,7 +15,10 @@ class GraphState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], add_messages]
     username: Annotated[str, "user"]
     user_group: Annotated[str, "user_group"]
+    hybrid_search: Annotated[Optional[bool], "hybrid_search"]
     question: Annotated[str, "question"]
+    question_embedding: Annotated[List[float], "question_embedding"]
+    is_answer_cached: Annotated[bool, "is_answer_cached"]
     is_context_need: Annotated[bool, "is_context_need"]
     context: Annotated[Sequence[Document], "context"]
     old_context: Annotated[Sequence[Document], "old_context"]
@@ -29,13 +29,51 @@ class DocumentMetadata(Document):
     user_groups: Optional[Annotated[List[str], "user_groups"]] = None
 
 
+class SparseEmbedding(BaseModel):
+    indices: List[int]
+    values: List[float]
+
+
 class DocumentInput(BaseModel):
     id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
     embedding: List[float]
+    # 하이브리드 검색용 BM25 sparse 벡터 (컬렉션에 sparse 벡터 설정이 없으면 저장하지 않음)
+    sparse_embedding: Optional[SparseEmbedding] = None
     metadata: DocumentMetadata = Field(default_factory=dict)
 
 
 class DocumentOutput(BaseModel):
     id: str
     score: Optional[float] = None
+    # `with_vectors=True`로 검색한 경우에만 채워짐
+    embedding: Optional[List[float]] = None
     metadata: DocumentMetadata = Field(default_factory=dict)
+
+
+class PageSyncInfo(BaseModel):
+    page_id: str
+    updated_at: Optional[str] = None
+    chunk_count: int = 0
+    content_hash: str
+
+
+class PageCheckpoint(PageSyncInfo):
+    # 재개 시 페이지 블록을 다시 탐색하지 않고 하위 페이지를 이어서 탐색하기 위한 목록
+    child_page_ids: List[str] = Field(default_factory=list)
+
+
+class IngestionStats(BaseModel):
+    page_count: int = 0
+    chunk_count: int = 0
+    embedded_count: int = 0
+    upserted_count: int = 0
+    deleted_count: int = 0
+    crawl_seconds: float = 0.0
+    embed_seconds: float = 0.0
+    upsert_seconds: float = 0.0
+    # 수집이 끝난 페이지별 동기화 정보 (페이지 동기화 상태 테이블 갱신용)
+    pages: List[PageSyncInfo] = Field(default_factory=list, exclude=True)
+    # 청크가 없어져 삭제된 페이지 (비어 있거나 트리에서 빠진 페이지)
+    removed_page_ids: List[str] = Field(default_factory=list, exclude=True)
+    # 이미 등록된 문서의 벡터가 하나도 바뀌지 않았으면 True
+    unchanged: bool = Field(default=False, exclude=True)
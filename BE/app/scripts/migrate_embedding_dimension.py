@@ -0,0 +1,109 @@
+"""
+Qdrant 컬렉션의 청크를 다른 임베딩 차원(VECTOR_SIZE)의 새 컬렉션으로 옮기는 마이그레이션 스크립트.
+기존 벡터가 더 큰 차원이면 Matryoshka truncation으로 API 호출 없이 변환하고,
+`--reembed`이거나 기존 벡터가 더 작은 차원이면 청크 내용으로 다시 임베딩함.
+Point ID와 payload는 그대로 유지되므로, 완료 후 QDRANT_COLLECTION_NAME과 VECTOR_SIZE만 바꾸면 됨.
+새 컬렉션에는 청크 내용으로 계산한 BM25 sparse 벡터도 저장되므로, 같은 차원으로 옮기면
+sparse 벡터가 없는 기존 컬렉션에서 하이브리드 검색을 사용할 수 있음.
+
+실행 (BE/app 디렉토리에서):
+    python -m scripts.migrate_embedding_dimension --target chunks_768 --dimension 768
+"""
+
+import argparse
+import asyncio
+import time
+from core.config import settings
+from schemas.schemas import DocumentInput, DocumentMetadata
+from services.gemini import GeminiService, truncate_embedding
+from services.qdrant_service import QdrantService
+from utils.bm25 import document_sparse_embedding
+
+SCROLL_SIZE = 256
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.source == args.target:
+        raise SystemExit("--target must be different from --source")
+
+    source = QdrantService()
+    source.collection_name = args.source
+    target = QdrantService()
+    target.collection_name = args.target
+    target.vector_size = args.dimension
+    await target.get_or_create_collection()
+
+    gemini = None
+    source_info = await source.client.get_collection(args.source)
+    source_dimension = source_info.config.params.vectors.size
+    if args.reembed or source_dimension < args.dimension:
+        settings.VECTOR_SIZE = args.dimension
+        gemini = GeminiService()
+    print(
+        f"{args.source} ({source_dimension}d, {source_info.points_count} points) -> "
+        f"{args.target} ({args.dimension}d), "
+        f"{'re-embedding' if gemini else 'truncating'}"
+    )
+
+    start = time.perf_counter()
+    migrated, offset = 0, None
+    while True:
+        records, offset = await source.client.scroll(
+            collection_name=args.source,
+            limit=SCROLL_SIZE,
+            offset=offset,
+            with_payload=True,
+            with_vectors=gemini is None,
+        )
+        if not records:
+            break
+
+        if gemini:
+            embeddings = await gemini.generate_embeddings(
+                contents=[record.payload.get("content") or "" for record in records],
+                task="RETRIEVAL_DOCUMENT",
+            )
+        else:
+            embeddings = [
+                truncate_embedding(
+                    QdrantService.dense_vector(record.vector), args.dimension
+                )
+                for record in records
+            ]
+        await target.upsert_document(
+            [
+                DocumentInput(
+                    id=str(record.id),
+                    embedding=embedding,
+                    sparse_embedding=document_sparse_embedding(
+                        record.payload.get("content") or ""
+                    ),
+                    metadata=DocumentMetadata(**record.payload),
+                )
+                for record, embedding in zip(records, embeddings)
+            ],
+            wait=False,
+        )
+        migrated += len(records)
+        print(f"migrated {migrated} points ({time.perf_counter() - start:.1f}s)")
+        if offset is None:
+            break
+
+    await target.wait_for_upserts()
+    print(
+        f"done: set QDRANT_COLLECTION_NAME={args.target} and "
+        f"VECTOR_SIZE={args.dimension}, then restart the server"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--source", default=settings.QDRANT_COLLECTION_NAME)
+    parser.add_argument("--target", required=True)
+    parser.add_argument("--dimension", type=int, required=True)
+    parser.add_argument(
+        "--reembed",
+        action="store_true",
+        help="기존 벡터를 자르지 않고 청크 내용으로 다시 임베딩",
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,281 @@
+"""
+질문 임베딩으로 이전 답변을 재사용하는 의미 기반(semantic) 답변 캐시 모듈.
+답변은 별도의 작은 Qdrant 컬렉션에 (질문 임베딩, 사용자 그룹, 답변, 참고한 페이지의 수정 시간)으로 저장.
+같은 사용자 그룹의 질문과 cosine 유사도가 기준 이상이고, 참고한 페이지가 저장 이후 바뀌지 않았을 때만 적중.
+답변 저장은 응답을 지연시키지 않도록 백그라운드 task로 실행하며, TTL이 지나거나 최대 항목 수를 넘은
+답변은 `evict_interval`마다 한 번씩 오래된 순서로 삭제 (항목 수는 근사값 사용).
+캐시 오류는 답변 생성에 영향을 주지 않도록 로그만 남기고 캐시 미스로 처리.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import List, Optional, Sequence, Set
+from qdrant_client import models
+from qdrant_client.http.exceptions import UnexpectedResponse
+from core.config import settings
+from crud.page_sync_state import get_page_sync_states
+from db.database import async_session
+from schemas.schemas import Document
+from services.qdrant_service import QdrantService
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerCache:
+    def __init__(
+        self,
+        qdrant: QdrantService,
+        similarity_threshold: float,
+        ttl: float,
+        max_entries: int,
+        evict_interval: float,
+    ):
+        # 문서 컬렉션(최신 수정 시간 조회용)과 같은 서버의 별도 컬렉션 사용
+        self.qdrant = qdrant
+        self.client = qdrant.client
+        self.collection_name = f"{qdrant.collection_name}_answer_cache"
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.evict_interval = evict_interval
+        self._ready = False
+        # 동시에 들어온 첫 요청들이 컬렉션을 중복 생성하지 않도록 보호
+        self._ready_lock = asyncio.Lock()
+        self._last_evicted_at: Optional[float] = None
+        # 실행 중인 백그라운드 저장 task (완료 전에 GC되지 않도록 참조 유지)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def _ensure_collection(self) -> None:
+        if self._ready:
+            return
+        async with self._ready_lock:
+            if self._ready:
+                return
+            if await self.client.collection_exists(self.collection_name):
+                self._ready = True
+                return
+            try:
+                await self.client.create_collection(
+                    collection_name=self.collection_name,
+                    vectors_config=models.VectorParams(
+                        size=self.qdrant.vector_size, distance=models.Distance.COSINE
+                    ),
+                )
+            except UnexpectedResponse as e:
+                # 다른 프로세스가 먼저 생성한 경우 (인덱스도 그 프로세스가 생성)
+                if e.status_code != 409:
+                    raise
+                self._ready = True
+                return
+            await self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name="user_group",
+                field_schema=models.PayloadSchemaType.KEYWORD,
+            )
+            # TTL 필터 및 오래된 순서 정렬(order_by)용
+            await self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name="created_at",
+                field_schema=models.PayloadSchemaType.FLOAT,
+                wait=True,
+            )
+            self._ready = True
+
+    async def _is_page_changed(self, page: dict) -> bool:
+        """답변 저장 이후 페이지가 다시 수집되었거나(벡터 DB) 수정이 감지되었는지(동기화 상태) 여부."""
+        records, _ = await self.client.scroll(
+            collection_name=self.qdrant.collection_name,
+            scroll_filter=models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key="datasource",
+                        match=models.MatchValue(value=page["datasource"]),
+                    ),
+                    models.FieldCondition(
+                        key="page_id", match=models.MatchValue(value=page["page_id"])
+                    ),
+                ]
+            ),
+            limit=1,
+            with_payload=["updated_at"],
+            with_vectors=False,
+        )
+        if not records or records[0].payload.get("updated_at") != page["updated_at"]:
+            return True
+        if not settings.DOCUMENT_SYNC_ENABLED:
+            return False
+
+        async with async_session() as session:
+            states = await get_page_sync_states(
+                session, page["datasource"], [page["page_id"]]
+            )
+        return any(
+            state.last_edited_time and state.last_edited_time > page["updated_at"]
+            for state in states
+        )
+
+    async def lookup(self, embedding: List[float], user_group: str) -> Optional[str]:
+        """가장 유사한 캐시 답변이 기준을 만족하면 반환, 아니면 None."""
+        try:
+            await self._ensure_collection()
+            result = await self.client.query_points(
+                collection_name=self.collection_name,
+                query=embedding,
+                query_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key="user_group", match=models.MatchValue(value=user_group)
+                        ),
+                        models.FieldCondition(
+                            key="created_at",
+                            range=models.Range(gte=time.time() - self.ttl),
+                        ),
+                    ]
+                ),
+                score_threshold=self.similarity_threshold,
+                limit=1,
+                with_payload=True,
+            )
+            if not result.points:
+                return None
+
+            point = result.points[0]
+            pages = point.payload.get("pages") or []
+            changed = await asyncio.gather(
+                *[self._is_page_changed(page) for page in pages]
+            )
+            if any(changed):
+                await self.client.delete(
+                    collection_name=self.collection_name,
+                    points_selector=models.PointIdsList(points=[point.id]),
+                )
+                return None
+            return point.payload.get("answer")
+        except Exception as e:
+            logger.warning(f"Answer cache lookup failed: {e}")
+            return None
+
+    async def store(
+        self,
+        question: str,
+        embedding: List[float],
+        user_group: str,
+        answer: str,
+        context: Optional[Sequence[Document]],
+    ) -> None:
+        """답변과 참고한 페이지의 수정 시간을 저장하고, 정리 간격이 지났으면 오래된 답변 삭제."""
+        try:
+            await self._ensure_collection()
+            pages = {
+                (document.datasource, document.page_id): document.updated_at
+                for document in context or []
+            }
+            await self.client.upsert(
+                collection_name=self.collection_name,
+                points=[
+                    models.PointStruct(
+                        id=str(uuid.uuid4()),
+                        vector=embedding,
+                        payload={
+                            "question": question,
+                            "user_group": user_group,
+                            "answer": answer,
+                            "pages": [
+                                {
+                                    "datasource": datasource,
+                                    "page_id": page_id,
+                                    "updated_at": updated_at,
+                                }
+                                for (datasource, page_id), updated_at in pages.items()
+                            ],
+                            "created_at": time.time(),
+                        },
+                    )
+                ],
+                wait=False,
+            )
+
+            now = time.monotonic()
+            if (
+                self._last_evicted_at is None
+                or now - self._last_evicted_at >= self.evict_interval
+            ):
+                # 동시에 저장된 다른 답변이 중복으로 정리하지 않도록 먼저 기록
+                self._last_evicted_at = now
+                await self._evict()
+        except Exception as e:
+            logger.warning(f"Answer cache store failed: {e}")
+
+    def store_in_background(
+        self,
+        question: str,
+        embedding: List[float],
+        user_group: str,
+        answer: str,
+        context: Optional[Sequence[Document]],
+    ) -> None:
+        """응답을 기다리게 하지 않도록 `store`를 백그라운드 task로 실행."""
+        task = asyncio.create_task(
+            self.store(
+                question=question,
+                embedding=embedding,
+                user_group=user_group,
+                answer=answer,
+                context=context,
+            )
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _evict(self) -> None:
+        await self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key="created_at", range=models.Range(lt=time.time() - self.ttl)
+                    )
+                ]
+            ),
+        )
+        # 정확한 개수는 필요 없으므로 근사값 사용
+        count = (
+            await self.client.count(collection_name=self.collection_name, exact=False)
+        ).count
+        if count <= self.max_entries:
+            return
+
+        records, _ = await self.client.scroll(
+            collection_name=self.collection_name,
+            limit=count - self.max_entries,
+            order_by=models.OrderBy(key="created_at", direction=models.Direction.ASC),
+            with_payload=False,
+            with_vectors=False,
+        )
+        await self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=models.PointIdsList(
+                points=[record.id for record in records]
+            ),
+        )
+
+
+_answer_cache: Optional[AnswerCache] = None
+
+
+def get_answer_cache() -> Optional[AnswerCache]:
+    """프로세스 전역 답변 캐시 반환. 비활성화된 경우 None."""
+    global _answer_cache
+    if not settings.ANSWER_CACHE_ENABLED:
+        return None
+    if _answer_cache is None:
+        _answer_cache = AnswerCache(
+            qdrant=QdrantService(),
+            similarity_threshold=settings.ANSWER_CACHE_SIMILARITY_THRESHOLD,
+            ttl=settings.ANSWER_CACHE_TTL,
+            max_entries=settings.ANSWER_CACHE_MAX_ENTRIES,
+            evict_interval=settings.ANSWER_CACHE_EVICT_INTERVAL,
+        )
+    return _answer_cache
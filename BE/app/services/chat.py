@@ -3,6 +3,7 @@
 RAG 그래프를 이용한 스트리밍 응답 생성, 대화 내역 조회/저장/삭제 기능을 제공합니다.
 """
 
+from typing import Optional
 from langchain_core.messages import HumanMessage, AIMessage
 from rag_graph.edge import get_graph
 from rag_graph.state import GraphState
@@ -17,7 +18,12 @@ from crud.conversation import (
 from crud.chatmessage import get_message_list, create_message_list
 
 
-async def stream_graph_events(user_id: str, messages: list[str], session: AsyncSession):
+async def stream_graph_events(
+    user_id: str,
+    messages: list[str],
+    session: AsyncSession,
+    hybrid_search: Optional[bool] = None,
+):
     """
     RAG 그래프를 통해 채팅 응답을 스트리밍으로 생성합니다.
 
@@ -25,6 +31,7 @@ async def stream_graph_events(user_id: str, messages: list[str], session: AsyncS
         user_id (str): 현재 사용자 ID.
         messages (list[str]): 사용자와 AI가 주고받은 메시지 목록.
         session (AsyncSession): 데이터베이스 세션.
+        hybrid_search (Optional[bool]): 하이브리드 검색 사용 여부. None이면 서버 설정을 따름.
 
     Yields:
         str: AI 모델이 생성하는 응답 스트림의 각 청크(chunk).
@@ -39,13 +46,20 @@ async def stream_graph_events(user_id: str, messages: list[str], session: AsyncS
     ]
 
     async for event in graph.astream_events(
-        input=GraphState(messages=base_messages, authority_group=user.user_group_id)
+        input=GraphState(
+            messages=base_messages,
+            user_group=user.user_group_id,
+            hybrid_search=hybrid_search,
+        )
     ):
         kind = event["event"]
         if kind == "on_chat_model_stream":
             content = event["data"]["chunk"].content
             if content:
                 yield content
+        # 답변 캐시 적중 시 저장된 답변을 그대로 전송
+        elif kind == "on_custom_event" and event["name"] == "cached_answer":
+            yield event["data"]["answer"]
 
 
 async def get_conversation_by_user_id(user_id: str, session: AsyncSession):
@@ -4,31 +4,90 @@
 """
 
 from services.qdrant_service import QdrantService
+from services.ingestion_job import (
+    ingestion_job_manager,
+    refresh_ingestion_job_status,
+)
 from crud.document import (
     get_document_list,
-    create_document_info,
     delete_document_info_by_page_id,
     update_document_info,
 )
+from crud.ingestion_job import (
+    create_ingestion_job,
+    get_ingestion_job,
+    get_ingestion_job_pages,
+    update_ingestion_job,
+    update_ingestion_job_pages_status,
+)
+from crud.page_sync_state import (
+    delete_page_sync_states_by_root,
+    get_page_sync_states_by_root,
+)
+from api.v1.schemas.document import (
+    DocumentResponse,
+    IngestionJobResponse,
+    IngestionJobPageResponse,
+)
+from core.exception import CustomException, ExceptionCase
 from schemas.schemas import DocumentMetadata
-from utils.data_loader import get_data_loader
 from utils.datasource_url import extract_page_id
-from db.models import DataSource, DocumentTB
+from db.models import (
+    ChunkStrategy,
+    DataSource,
+    IngestionJob,
+    IngestionJobPage,
+    JobStatus,
+)
 from db.database import AsyncSession
 
 
 async def get_documents(session: AsyncSession, datasource: DataSource | None = None):
     """
-    데이터베이스에 저장된 문서 목록을 조회합니다.
+    데이터베이스에 저장된 문서 목록을 하위 페이지의 동기화 상태와 함께 조회합니다.
 
     Args:
         session (AsyncSession): 데이터베이스 세션.
         datasource (DataSource | None, optional): 필터링할 데이터 소스.
 
     Returns:
-        list[DocumentTB]: 문서 정보 객체 목록.
+        list[DocumentResponse]: 문서 정보 목록.
     """
-    return await get_document_list(session=session, datasource=datasource)
+    documents = await get_document_list(session=session, datasource=datasource)
+    page_states = await get_page_sync_states_by_root(
+        session,
+        datasource.value if datasource else None,
+        [document.page_id for document in documents],
+    )
+
+    document_list = []
+    for document in documents:
+        states = [
+            state
+            for state in page_states
+            if state.root_page_id == document.page_id
+            and state.datasource == document.datasource
+        ]
+        edited_times = [
+            state.last_edited_time for state in states if state.last_edited_time
+        ]
+        ingested_dates = [
+            state.last_ingested_date for state in states if state.last_ingested_date
+        ]
+        document_list.append(
+            DocumentResponse(
+                **document.model_dump(),
+                page_count=len(states),
+                chunk_count=sum(state.chunk_count for state in states),
+                last_edited_time=max(edited_times, default=None),
+                last_ingested_date=max(ingested_dates, default=None),
+                is_latest=all(
+                    state.last_edited_time == state.ingested_edited_time
+                    for state in states
+                ),
+            )
+        )
+    return document_list
 
 
 async def upload_documents(
@@ -36,41 +95,213 @@ async def upload_documents(
     user_groups: list[str],
     document_urls: list[str],
     session: AsyncSession,
+    incremental: bool = True,
+    chunk_strategy: ChunkStrategy = ChunkStrategy.CHARACTER,
+    user_id: str | None = None,
 ):
     """
-    지정된 URL의 문서를 로드하여 벡터 저장소에 업로드하고,
-    관련 메타데이터를 데이터베이스에 저장합니다.
+    지정된 URL의 문서들을 업로드하는 백그라운드 수집 작업을 생성합니다.
+    실제 로드/임베딩/업로드는 수집 워커가 문서(URL) 단위로 동시에 처리하며,
+    한 문서가 실패해도 나머지 문서는 계속 처리됩니다. 문서별 결과는 작업 상태 조회로 확인합니다.
+    페이지 ID를 추출할 수 없는 URL은 실패로, 같은 페이지를 가리키는 중복 URL은 생략으로 기록됩니다.
 
     Args:
         datasource (DataSource): 문서의 데이터 소스 (예: notion).
         user_groups (list[str]): 문서에 접근 권한을 가질 사용자 그룹 목록.
         document_urls (list[str]): 업로드할 문서의 URL 목록.
         session (AsyncSession): 데이터베이스 세션.
+        incremental (bool, optional): 변경된 청크만 업로드할지 여부. Defaults to True.
+        chunk_strategy (ChunkStrategy, optional): 청킹 전략. Defaults to ChunkStrategy.CHARACTER.
+        user_id (str | None, optional): 작업을 요청한 사용자 ID. Defaults to None.
 
     Returns:
-        str: 성공 메시지 "Success".
+        str: 생성된 수집 작업의 ID.
     """
+    job = IngestionJob(
+        datasource=datasource.value,
+        user_groups=user_groups,
+        incremental=incremental,
+        chunk_strategy=chunk_strategy,
+        user_id=user_id,
+    )
+    pages = []
+    seen_urls = {}
+    for url in document_urls:
+        try:
+            page_id = extract_page_id(url, datasource)
+        except CustomException as e:
+            pages.append(
+                IngestionJobPage(
+                    url=url, page_id="", status=JobStatus.FAILED, error=e.detail
+                )
+            )
+            continue
+        if page_id in seen_urls:
+            pages.append(
+                IngestionJobPage(
+                    url=url,
+                    page_id=page_id,
+                    status=JobStatus.SKIPPED,
+                    error=f"Duplicate of {seen_urls[page_id]}",
+                )
+            )
+            continue
+        seen_urls[page_id] = url
+        pages.append(IngestionJobPage(url=url, page_id=page_id))
 
-    data_loader = get_data_loader(datasource=datasource)
+    created_job = await create_ingestion_job(session=session, job=job, pages=pages)
 
-    page_id_list = [extract_page_id(url, datasource) for url in document_urls]
+    pending_page_ids = [page.id for page in pages if page.status == JobStatus.PENDING]
+    if pending_page_ids:
+        ingestion_job_manager.enqueue(pending_page_ids)
+    else:
+        await refresh_ingestion_job_status(session, created_job.id)
+
+    return created_job.id
+
+
+async def get_ingestion_job_status(job_id: str, session: AsyncSession):
+    """
+    수집 작업의 진행 상태와 문서별 처리 통계를 조회합니다.
 
-    documents = [
-        DocumentTB(
-            page_id=page_id,
-            datasource=datasource.value,
-            user_groups=user_groups,
+    Args:
+        job_id (str): 작업 ID.
+        session (AsyncSession): 데이터베이스 세션.
+
+    Raises:
+        CustomException: 작업이 존재하지 않을 경우 발생.
+
+    Returns:
+        IngestionJobResponse: 작업 상태 응답 객체.
+    """
+    job = await get_ingestion_job(session, job_id)
+    if not job:
+        raise CustomException(
+            exception_case=ExceptionCase.JOB_NOT_FOUND, detail=f"Job {job_id}"
         )
-        for page_id in page_id_list
+    pages = await get_ingestion_job_pages(session, job_id)
+
+    def throughput(count: int, seconds: float) -> float:
+        return count / seconds if seconds else 0.0
+
+    page_responses = [
+        IngestionJobPageResponse(
+            **page.model_dump(),
+            embed_throughput=throughput(page.embedded_count, page.embed_seconds),
+            upsert_throughput=throughput(page.upserted_count, page.upsert_seconds),
+        )
+        for page in pages
     ]
-    await create_document_info(session=session, documents=documents)
+    page_status_counts = {}
+    for page in pages:
+        page_status_counts[page.status.value] = (
+            page_status_counts.get(page.status.value, 0) + 1
+        )
+
+    embedded_count = sum(page.embedded_count for page in pages)
+    upserted_count = sum(page.upserted_count for page in pages)
+    return IngestionJobResponse(
+        id=job.id,
+        status=job.status,
+        datasource=job.datasource,
+        user_groups=job.user_groups,
+        incremental=job.incremental,
+        chunk_strategy=job.chunk_strategy,
+        page_status_counts=page_status_counts,
+        chunk_count=sum(page.chunk_count for page in pages),
+        embedded_count=embedded_count,
+        upserted_count=upserted_count,
+        deleted_count=sum(page.deleted_count for page in pages),
+        embed_throughput=throughput(
+            embedded_count, sum(page.embed_seconds for page in pages)
+        ),
+        upsert_throughput=throughput(
+            upserted_count, sum(page.upsert_seconds for page in pages)
+        ),
+        pages=page_responses,
+        created_date=job.created_date,
+        finished_date=job.finished_date,
+    )
+
+
+async def cancel_ingestion_job(job_id: str, session: AsyncSession):
+    """
+    수집 작업을 취소합니다. 대기 중인 문서는 처리하지 않고, 처리 중인 문서는 중단합니다.
+    이미 성공한 문서의 결과는 유지됩니다.
 
-    for page_id in page_id_list:
-        await data_loader.upload_documents(page_id=page_id, user_groups=user_groups)
+    Args:
+        job_id (str): 취소할 작업 ID.
+        session (AsyncSession): 데이터베이스 세션.
+
+    Raises:
+        CustomException: 작업이 존재하지 않을 경우 발생.
+
+    Returns:
+        str: 성공 메시지 "Success".
+    """
+    job = await get_ingestion_job(session, job_id)
+    if not job:
+        raise CustomException(
+            exception_case=ExceptionCase.JOB_NOT_FOUND, detail=f"Job {job_id}"
+        )
+    job.status = JobStatus.CANCELLED
+    await update_ingestion_job(session, job)
+
+    await update_ingestion_job_pages_status(
+        session=session,
+        job_id=job_id,
+        from_status=[JobStatus.PENDING],
+        to_status=JobStatus.CANCELLED,
+    )
+    running_page_ids = [
+        page.id
+        for page in await get_ingestion_job_pages(session, job_id)
+        if page.status == JobStatus.RUNNING
+    ]
+    ingestion_job_manager.cancel_running(running_page_ids)
+    await refresh_ingestion_job_status(session, job_id)
 
     return "Success"
 
 
+async def retry_ingestion_job(job_id: str, session: AsyncSession):
+    """
+    수집 작업에서 실패하거나 취소된 문서만 다시 처리합니다.
+    이미 성공한 문서와 페이지 ID를 추출할 수 없던 URL은 다시 처리하지 않습니다.
+
+    Args:
+        job_id (str): 재시도할 작업 ID.
+        session (AsyncSession): 데이터베이스 세션.
+
+    Raises:
+        CustomException: 작업이 존재하지 않을 경우 발생.
+
+    Returns:
+        list[str]: 다시 처리할 작업 페이지 ID 목록.
+    """
+    job = await get_ingestion_job(session, job_id)
+    if not job:
+        raise CustomException(
+            exception_case=ExceptionCase.JOB_NOT_FOUND, detail=f"Job {job_id}"
+        )
+
+    retry_page_ids = await update_ingestion_job_pages_status(
+        session=session,
+        job_id=job_id,
+        from_status=[JobStatus.FAILED, JobStatus.CANCELLED],
+        to_status=JobStatus.PENDING,
+        # 페이지 ID를 추출할 수 없던 URL은 다시 처리해도 실패하므로 제외
+        require_page_id=True,
+    )
+    if retry_page_ids:
+        job.status = JobStatus.PENDING
+        job.finished_date = None
+        await update_ingestion_job(session, job)
+        ingestion_job_manager.enqueue(retry_page_ids)
+
+    return retry_page_ids
+
+
 async def delete_documents(
     datasource: DataSource, page_ids: list[str], session: AsyncSession
 ):
@@ -91,12 +322,19 @@ async def delete_documents(
         session=session, page_ids=page_ids, datasource=datasource.value
     )
 
-    for page_id in page_ids:
+    # 하위 페이지를 포함해 문서로부터 수집된 모든 페이지의 청크 삭제
+    page_states = await get_page_sync_states_by_root(
+        session, datasource.value, page_ids
+    )
+    for page_id in set(page_ids) | {state.page_id for state in page_states}:
         await qdrant.delete_document(
             conditions=DocumentMetadata(
                 datasource=datasource.value, page_id=page_id
             ).model_dump(exclude_none=True)
         )
+    await delete_page_sync_states_by_root(
+        session=session, datasource=datasource.value, root_page_ids=page_ids
+    )
 
     return "Success"
 
@@ -128,10 +366,14 @@ async def update_document_user_groups(
         user_groups=user_groups,
     )
 
-    await qdrant.update_document_payload(
-        datasource=datasource,
-        page_id=page_id,
-        update_metadata=DocumentMetadata(user_groups=user_groups),
+    page_states = await get_page_sync_states_by_root(
+        session, datasource.value, [page_id]
     )
+    for state_page_id in {page_id} | {state.page_id for state in page_states}:
+        await qdrant.update_document_payload(
+            datasource=datasource,
+            page_id=state_page_id,
+            update_metadata=DocumentMetadata(user_groups=user_groups),
+        )
 
     return "Success"
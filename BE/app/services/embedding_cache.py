@@ -0,0 +1,154 @@
+"""
+청크 텍스트 -> 임베딩 벡터 매핑을 로컬 디스크(SQLite)에 저장하는 캐시 모듈.
+키는 (청크 텍스트, 임베딩 모델, task type, 출력 차원)의 해시이며,
+최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 삭제.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional
+from core.config import settings
+
+
+class EmbeddingCache:
+    # 한 번에 조회할 최대 키 개수 (SQLite 바인딩 변수 제한)
+    QUERY_CHUNK_SIZE = 500
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        # 삭제 시 최대 항목 수보다 10% 더 비워서 매 저장마다 삭제가 일어나지 않도록 함
+        self.evict_slack = max(1, max_entries // 10)
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS embedding (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embedding_accessed_at "
+            "ON embedding (accessed_at)"
+        )
+        # 항목 수는 열 때 한 번만 세고 이후 저장/삭제로 갱신 (매 저장마다 전체 테이블을 세지 않음).
+        # 같은 파일을 쓰는 다른 워커의 저장은 반영되지 않으므로 삭제 직전에 정확한 개수로 다시 맞춤
+        self._size = self._count()
+
+    @staticmethod
+    def make_key(content: str, model: str, task: str, dimension: int) -> str:
+        raw = json.dumps([model, task, dimension, content], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """키 목록에 해당하는 벡터 조회. 없는 키는 결과에 포함되지 않음."""
+        unique_keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            now = time.time()
+            for start in range(0, len(unique_keys), self.QUERY_CHUNK_SIZE):
+                end = start + self.QUERY_CHUNK_SIZE
+                chunk = unique_keys[start:end]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embedding WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+                if rows:
+                    self._conn.execute(
+                        "UPDATE embedding SET accessed_at = ? "
+                        f"WHERE key IN ({','.join('?' * len(rows))})",
+                        [now, *[key for key, _ in rows]],
+                    )
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def _count(self) -> int:
+        (size,) = self._conn.execute("SELECT COUNT(*) FROM embedding").fetchone()
+        return size
+
+    def put_many(self, items: Dict[str, List[float]]) -> None:
+        """벡터 저장 후 최대 항목 수를 넘으면 오래된 항목 삭제."""
+        if not items:
+            return
+        with self._lock:
+            now = time.time()
+            # 키가 내용의 해시이므로 이미 있는 키는 같은 벡터. 새로 추가된 행만 센다
+            changes_before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embedding (key, vector, accessed_at) "
+                "VALUES (?, ?, ?)",
+                [
+                    (key, array("f", vector).tobytes(), now)
+                    for key, vector in items.items()
+                ],
+            )
+            self._size += self._conn.total_changes - changes_before
+            if self._size <= self.max_entries:
+                return
+
+            self._size = self._count()
+            if self._size > self.max_entries:
+                changes_before = self._conn.total_changes
+                self._conn.execute(
+                    "DELETE FROM embedding WHERE key IN ("
+                    "SELECT key FROM embedding ORDER BY accessed_at ASC LIMIT ?)",
+                    (self._size - self.max_entries + self.evict_slack,),
+                )
+                self._size -= self._conn.total_changes - changes_before
+
+    async def aget_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        return await asyncio.to_thread(self.get_many, keys)
+
+    async def aput_many(self, items: Dict[str, List[float]]) -> None:
+        await asyncio.to_thread(self.put_many, items)
+
+    def size(self) -> int:
+        """이 프로세스가 추적하는 항목 수 (다른 워커의 저장은 다음 삭제 시 반영)."""
+        return self._size
+
+    @property
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": self._size,
+        }
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """프로세스 전역 임베딩 캐시 반환. 비활성화된 경우 None."""
+    global _embedding_cache
+    if not settings.EMBEDDING_CACHE_ENABLED:
+        return None
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(
+            path=settings.EMBEDDING_CACHE_PATH,
+            max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+        )
+    return _embedding_cache
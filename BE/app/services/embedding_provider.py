@@ -0,0 +1,213 @@
+"""
+임베딩 생성 백엔드(provider) 모듈.
+- gemini: Gemini API (gemini-embedding-001)
+- sentence_transformers: 로컬 경로의 sentence-transformers 모델을 CPU 스레드 풀에서 실행
+- hashing: 토큰/글자 n-gram을 해싱하는 결정적(deterministic) 임베딩 (오프라인 테스트/벤치마크용)
+
+provider는 `EMBEDDING_PROVIDER` 설정으로 선택하며, Gemini 클라이언트와 provider는 프로세스마다 한 번만 생성.
+"""
+
+import asyncio
+import hashlib
+import math
+import re
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Literal, Optional
+from google import genai
+from google.genai import types
+from core.config import settings
+
+EmbeddingTask = Literal["RETRIEVAL_DOCUMENT", "RETRIEVAL_QUERY"]
+
+# gemini-embedding-001의 전체 출력 차원
+GEMINI_EMBEDDING_DIMENSION = 3072
+
+
+class EmbeddingProvider(ABC):
+    """
+    텍스트 목록을 전체 차원(`dimension`) 임베딩 목록으로 변환하는 백엔드.
+    `model_name`은 임베딩 캐시 키에 사용되므로 모델이 바뀌면 달라져야 함.
+    """
+
+    model_name: str
+    dimension: int
+
+    @abstractmethod
+    async def embed(
+        self, contents: List[str], task: EmbeddingTask
+    ) -> List[List[float]]: ...
+
+
+class GeminiEmbeddingProvider(EmbeddingProvider):
+    def __init__(self, client: genai.Client):
+        self.client = client
+        self.model_name = "gemini-embedding-001"
+        self.dimension = GEMINI_EMBEDDING_DIMENSION
+
+    async def embed(
+        self, contents: List[str], task: EmbeddingTask
+    ) -> List[List[float]]:
+        result = await self.client.aio.models.embed_content(
+            model=self.model_name,
+            contents=contents,
+            config=types.EmbedContentConfig(task_type=task),
+        )
+        return [embedding.values for embedding in result.embeddings]
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """CPU 작업인 임베딩을 이벤트 루프 밖의 스레드 풀에서 `batch_size`개씩 실행."""
+
+    def __init__(self, threads: int, batch_size: int):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, threads), thread_name_prefix="embedding"
+        )
+        self.batch_size = max(1, batch_size)
+
+    @abstractmethod
+    def _embed_sync(
+        self, contents: List[str], task: EmbeddingTask
+    ) -> List[List[float]]: ...
+
+    async def embed(
+        self, contents: List[str], task: EmbeddingTask
+    ) -> List[List[float]]:
+        loop = asyncio.get_running_loop()
+        batch_results = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    self.executor,
+                    self._embed_sync,
+                    contents[start : start + self.batch_size],
+                    task,
+                )
+                for start in range(0, len(contents), self.batch_size)
+            ]
+        )
+        return [embedding for batch in batch_results for embedding in batch]
+
+
+class SentenceTransformerEmbeddingProvider(LocalEmbeddingProvider):
+    """
+    로컬 경로의 sentence-transformers 모델 (예: multilingual-e5, bge-m3).
+    모델에 따라 질의/문서 앞에 붙이는 prefix(예: "query: ", "passage: ")를 설정할 수 있음.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        threads: int,
+        batch_size: int,
+        query_prefix: str = "",
+        document_prefix: str = "",
+    ):
+        # 선택 의존성이므로 사용할 때만 import
+        from sentence_transformers import SentenceTransformer
+
+        super().__init__(threads=threads, batch_size=batch_size)
+        self.model = SentenceTransformer(model_path, device="cpu")
+        self.model_name = f"sentence-transformers:{model_path}"
+        self.dimension = self.model.get_sentence_embedding_dimension()
+        self.prefixes = {
+            "RETRIEVAL_QUERY": query_prefix,
+            "RETRIEVAL_DOCUMENT": document_prefix,
+        }
+
+    def _embed_sync(
+        self, contents: List[str], task: EmbeddingTask
+    ) -> List[List[float]]:
+        prefix = self.prefixes[task]
+        embeddings = self.model.encode(
+            [prefix + content for content in contents],
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        )
+        return embeddings.tolist()
+
+
+class HashingEmbeddingProvider(LocalEmbeddingProvider):
+    """
+    단어와 글자 3-gram을 `dimension`개의 버킷으로 해싱한 L2 정규화 벡터.
+    의미를 학습한 임베딩은 아니지만 같은 입력은 항상 같은 벡터가 되고 어휘가 겹칠수록 유사도가 높음.
+    """
+
+    TOKEN_PATTERN = re.compile(r"\w+")
+
+    def __init__(self, dimension: int, threads: int, batch_size: int):
+        super().__init__(threads=threads, batch_size=batch_size)
+        self.model_name = f"hashing-{dimension}"
+        self.dimension = dimension
+
+    def _features(self, content: str) -> List[str]:
+        tokens = self.TOKEN_PATTERN.findall(content.lower())
+        features = [f"w:{token}" for token in tokens]
+        for token in tokens:
+            padded = f"#{token}#"
+            features.extend(
+                f"c:{padded[i : i + 3]}" for i in range(max(1, len(padded) - 2))
+            )
+        return features
+
+    def _embed_one(self, content: str) -> List[float]:
+        vector = [0.0] * self.dimension
+        for feature in self._features(content):
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            # 부호 해싱으로 버킷 충돌에 의한 편향을 줄임
+            vector[value % self.dimension] += 1.0 if value >> 63 else -1.0
+        norm = math.sqrt(sum(value * value for value in vector))
+        return [value / norm for value in vector] if norm else vector
+
+    def _embed_sync(
+        self, contents: List[str], task: EmbeddingTask
+    ) -> List[List[float]]:
+        return [self._embed_one(content) for content in contents]
+
+
+_gemini_client: Optional[genai.Client] = None
+_gemini_provider: Optional[EmbeddingProvider] = None
+_local_provider: Optional[EmbeddingProvider] = None
+
+
+def get_gemini_client() -> genai.Client:
+    """프로세스 전역으로 공유하는 Gemini API 클라이언트 반환."""
+    global _gemini_client
+    if _gemini_client is None:
+        _gemini_client = genai.Client(api_key=settings.GEMINI_API_KEY)
+    return _gemini_client
+
+
+def get_embedding_provider() -> EmbeddingProvider:
+    """`EMBEDDING_PROVIDER` 설정에 맞는 provider 반환. provider는 프로세스 전역으로 공유."""
+    global _gemini_provider, _local_provider
+    if settings.EMBEDDING_PROVIDER == "gemini":
+        if _gemini_provider is None:
+            _gemini_provider = GeminiEmbeddingProvider(get_gemini_client())
+        return _gemini_provider
+
+    if _local_provider is None:
+        if settings.EMBEDDING_PROVIDER == "sentence_transformers":
+            if not settings.EMBEDDING_LOCAL_MODEL_PATH:
+                raise ValueError(
+                    "EMBEDDING_LOCAL_MODEL_PATH is required for sentence_transformers"
+                )
+            _local_provider = SentenceTransformerEmbeddingProvider(
+                model_path=settings.EMBEDDING_LOCAL_MODEL_PATH,
+                threads=settings.EMBEDDING_LOCAL_THREADS,
+                batch_size=settings.EMBEDDING_LOCAL_BATCH_SIZE,
+                query_prefix=settings.EMBEDDING_LOCAL_QUERY_PREFIX,
+                document_prefix=settings.EMBEDDING_LOCAL_DOCUMENT_PREFIX,
+            )
+        elif settings.EMBEDDING_PROVIDER == "hashing":
+            _local_provider = HashingEmbeddingProvider(
+                dimension=settings.VECTOR_SIZE,
+                threads=settings.EMBEDDING_LOCAL_THREADS,
+                batch_size=settings.EMBEDDING_LOCAL_BATCH_SIZE,
+            )
+        else:
+            raise ValueError(
+                f"Unknown embedding provider: {settings.EMBEDDING_PROVIDER}"
+            )
+    return _local_provider
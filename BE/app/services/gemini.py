@@ -2,14 +2,28 @@
 Gemini 서비스 객체 생성 모듈
 """
 
+import asyncio
+import math
 from typing import Literal, List
-from google import genai
-from google.genai import types
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import BaseMessage
 from typing import Sequence
 from core.config import settings
 from core.exception import CustomException, ExceptionCase
+from services.embedding_cache import get_embedding_cache
+from services.embedding_provider import get_embedding_provider, get_gemini_client
+
+
+def truncate_embedding(embedding: List[float], dimension: int) -> List[float]:
+    """
+    Matryoshka 임베딩을 앞쪽 `dimension`차원만 남기고 L2 정규화 (cosine 유사도 유지).
+    문서와 질의 임베딩 모두 전체 차원 벡터에서 같은 방식으로 잘라 일관성을 보장.
+    """
+    if len(embedding) <= dimension:
+        return embedding
+    truncated = embedding[:dimension]
+    norm = math.sqrt(sum(value * value for value in truncated))
+    return [value / norm for value in truncated] if norm else truncated
 
 
 class GeminiService:
@@ -19,10 +33,19 @@ class GeminiService:
             "gemini-2.0-flash", "gemini-2.0-flash-lite"
         ] = "gemini-2.0-flash",
     ):
-        self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
+        self.client = get_gemini_client()
         self.vector_size = settings.VECTOR_SIZE
         self.model_name = model
-        self.embedding_model_name = "gemini-embedding-001"
+        # 임베딩은 EMBEDDING_PROVIDER 설정에 따라 Gemini API 또는 로컬 모델로 생성
+        self.embedding_provider = get_embedding_provider()
+        self.embedding_model_name = self.embedding_provider.model_name
+        if not 0 < self.vector_size <= self.embedding_provider.dimension:
+            raise CustomException(
+                exception_case=ExceptionCase.INVALID_INPUT,
+                detail=f"VECTOR_SIZE must be between 1 and "
+                f"{self.embedding_provider.dimension} for {self.embedding_model_name}",
+            )
+        self.embedding_cache = get_embedding_cache()
 
         # langgraph 모델
         self.model = ChatGoogleGenerativeAI(
@@ -47,19 +70,114 @@ class GeminiService:
                 exception_case=ExceptionCase.GEMINI_ERROR, detail=str(e)
             )
 
+    def _embedding_cache_key(self, content: str, task: str) -> str:
+        return self.embedding_cache.make_key(
+            content=content,
+            model=self.embedding_model_name,
+            task=task,
+            # 캐시에는 전체 차원 벡터를 저장하므로 VECTOR_SIZE를 바꿔도 재사용 가능
+            dimension=self.embedding_provider.dimension,
+        )
+
     async def generate_embedding(
-        self, contents: str, task: Literal["RETRIEVAL_DOCUMENT", "RETRIEVAL_QUERY"]
+        self,
+        contents: str,
+        task: Literal["RETRIEVAL_DOCUMENT", "RETRIEVAL_QUERY"],
+        use_cache: bool = True,
     ) -> List[float]:
         """
         low-level gemini api
+        `use_cache=False`이면 임베딩 캐시(SQLite)를 조회/저장하지 않음.
+        """
+        use_cache = use_cache and self.embedding_cache is not None
+        try:
+            if use_cache:
+                cache_key = self._embedding_cache_key(contents, task)
+                cached = await self.embedding_cache.aget_many([cache_key])
+                if cache_key in cached:
+                    return truncate_embedding(cached[cache_key], self.vector_size)
+
+            embedding = (await self.embedding_provider.embed([contents], task))[0]
+
+            if use_cache:
+                await self.embedding_cache.aput_many({cache_key: embedding})
+            return truncate_embedding(embedding, self.vector_size)
+        except Exception as e:
+            raise CustomException(
+                exception_case=ExceptionCase.GEMINI_ERROR, detail=str(e)
+            )
+
+    async def generate_embeddings(
+        self,
+        contents: List[str],
+        task: Literal["RETRIEVAL_DOCUMENT", "RETRIEVAL_QUERY"],
+        batch_size: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> List[List[float]]:
+        """
+        여러 텍스트를 배치 단위로 묶어 임베딩. (embed_content 1회 호출 = 1배치)
+        캐시에 있는 텍스트와 중복 텍스트는 제외하고 호출하며,
+        배치들은 최대 `max_concurrency`개까지 동시에 호출됨. 결과는 입력 순서를 유지.
         """
+        batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+        semaphore = asyncio.Semaphore(
+            max_concurrency or settings.EMBEDDING_MAX_CONCURRENCY
+        )
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                embeddings = await self.embedding_provider.embed(batch, task)
+            if len(embeddings) != len(batch):
+                raise ValueError(
+                    f"Expected {len(batch)} embeddings, got {len(embeddings)}"
+                )
+            return embeddings
+
         try:
-            result = await self.client.aio.models.embed_content(
-                model=self.embedding_model_name,
-                contents=contents,
-                config=types.EmbedContentConfig(task_type=task),
+            embedding_by_content = {}
+            if self.embedding_cache:
+                cache_keys = {
+                    content: self._embedding_cache_key(content, task)
+                    for content in contents
+                }
+                cached = await self.embedding_cache.aget_many(
+                    [cache_keys[content] for content in contents]
+                )
+                for content, cache_key in cache_keys.items():
+                    if cache_key in cached:
+                        embedding_by_content[content] = cached[cache_key]
+
+            missing_contents = [
+                content
+                for content in dict.fromkeys(contents)
+                if content not in embedding_by_content
+            ]
+            batches = []
+            for start in range(0, len(missing_contents), batch_size):
+                end = start + batch_size
+                batches.append(missing_contents[start:end])
+            batch_results = await asyncio.gather(
+                *[embed_batch(batch) for batch in batches]
+            )
+            new_embeddings = dict(
+                zip(
+                    missing_contents,
+                    [embedding for batch in batch_results for embedding in batch],
+                )
             )
-            return result.embeddings[0].values
+            embedding_by_content.update(new_embeddings)
+
+            if self.embedding_cache and new_embeddings:
+                await self.embedding_cache.aput_many(
+                    {
+                        cache_keys[content]: embedding
+                        for content, embedding in new_embeddings.items()
+                    }
+                )
+            return [
+                truncate_embedding(embedding_by_content[content], self.vector_size)
+                for content in contents
+            ]
         except Exception as e:
             raise CustomException(
                 exception_case=ExceptionCase.GEMINI_ERROR, detail=str(e)
@@ -0,0 +1,466 @@
+"""
+문서 수집(ingestion) 작업을 백그라운드에서 처리하는 서비스 모듈입니다.
+작업과 작업 페이지는 MySQL에 저장되며, 프로세스 내 asyncio 워커 풀이 대기 중인 페이지를 처리합니다.
+처리 중인 페이지는 워커 ID와 lease(heartbeat)로 소유권을 표시하므로, 여러 프로세스가 떠 있어도
+lease가 만료된 페이지만 다시 처리합니다.
+"""
+
+import asyncio
+import datetime
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Awaitable, Callable, Optional
+from core.config import settings
+from crud.document import (
+    get_document_info_by_page_id,
+    create_document_info,
+    update_document_info,
+)
+from crud.ingestion_checkpoint import (
+    delete_ingestion_checkpoints,
+    get_ingestion_checkpoints,
+    save_ingestion_checkpoint,
+)
+from crud.page_sync_state import (
+    delete_page_sync_states,
+    get_page_sync_states,
+    get_page_sync_states_by_root,
+    save_page_sync_states,
+)
+from crud.ingestion_job import (
+    claim_ingestion_job_page,
+    get_ingestion_job,
+    get_ingestion_job_page,
+    get_ingestion_job_pages,
+    get_pending_job_page_ids,
+    heartbeat_ingestion_job_page,
+    reset_expired_job_pages,
+    update_ingestion_job,
+    update_ingestion_job_page,
+)
+from db.database import AsyncSession, async_session
+from db.models import ChunkStrategy, DataSource, DocumentTB, JobStatus
+from schemas.schemas import IngestionStats, PageCheckpoint
+from utils.data_loader import get_data_loader
+
+logger = logging.getLogger(__name__)
+
+
+async def ingest_document(
+    datasource: DataSource,
+    page_id: str,
+    user_groups: list[str],
+    session: AsyncSession,
+    incremental: bool = True,
+    progress_callback: Optional[Callable[[IngestionStats], Awaitable[None]]] = None,
+    chunk_strategy: ChunkStrategy = ChunkStrategy.CHARACTER,
+    checkpoints: Optional[dict[str, PageCheckpoint]] = None,
+    checkpoint_callback: Optional[Callable[[PageCheckpoint], Awaitable[None]]] = None,
+) -> IngestionStats:
+    """
+    단일 문서를 벡터 저장소와 동기화한 뒤, 문서 정보와 페이지별 동기화 상태를 데이터베이스에 등록합니다.
+    이미 등록된 문서는 사용자 그룹과 청킹 전략을 갱신합니다.
+
+    Args:
+        datasource (DataSource): 문서의 데이터 소스 (예: notion).
+        page_id (str): 문서의 페이지 ID.
+        user_groups (list[str]): 문서에 접근 권한을 가질 사용자 그룹 목록.
+        session (AsyncSession): 데이터베이스 세션.
+        incremental (bool, optional): 변경된 청크만 업로드할지 여부. Defaults to True.
+        progress_callback (Callable, optional): 배치 업로드마다 중간 통계를 받는 콜백.
+        chunk_strategy (ChunkStrategy, optional): 청킹 전략. Defaults to ChunkStrategy.CHARACTER.
+        checkpoints (dict, optional): 이전 시도에서 업로드가 끝난 페이지의 체크포인트.
+        checkpoint_callback (Callable, optional): 페이지 업로드가 끝날 때마다 체크포인트를 받는 콜백.
+
+    Returns:
+        IngestionStats: 수집 통계. 이미 등록된 문서의 벡터가 바뀌지 않았으면 `unchanged = True`.
+    """
+    document = await get_document_info_by_page_id(
+        session=session, datasource=datasource.value, page_id=page_id
+    )
+
+    # 접근 권한이 같으면 내용 해시가 같은 페이지는 업로드 생략.
+    # 권한이 바뀌어도 트리에서 빠진 페이지를 정리할 수 있도록 기존 페이지 목록은 넘김
+    known_pages = None
+    same_user_groups = bool(document) and sorted(document.user_groups) == sorted(
+        user_groups
+    )
+    if document:
+        known_pages = {
+            state.page_id: (
+                state.ingested_edited_time,
+                state.content_hash if same_user_groups else None,
+            )
+            for state in await get_page_sync_states_by_root(
+                session, datasource.value, [page_id]
+            )
+        }
+
+    data_loader = get_data_loader(datasource=datasource)
+    stats = await data_loader.upload_documents(
+        page_id=page_id,
+        user_groups=user_groups,
+        incremental=incremental,
+        progress_callback=progress_callback,
+        known_pages=known_pages,
+        chunk_strategy=chunk_strategy,
+        checkpoints=checkpoints,
+        checkpoint_callback=checkpoint_callback,
+    )
+    stats.unchanged = (
+        same_user_groups
+        and not checkpoints
+        and stats.upserted_count == 0
+        and stats.deleted_count == 0
+    )
+
+    if document:
+        await update_document_info(
+            session=session,
+            datasource=datasource.value,
+            page_id=page_id,
+            user_groups=user_groups,
+            chunk_strategy=chunk_strategy,
+        )
+    else:
+        await create_document_info(
+            session=session,
+            documents=[
+                DocumentTB(
+                    page_id=page_id,
+                    datasource=datasource.value,
+                    user_groups=user_groups,
+                    chunk_strategy=chunk_strategy,
+                )
+            ],
+        )
+    await save_page_sync_states(
+        session=session,
+        datasource=datasource.value,
+        root_page_id=page_id,
+        pages=stats.pages,
+    )
+    await delete_page_sync_states(
+        session=session,
+        datasource=datasource.value,
+        page_ids=stats.removed_page_ids,
+    )
+    return stats
+
+
+async def sync_document_page(
+    datasource: DataSource,
+    page_id: str,
+    root_page_id: str,
+    user_groups: list[str],
+    session: AsyncSession,
+    incremental: bool = True,
+    progress_callback: Optional[Callable[[IngestionStats], Awaitable[None]]] = None,
+    chunk_strategy: ChunkStrategy = ChunkStrategy.CHARACTER,
+) -> IngestionStats:
+    """
+    변경 감지 동기화로 찾은 페이지 하나를 다시 수집하고, 등록 문서(루트 페이지)의 페이지 동기화 상태로 기록합니다.
+    하위 페이지는 각각 따로 감지되므로 페이지 단위(recursive_page=False)로 수집하며, 문서 정보는 변경하지 않습니다.
+
+    Args:
+        datasource (DataSource): 문서의 데이터 소스 (예: notion).
+        page_id (str): 다시 수집할 페이지 ID.
+        root_page_id (str): 페이지가 속한 등록 문서의 페이지 ID.
+        user_groups (list[str]): 문서에 접근 권한을 가질 사용자 그룹 목록.
+        session (AsyncSession): 데이터베이스 세션.
+        incremental (bool, optional): 변경된 청크만 업로드할지 여부. Defaults to True.
+        progress_callback (Callable, optional): 배치 업로드마다 중간 통계를 받는 콜백.
+        chunk_strategy (ChunkStrategy, optional): 청킹 전략. Defaults to ChunkStrategy.CHARACTER.
+
+    Returns:
+        IngestionStats: 수집 통계. 벡터가 바뀌지 않았으면 `unchanged = True`.
+    """
+    page_states = await get_page_sync_states(
+        session, datasource.value, list({page_id, page_id.replace("-", "")})
+    )
+
+    data_loader = get_data_loader(datasource=datasource)
+    stats = await data_loader.upload_documents(
+        page_id=page_id,
+        user_groups=user_groups,
+        recursive_page=False,
+        incremental=incremental,
+        progress_callback=progress_callback,
+        known_pages={
+            state.page_id: (state.ingested_edited_time, state.content_hash)
+            for state in page_states
+        },
+        chunk_strategy=chunk_strategy,
+        is_root_page=page_id.replace("-", "") == root_page_id.replace("-", ""),
+    )
+    stats.unchanged = stats.upserted_count == 0 and stats.deleted_count == 0
+
+    await save_page_sync_states(
+        session=session,
+        datasource=datasource.value,
+        root_page_id=root_page_id,
+        pages=stats.pages,
+    )
+    await delete_page_sync_states(
+        session=session,
+        datasource=datasource.value,
+        page_ids=stats.removed_page_ids,
+    )
+    return stats
+
+
+async def refresh_ingestion_job_status(session: AsyncSession, job_id: str):
+    """
+    작업 페이지들의 상태로부터 작업 전체의 상태를 다시 계산합니다.
+
+    Args:
+        session (AsyncSession): 데이터베이스 세션.
+        job_id (str): 작업 ID.
+
+    Returns:
+        IngestionJob: 상태가 갱신된 작업 객체.
+    """
+    job = await get_ingestion_job(session, job_id)
+    page_statuses = {
+        page.status for page in await get_ingestion_job_pages(session, job_id)
+    }
+    in_progress = page_statuses & {JobStatus.PENDING, JobStatus.RUNNING}
+
+    if job.status == JobStatus.CANCELLED:
+        pass
+    elif in_progress:
+        job.status = JobStatus.RUNNING
+    elif JobStatus.FAILED in page_statuses:
+        job.status = JobStatus.FAILED
+    elif JobStatus.CANCELLED in page_statuses:
+        job.status = JobStatus.CANCELLED
+    else:
+        job.status = JobStatus.SUCCEEDED
+
+    if not in_progress and not job.finished_date:
+        job.finished_date = datetime.datetime.now(datetime.timezone.utc)
+    return await update_ingestion_job(session, job)
+
+
+class IngestionJobManager:
+    """
+    대기 중인 작업 페이지를 처리하는 프로세스 내 워커 풀.
+    페이지 단위로 처리하므로 취소/재시도 시 이미 성공한 페이지는 다시 처리하지 않음.
+    처리 중 업로드가 끝난 하위 페이지는 체크포인트로 기록되어, 재시작/재시도 시 이어서 처리함.
+    """
+
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+        # 프로세스마다 고유한 ID (작업 페이지의 소유 워커로 기록)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.queue: asyncio.Queue[str] = asyncio.Queue()
+        self.workers: list[asyncio.Task] = []
+        # 처리 중인 작업 페이지 ID -> asyncio task (취소용)
+        self.running: dict[str, asyncio.Task] = {}
+
+    async def start(self) -> None:
+        """
+        lease가 만료된 페이지를 대기 상태로 되돌리고, 대기 중인 페이지를 큐에 넣은 뒤 워커 시작.
+        다른 프로세스가 처리 중인 페이지는 건드리지 않으며, 이후에도 주기적으로 만료된 페이지를 회수.
+        """
+        async with async_session() as session:
+            await reset_expired_job_pages(session, settings.INGESTION_LEASE_SECONDS)
+            self.enqueue(await get_pending_job_page_ids(session))
+        self.workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.concurrency)
+        ]
+        self.workers.append(asyncio.create_task(self._reclaim_expired()))
+
+    async def _reclaim_expired(self) -> None:
+        """처리하던 프로세스가 종료되어 lease가 만료된 페이지를 주기적으로 다시 처리."""
+        while True:
+            await asyncio.sleep(settings.INGESTION_LEASE_SECONDS)
+            try:
+                async with async_session() as session:
+                    page_ids = await reset_expired_job_pages(
+                        session, settings.INGESTION_LEASE_SECONDS
+                    )
+                if page_ids:
+                    logger.info(f"Reclaimed {len(page_ids)} expired ingestion pages")
+                    self.enqueue(page_ids)
+            except Exception:
+                logger.exception("Failed to reclaim expired ingestion pages")
+
+    async def _heartbeat(self, job_page_id: str) -> None:
+        """처리 중인 페이지의 lease 갱신. 다른 워커가 가져간 경우 이 프로세스의 처리를 중단."""
+        while True:
+            await asyncio.sleep(settings.INGESTION_HEARTBEAT_INTERVAL)
+            try:
+                async with async_session() as session:
+                    owned = await heartbeat_ingestion_job_page(
+                        session, job_page_id, self.worker_id
+                    )
+            except Exception:
+                logger.exception(f"Heartbeat failed (job_page_id={job_page_id})")
+                continue
+            if not owned:
+                logger.warning(
+                    f"Lost lease on ingestion job page {job_page_id}, stopping"
+                )
+                task = self.running.get(job_page_id)
+                if task:
+                    task.cancel()
+                return
+
+    async def stop(self) -> None:
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    def enqueue(self, job_page_ids: list[str]) -> None:
+        for job_page_id in job_page_ids:
+            self.queue.put_nowait(job_page_id)
+
+    def cancel_running(self, job_page_ids: list[str]) -> None:
+        for job_page_id in job_page_ids:
+            task = self.running.get(job_page_id)
+            if task:
+                task.cancel()
+
+    async def _worker(self) -> None:
+        while True:
+            job_page_id = await self.queue.get()
+            task = asyncio.create_task(self._process_page(job_page_id))
+            self.running[job_page_id] = task
+            try:
+                # 페이지 task가 취소되어도 워커는 계속 동작
+                await asyncio.wait([task])
+                if not task.cancelled() and task.exception():
+                    logger.error(
+                        f"Ingestion job page {job_page_id} crashed: {task.exception()}"
+                    )
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            finally:
+                self.running.pop(job_page_id, None)
+                self.queue.task_done()
+
+    async def _process_page(self, job_page_id: str) -> None:
+        result = {}
+        async with async_session() as session:
+            if not await claim_ingestion_job_page(session, job_page_id, self.worker_id):
+                return
+            job_page = await get_ingestion_job_page(session, job_page_id)
+            job = await get_ingestion_job(session, job_page.job_id)
+
+            heartbeat = asyncio.create_task(self._heartbeat(job_page_id))
+            try:
+                if job.status == JobStatus.CANCELLED:
+                    result["status"] = JobStatus.CANCELLED
+                    return
+                if job.status == JobStatus.PENDING:
+                    job.status = JobStatus.RUNNING
+                    await update_ingestion_job(session, job)
+
+                checkpoints, checkpoint_callback = None, None
+                if settings.INGESTION_CHECKPOINT_ENABLED:
+                    checkpoints = await get_ingestion_checkpoints(session, job_page_id)
+                    checkpoint_callback = self._checkpoint_writer(job_page_id)
+                    if checkpoints:
+                        logger.info(
+                            f"Resuming ingestion job page {job_page_id} "
+                            f"from {len(checkpoints)} checkpointed pages"
+                        )
+
+                if job.root_page_id:
+                    stats = await sync_document_page(
+                        datasource=job.datasource,
+                        page_id=job_page.page_id,
+                        root_page_id=job.root_page_id,
+                        user_groups=job.user_groups,
+                        session=session,
+                        incremental=job.incremental,
+                        progress_callback=self._progress_reporter(job_page_id),
+                        chunk_strategy=job.chunk_strategy,
+                    )
+                else:
+                    stats = await ingest_document(
+                        datasource=job.datasource,
+                        page_id=job_page.page_id,
+                        user_groups=job.user_groups,
+                        session=session,
+                        incremental=job.incremental,
+                        progress_callback=self._progress_reporter(job_page_id),
+                        chunk_strategy=job.chunk_strategy,
+                        checkpoints=checkpoints,
+                        checkpoint_callback=checkpoint_callback,
+                    )
+                await delete_ingestion_checkpoints(session, job_page_id)
+                result.update(stats.model_dump())
+                result["status"] = (
+                    JobStatus.SKIPPED if stats.unchanged else JobStatus.SUCCEEDED
+                )
+            except asyncio.CancelledError:
+                result["status"] = JobStatus.CANCELLED
+                raise
+            except Exception as e:
+                logger.exception(f"Ingestion failed (page_id={job_page.page_id})")
+                result["status"] = JobStatus.FAILED
+                result["error"] = str(e)
+            finally:
+                heartbeat.cancel()
+                await self._save_result(job_page_id, result)
+
+    def _progress_reporter(
+        self, job_page_id: str
+    ) -> Callable[[IngestionStats], Awaitable[None]]:
+        """처리 중인 페이지의 중간 통계를 일정 간격으로 기록하는 콜백 생성."""
+        last_saved = time.monotonic()
+
+        async def report(stats: IngestionStats) -> None:
+            nonlocal last_saved
+            now = time.monotonic()
+            if now - last_saved < settings.INGESTION_PROGRESS_INTERVAL:
+                return
+            last_saved = now
+            async with async_session() as session:
+                job_page = await get_ingestion_job_page(session, job_page_id)
+                for key, value in stats.model_dump().items():
+                    setattr(job_page, key, value)
+                await update_ingestion_job_page(session, job_page)
+
+        return report
+
+    def _checkpoint_writer(
+        self, job_page_id: str
+    ) -> Callable[[PageCheckpoint], Awaitable[None]]:
+        """업로드가 끝난 페이지를 체크포인트로 기록하는 콜백 생성."""
+
+        async def write(checkpoint: PageCheckpoint) -> None:
+            async with async_session() as session:
+                await save_ingestion_checkpoint(session, job_page_id, checkpoint)
+
+        return write
+
+    async def _save_result(self, job_page_id: str, result: dict) -> None:
+        # 취소/에러 이후에도 안전하게 기록하도록 새 세션 사용
+        async with async_session() as session:
+            job_page = await get_ingestion_job_page(session, job_page_id)
+            if job_page.worker_id != self.worker_id:
+                # lease가 만료되어 다른 워커가 처리 중이면 그 결과를 덮어쓰지 않음
+                logger.warning(
+                    f"Ingestion job page {job_page_id} is owned by {job_page.worker_id}, "
+                    "result discarded"
+                )
+                return
+            for key, value in result.items():
+                setattr(job_page, key, value)
+            job_page.worker_id = None
+            job_page.finished_date = datetime.datetime.now(datetime.timezone.utc)
+            await update_ingestion_job_page(session, job_page)
+            await refresh_ingestion_job_status(session, job_page.job_id)
+
+
+ingestion_job_manager = IngestionJobManager(
+    concurrency=settings.INGESTION_WORKER_CONCURRENCY
+)
@@ -1,10 +1,31 @@
-from typing import List, Union
+import asyncio
+import logging
+import time
+from typing import List, Optional, Set, Union
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import Distance, PointStruct
 from qdrant_client import models
 from core.config import settings
 from core.exception import CustomException, ExceptionCase
-from schemas.schemas import DocumentInput, DocumentOutput, DocumentMetadata
+from schemas.schemas import (
+    DocumentInput,
+    DocumentOutput,
+    DocumentMetadata,
+    SparseEmbedding,
+)
+
+logger = logging.getLogger(__name__)
+
+# 검색(ACL)/삭제/갱신 필터에 사용하는 payload 필드의 인덱스 타입
+PAYLOAD_INDEXES = {
+    "user_groups": models.PayloadSchemaType.KEYWORD,
+    "page_id": models.PayloadSchemaType.KEYWORD,
+    "datasource": models.PayloadSchemaType.KEYWORD,
+    "updated_at": models.PayloadSchemaType.DATETIME,
+}
+
+# 하이브리드 검색용 BM25 sparse 벡터 이름 (dense 벡터는 이름 없는 기본 벡터 "")
+SPARSE_VECTOR_NAME = "bm25"
 
 
 class QdrantService:
@@ -13,6 +34,25 @@ class QdrantService:
         self.collection_name = settings.QDRANT_COLLECTION_NAME
         self.vector_size = settings.VECTOR_SIZE
         self.client = AsyncQdrantClient(url=self.url)
+        self.upsert_batch_size = settings.QDRANT_UPSERT_BATCH_SIZE
+        self.upsert_concurrency = settings.QDRANT_UPSERT_CONCURRENCY
+        self.upsert_max_retries = settings.QDRANT_UPSERT_MAX_RETRIES
+        self.upsert_wait = settings.QDRANT_UPSERT_WAIT
+        # `wait=False`로 보낸 뒤 반영 완료를 확인하지 않은 마지막 point (consistency barrier용)
+        self._unconfirmed_point: Optional[PointStruct] = None
+
+        self.quantization = settings.QDRANT_QUANTIZATION
+        self.quantization_always_ram = settings.QDRANT_QUANTIZATION_ALWAYS_RAM
+        self.vectors_on_disk = settings.QDRANT_VECTORS_ON_DISK
+        self.hnsw_m = settings.QDRANT_HNSW_M
+        self.hnsw_ef_construct = settings.QDRANT_HNSW_EF_CONSTRUCT
+        self.hnsw_on_disk = settings.QDRANT_HNSW_ON_DISK
+        self.search_hnsw_ef = settings.QDRANT_SEARCH_HNSW_EF
+        self.search_rescore = settings.QDRANT_SEARCH_RESCORE
+        self.search_oversampling = settings.QDRANT_SEARCH_OVERSAMPLING
+        self.hybrid_prefetch_k = settings.HYBRID_PREFETCH_K
+        # 컬렉션에 sparse 벡터 설정이 있는지 여부 (처음 필요할 때 조회)
+        self._sparse_available: Optional[bool] = None
 
         if settings.DISTANCE_METRIC == "DOT":
             self.distance_metric = Distance.DOT
@@ -27,85 +67,393 @@ class QdrantService:
                 ExceptionCase.INVALID_INPUT, detail="Invalid distance metric"
             )
 
+    def _quantization_config(self) -> Optional[models.QuantizationConfig]:
+        if self.quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    always_ram=self.quantization_always_ram,
+                )
+            )
+        if self.quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(
+                    always_ram=self.quantization_always_ram
+                )
+            )
+        return None
+
+    def _hnsw_config(self) -> models.HnswConfigDiff:
+        return models.HnswConfigDiff(
+            m=self.hnsw_m,
+            ef_construct=self.hnsw_ef_construct,
+            on_disk=self.hnsw_on_disk,
+        )
+
+    def _search_params(self) -> Optional[models.SearchParams]:
+        quantization = None
+        if self.quantization != "none":
+            quantization = models.QuantizationSearchParams(
+                rescore=self.search_rescore,
+                oversampling=self.search_oversampling,
+            )
+        if quantization is None and self.search_hnsw_ef is None:
+            return None
+        return models.SearchParams(
+            hnsw_ef=self.search_hnsw_ef, quantization=quantization
+        )
+
+    async def has_sparse_vectors(self) -> bool:
+        """컬렉션에 BM25 sparse 벡터 설정이 있는지 여부 (하이브리드 검색 가능 여부)."""
+        if self._sparse_available is None:
+            info = await self.client.get_collection(self.collection_name)
+            self._sparse_available = SPARSE_VECTOR_NAME in (
+                info.config.params.sparse_vectors or {}
+            )
+        return self._sparse_available
+
     async def get_or_create_collection(self) -> None:
-        """시스템 시작 시 컬렉션 확인 및 생성"""
+        """
+        시스템 시작 시 컬렉션 확인 및 생성. 이미 있으면 저장 설정 변경분을 반영.
+        두 경우 모두 필터용 payload 인덱스가 있는지 확인하고 없으면 생성.
+        sparse 벡터는 기존 컬렉션에 추가할 수 없으므로, 설정이 없는 컬렉션은 dense 검색만 사용.
+        """
         try:
             if not await self.client.collection_exists(self.collection_name):
                 await self.client.create_collection(
                     collection_name=self.collection_name,
-                    vectors_config={
-                        "size": self.vector_size,
-                        "distance": self.distance_metric,
+                    vectors_config=models.VectorParams(
+                        size=self.vector_size,
+                        distance=self.distance_metric,
+                        on_disk=self.vectors_on_disk,
+                    ),
+                    sparse_vectors_config={
+                        SPARSE_VECTOR_NAME: models.SparseVectorParams(
+                            modifier=models.Modifier.IDF
+                        )
                     },
+                    hnsw_config=self._hnsw_config(),
+                    quantization_config=self._quantization_config(),
                 )
+            else:
+                await self.check_vector_size()
+                await self.migrate_collection_config()
+                if not await self.has_sparse_vectors():
+                    logger.warning(
+                        f"Collection {self.collection_name} has no sparse vectors, "
+                        "so hybrid search falls back to dense search. "
+                        "Run `python -m scripts.migrate_embedding_dimension` "
+                        "to copy it into a new collection."
+                    )
+            await self.ensure_payload_indexes()
         except Exception as e:
             raise CustomException(
                 exception_case=ExceptionCase.VECTOR_DB_INIT_ERROR, detail=str(e)
             )
 
-    async def upsert_document(self, documents: List[DocumentInput]) -> None:
-        """문서 청크 업로드"""
+    async def ensure_payload_indexes(self) -> List[str]:
+        """
+        `PAYLOAD_INDEXES`의 payload 인덱스가 없거나 타입이 다르면 생성한 뒤 생성 여부를 검증.
+
+        Returns:
+            List[str]: 새로 생성한 인덱스의 필드 이름 목록.
+        """
+        info = await self.client.get_collection(self.collection_name)
+        created = []
+        for field_name, schema_type in PAYLOAD_INDEXES.items():
+            index_info = info.payload_schema.get(field_name)
+            if index_info and index_info.data_type == schema_type:
+                continue
+            await self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field_name,
+                field_schema=schema_type,
+                wait=True,
+            )
+            created.append(field_name)
+
+        if created:
+            info = await self.client.get_collection(self.collection_name)
+            missing = [
+                field_name
+                for field_name, schema_type in PAYLOAD_INDEXES.items()
+                if getattr(info.payload_schema.get(field_name), "data_type", None)
+                != schema_type
+            ]
+            if missing:
+                raise ValueError(f"Failed to create payload indexes: {missing}")
+            logger.info(f"Created payload indexes on {self.collection_name}: {created}")
+        return created
+
+    async def check_vector_size(self) -> None:
+        """기존 컬렉션의 벡터 차원이 설정(VECTOR_SIZE)과 다르면 에러 (차원은 변경할 수 없음)."""
+        info = await self.client.get_collection(self.collection_name)
+        size = info.config.params.vectors.size
+        if size != self.vector_size:
+            raise ValueError(
+                f"Collection {self.collection_name} has {size}-dimensional vectors "
+                f"but VECTOR_SIZE is {self.vector_size}. "
+                "Run `python -m scripts.migrate_embedding_dimension` to copy it "
+                "into a new collection and set QDRANT_COLLECTION_NAME."
+            )
+
+    async def migrate_collection_config(self) -> bool:
+        """
+        기존 컬렉션의 양자화, 원본 벡터 디스크 저장, HNSW 설정이 현재 설정과 다르면 변경.
+        Qdrant가 백그라운드에서 세그먼트를 재구성하며, 그동안에도 검색은 가능함.
+
+        Returns:
+            bool: 설정을 변경했으면 True.
+        """
+        info = await self.client.get_collection(self.collection_name)
+        params = info.config.params.vectors
+        hnsw = info.config.hnsw_config
+        quantization = self._quantization_config()
+
+        current_quantization = info.config.quantization_config
+        quantization_changed = (current_quantization is None) != (
+            quantization is None
+        ) or (
+            quantization is not None
+            and current_quantization.model_dump() != quantization.model_dump()
+        )
+        hnsw_changed = (
+            (self.hnsw_m is not None and hnsw.m != self.hnsw_m)
+            or (
+                self.hnsw_ef_construct is not None
+                and hnsw.ef_construct != self.hnsw_ef_construct
+            )
+            or bool(hnsw.on_disk) != self.hnsw_on_disk
+        )
+        on_disk_changed = bool(params.on_disk) != self.vectors_on_disk
+        if not (quantization_changed or hnsw_changed or on_disk_changed):
+            return False
+
+        await self.client.update_collection(
+            collection_name=self.collection_name,
+            vectors_config=(
+                {"": models.VectorParamsDiff(on_disk=self.vectors_on_disk)}
+                if on_disk_changed
+                else None
+            ),
+            hnsw_config=self._hnsw_config() if hnsw_changed else None,
+            quantization_config=(
+                (quantization or models.Disabled.DISABLED)
+                if quantization_changed
+                else None
+            ),
+        )
+        logger.info(
+            f"Migrated Qdrant collection {self.collection_name}: "
+            f"quantization={self.quantization}, vectors_on_disk={self.vectors_on_disk}, "
+            f"hnsw(m={self.hnsw_m}, ef_construct={self.hnsw_ef_construct}, "
+            f"on_disk={self.hnsw_on_disk})"
+        )
+        return True
+
+    async def _upsert_batch(self, points: List[PointStruct], wait: bool) -> None:
+        """point 배치 하나를 업로드. 실패하면 해당 배치만 지수 백오프로 재시도."""
+        for attempt in range(self.upsert_max_retries + 1):
+            try:
+                await self.client.upsert(
+                    collection_name=self.collection_name, points=points, wait=wait
+                )
+                return
+            except Exception as e:
+                if attempt == self.upsert_max_retries:
+                    raise
+                logger.warning(
+                    f"Qdrant upsert of {len(points)} points failed "
+                    f"(attempt {attempt + 1}): {e}"
+                )
+                await asyncio.sleep(2**attempt)
+
+    async def upsert_document(
+        self, documents: List[DocumentInput], wait: Optional[bool] = None
+    ) -> None:
+        """
+        문서 청크 업로드.
+        `QDRANT_UPSERT_BATCH_SIZE`개씩 나눈 배치를 최대 `QDRANT_UPSERT_CONCURRENCY`개 동시에 전송.
+        `wait=False`이면 반영 완료를 기다리지 않으므로, 검색 전에 `wait_for_upserts` 호출 필요.
+        """
+        wait = self.upsert_wait if wait is None else wait
         try:
+            with_sparse = (
+                any(document.sparse_embedding for document in documents)
+                and await self.has_sparse_vectors()
+            )
             points = [
                 PointStruct(
                     id=document.id,
-                    vector=document.embedding,
+                    vector=(
+                        {
+                            "": document.embedding,
+                            SPARSE_VECTOR_NAME: models.SparseVector(
+                                **document.sparse_embedding.model_dump()
+                            ),
+                        }
+                        if with_sparse and document.sparse_embedding
+                        else document.embedding
+                    ),
                     payload=document.metadata.model_dump(),
                 )
                 for document in documents
             ]
+            if not points:
+                return
 
-            await self.client.upsert(
-                collection_name=self.collection_name, points=points
+            start_time = time.perf_counter()
+            semaphore = asyncio.Semaphore(self.upsert_concurrency)
+
+            async def upsert(batch: List[PointStruct]) -> None:
+                async with semaphore:
+                    await self._upsert_batch(batch, wait=wait)
+
+            await asyncio.gather(
+                *[
+                    upsert(points[start : start + self.upsert_batch_size])
+                    for start in range(0, len(points), self.upsert_batch_size)
+                ]
+            )
+            if not wait:
+                self._unconfirmed_point = points[-1]
+
+            elapsed = time.perf_counter() - start_time
+            points_per_sec = len(points) / elapsed if elapsed else 0.0
+            logger.debug(
+                f"Upserted {len(points)} points in {elapsed:.3f}s "
+                f"({points_per_sec:.1f} points/sec, "
+                f"batch_size={self.upsert_batch_size}, wait={wait})"
+            )
+
+        except Exception as e:
+            raise CustomException(
+                exception_case=ExceptionCase.VECTOR_DB_OP_ERROR, detail=str(e)
             )
 
+    async def wait_for_upserts(self) -> None:
+        """
+        `wait=False`로 보낸 업로드가 모두 반영될 때까지 대기 (consistency barrier).
+        Qdrant는 업데이트를 순서대로 반영하므로, 마지막 point를 `wait=True`로 다시 업로드하면
+        이전 업로드도 모두 반영된 상태가 됨.
+        """
+        point, self._unconfirmed_point = self._unconfirmed_point, None
+        if point is None:
+            return
+        try:
+            await self._upsert_batch([point], wait=True)
         except Exception as e:
             raise CustomException(
                 exception_case=ExceptionCase.VECTOR_DB_OP_ERROR, detail=str(e)
             )
 
+    @staticmethod
+    def dense_vector(vector: Union[List[float], dict]) -> List[float]:
+        """조회한 point의 dense 벡터. sparse 벡터가 있는 컬렉션은 {벡터 이름: 벡터} 형태로 반환됨."""
+        return vector.get("") if isinstance(vector, dict) else vector
+
+    @staticmethod
+    def _query_filter(metadata: DocumentMetadata) -> models.Filter:
+        """검색 필터: 사용자 그룹 중 하나를 포함(should)하고 page_id/datasource가 일치(must)."""
+        must_filters = []
+        should_filters = []
+        for key, value in metadata.model_dump().items():
+            if key == "user_groups" and value:
+                for group in value:
+                    should_filters.append(
+                        models.FieldCondition(
+                            key=f"{key}[]", match=models.MatchValue(value=group)
+                        )
+                    )
+            if key == "page_id" and value:
+                must_filters.append(
+                    models.FieldCondition(key=key, match=models.MatchValue(value=value))
+                )
+            if key == "datasource" and value:
+                must_filters.append(
+                    models.FieldCondition(key=key, match=models.MatchValue(value=value))
+                )
+        return models.Filter(must=must_filters, should=should_filters)
+
     async def query_document(
         self,
         embedding: List[float] | None = None,
         metadata: DocumentMetadata | None = None,
+        limit: int = 10,
+        score_threshold: float | None = None,
+        with_vectors: bool = False,
+        sparse_embedding: SparseEmbedding | None = None,
     ) -> List[DocumentOutput]:
-        """임베딩 벡터로 문서 검색"""
+        """
+        임베딩 벡터로 문서 검색.
+        `sparse_embedding`이 주어지고 컬렉션에 sparse 벡터가 있으면 dense/sparse 검색 결과를
+        RRF(reciprocal rank fusion)로 결합한 하이브리드 검색을 수행 (점수는 RRF 점수).
+        RRF 점수는 유사도가 아니므로, 하이브리드 검색의 `score_threshold`는 결합 결과의 dense 유사도로 다시 확인해
+        BM25로만 찾은 관련 없는 문서도 dense 검색과 같은 기준으로 제외.
+
+        Args:
+            embedding: 질의 임베딩.
+            metadata: 필터 조건 (user_groups, page_id, datasource).
+            limit: 반환할 최대 문서 수.
+            score_threshold: 이 유사도(dense) 미만의 문서는 제외.
+            with_vectors: True이면 문서 임베딩을 함께 반환 (MMR 등 후처리용).
+            sparse_embedding: 질의의 BM25 sparse 벡터 (None이면 dense 검색만 수행).
+        """
         try:
-            metadata_dict = metadata.model_dump()
-            must_filters = []
-            should_filters = []
-            for key, value in metadata_dict.items():
-                if key == "user_groups" and value:
-                    for group in value:
-                        should_filters.append(
-                            models.FieldCondition(
-                                key=f"{key}[]", match=models.MatchValue(value=group)
-                            )
-                        )
-                if key == "page_id" and value:
-                    must_filters.append(
-                        models.FieldCondition(
-                            key=key, match=models.MatchValue(value=value)
-                        )
-                    )
-                if key == "datasource" and value:
-                    must_filters.append(
-                        models.FieldCondition(
-                            key=key, match=models.MatchValue(value=value)
-                        )
+            query_filter = self._query_filter(metadata)
+            # 질의에 단어가 없으면(sparse 벡터가 비어 있으면) dense 검색만 수행
+            if (
+                sparse_embedding
+                and sparse_embedding.indices
+                and await self.has_sparse_vectors()
+            ):
+                prefetch_limit = max(limit, self.hybrid_prefetch_k)
+                query_result = await self.client.query_points(
+                    collection_name=self.collection_name,
+                    prefetch=[
+                        models.Prefetch(
+                            query=embedding,
+                            filter=query_filter,
+                            params=self._search_params(),
+                            score_threshold=score_threshold,
+                            limit=prefetch_limit,
+                        ),
+                        models.Prefetch(
+                            query=models.SparseVector(**sparse_embedding.model_dump()),
+                            using=SPARSE_VECTOR_NAME,
+                            filter=query_filter,
+                            limit=prefetch_limit,
+                        ),
+                    ],
+                    query=models.FusionQuery(fusion=models.Fusion.RRF),
+                    limit=limit,
+                    with_vectors=with_vectors,
+                )
+                if score_threshold is not None and query_result.points:
+                    query_result.points = await self._filter_by_dense_score(
+                        embedding, query_result.points, score_threshold
                     )
-
-            query_result = await self.client.query_points(
-                collection_name=self.collection_name,
-                query=embedding,
-                query_filter=models.Filter(must=must_filters, should=should_filters),
-            )
+            else:
+                query_result = await self.client.query_points(
+                    collection_name=self.collection_name,
+                    query=embedding,
+                    query_filter=query_filter,
+                    search_params=self._search_params(),
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    with_vectors=with_vectors,
+                )
             query_points = query_result.points
             if not query_points:
                 return []
 
             query_documents = [
-                DocumentOutput(id=point.id, score=point.score, metadata=point.payload)
+                DocumentOutput(
+                    id=point.id,
+                    score=point.score,
+                    embedding=self.dense_vector(point.vector) if with_vectors else None,
+                    metadata=point.payload,
+                )
                 for point in query_points
             ]
             return query_documents
@@ -115,6 +463,26 @@ class QdrantService:
                 exception_case=ExceptionCase.VECTOR_DB_OP_ERROR, detail=str(e)
             )
 
+    async def _filter_by_dense_score(
+        self,
+        embedding: List[float],
+        points: List[models.ScoredPoint],
+        score_threshold: float,
+    ) -> List[models.ScoredPoint]:
+        """RRF 결합 결과 중 dense 유사도가 `score_threshold` 이상인 point만 결합 순서대로 반환."""
+        point_ids = [point.id for point in points]
+        result = await self.client.query_points(
+            collection_name=self.collection_name,
+            query=embedding,
+            query_filter=models.Filter(must=[models.HasIdCondition(has_id=point_ids)]),
+            # 후보가 적으므로 정확한 유사도로 비교
+            search_params=models.SearchParams(exact=True),
+            limit=len(point_ids),
+            score_threshold=score_threshold,
+        )
+        relevant_ids = {point.id for point in result.points}
+        return [point for point in points if point.id in relevant_ids]
+
     async def delete_document(self, conditions: Union[List[str], dict]) -> None:
         """Point ID로 문서 삭제"""
         try:
@@ -140,6 +508,38 @@ class QdrantService:
                 exception_case=ExceptionCase.VECTOR_DB_OP_ERROR, detail=str(e)
             )
 
+    async def get_point_ids(self, datasource: str, page_id: str) -> Set[str]:
+        """페이지에 저장된 모든 Point ID 조회 (payload, vector 제외)"""
+        try:
+            point_ids = set()
+            offset = None
+            while True:
+                records, offset = await self.client.scroll(
+                    collection_name=self.collection_name,
+                    scroll_filter=models.Filter(
+                        must=[
+                            models.FieldCondition(
+                                key="datasource",
+                                match=models.MatchValue(value=datasource),
+                            ),
+                            models.FieldCondition(
+                                key="page_id", match=models.MatchValue(value=page_id)
+                            ),
+                        ]
+                    ),
+                    limit=1000,
+                    offset=offset,
+                    with_payload=False,
+                    with_vectors=False,
+                )
+                point_ids.update(str(record.id) for record in records)
+                if offset is None:
+                    return point_ids
+        except Exception as e:
+            raise CustomException(
+                exception_case=ExceptionCase.VECTOR_DB_OP_ERROR, detail=str(e)
+            )
+
     async def update_document_payload(
         self, datasource: str, page_id: str, update_metadata: DocumentMetadata
     ) -> None:
@@ -148,7 +548,7 @@ class QdrantService:
             metadata = update_metadata.model_dump(exclude_none=True)
 
             await self.client.set_payload(
-                coolection_name=self.collection_name,
+                collection_name=self.collection_name,
                 payload=metadata,
                 points=models.Filter(
                     must=[
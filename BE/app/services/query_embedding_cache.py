@@ -0,0 +1,154 @@
+"""
+질의 임베딩을 프로세스 메모리에 저장하는 LRU + TTL 캐시 모듈.
+키는 (정규화한 질문, 임베딩 모델, 출력 차원)이며, 항목 수와 메모리 사용량(벡터 크기) 중
+하나라도 한도를 넘으면 가장 오래 사용되지 않은 항목부터 삭제.
+메모리 캐시에 없으면 임베딩 함수를 호출하고, 공유 저장소(SQLite 임베딩 캐시)를 사용하는 경우
+같은 서버의 다른 uvicorn 워커가 만든 임베딩도 재사용됨.
+"""
+
+import asyncio
+import functools
+import re
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from core.config import settings
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """유니코드 정규화(NFKC) 후 앞뒤 공백 제거, 연속 공백을 하나로 합침."""
+    return _WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFKC", question)).strip()
+
+
+class QueryEmbeddingCache:
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # key -> (벡터, 저장 시각). 순서가 LRU 순서 (앞쪽이 가장 오래 사용되지 않음)
+        self._entries: OrderedDict[Tuple[str, str, int], Tuple[array, float]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        # 같은 질문이 동시에 들어오면 임베딩을 한 번만 생성. key -> (임베딩 task, 시작 시각)
+        self._inflight: Dict[Tuple[str, str, int], Tuple[asyncio.Future, float]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.miss_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    @staticmethod
+    def _entry_bytes(key: Tuple[str, str, int], vector: array) -> int:
+        return vector.itemsize * len(vector) + len(key[0].encode("utf-8"))
+
+    def _pop(self, key: Tuple[str, str, int]) -> None:
+        vector, _ = self._entries.pop(key)
+        self._bytes -= self._entry_bytes(key, vector)
+
+    def get(self, key: Tuple[str, str, int]) -> Optional[List[float]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        vector, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl:
+            self._pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return vector.tolist()
+
+    def put(self, key: Tuple[str, str, int], embedding: List[float]) -> None:
+        if key in self._entries:
+            self._pop(key)
+        vector = array("f", embedding)
+        self._entries[key] = (vector, time.monotonic())
+        self._bytes += self._entry_bytes(key, vector)
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            self._pop(next(iter(self._entries)))
+
+    async def get_or_embed(
+        self,
+        question: str,
+        model: str,
+        dimension: int,
+        embed: Callable[[str], Awaitable[List[float]]],
+    ) -> List[float]:
+        """
+        캐시된 질의 임베딩 반환. 없으면 정규화한 질문으로 `embed`를 호출해서 저장.
+        캐시 적중 시 절약한 시간은 지금까지 캐시 미스의 평균 임베딩 시간으로 추정하고,
+        진행 중인 같은 질문의 임베딩을 기다린 경우(coalesced)는 이미 진행된 시간만큼 절약한 것으로 계산.
+        """
+        normalized = normalize_question(question)
+        key = (normalized, model, dimension)
+
+        embedding = self.get(key)
+        if embedding is not None:
+            self.hits += 1
+            if self.misses:
+                self.saved_seconds += self.miss_seconds / self.misses
+            return embedding
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            self.misses += 1
+            start_time = time.perf_counter()
+            task = asyncio.ensure_future(embed(normalized))
+            task.add_done_callback(
+                functools.partial(self._on_embedded, key, start_time)
+            )
+            self._inflight[key] = (task, start_time)
+        else:
+            task, start_time = inflight
+            self.coalesced += 1
+            self.saved_seconds += time.perf_counter() - start_time
+
+        # 먼저 요청한 쪽이 취소되어도 임베딩은 계속 진행되어 기다리는 요청이 결과를 받음
+        return list(await asyncio.shield(task))
+
+    def _on_embedded(
+        self, key: Tuple[str, str, int], start_time: float, task: asyncio.Future
+    ) -> None:
+        del self._inflight[key]
+        self.miss_seconds += time.perf_counter() - start_time
+        # 기다리는 요청이 없어도 "exception was never retrieved" 경고가 나지 않도록 예외를 확인
+        if task.cancelled() or task.exception() is not None:
+            return
+        self.put(key, task.result())
+
+    @property
+    def stats(self) -> dict:
+        total = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": self.hits / total if total else 0.0,
+            "saved_seconds": self.saved_seconds,
+            "avg_miss_seconds": self.miss_seconds / self.misses if self.misses else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+
+_query_embedding_cache: Optional[QueryEmbeddingCache] = None
+
+
+def get_query_embedding_cache() -> Optional[QueryEmbeddingCache]:
+    """프로세스 전역 질의 임베딩 캐시 반환. 비활성화된 경우 None."""
+    global _query_embedding_cache
+    if not settings.QUERY_EMBEDDING_CACHE_ENABLED:
+        return None
+    if _query_embedding_cache is None:
+        _query_embedding_cache = QueryEmbeddingCache(
+            max_entries=settings.QUERY_EMBEDDING_CACHE_MAX_ENTRIES,
+            max_bytes=int(settings.QUERY_EMBEDDING_CACHE_MAX_MB * 1024 * 1024),
+            ttl=settings.QUERY_EMBEDDING_CACHE_TTL,
+        )
+    return _query_embedding_cache
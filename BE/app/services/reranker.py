@@ -0,0 +1,113 @@
+"""
+검색된 청크를 질문 기준으로 다시 점수화하는 로컬 reranker 모듈.
+- bm25: 후보 청크 집합 안에서 계산한 BM25 점수 (모델 불필요, 수 ms)
+- cross_encoder: 로컬 경로의 sentence-transformers CrossEncoder 모델 (CPU 스레드 풀에서 실행)
+
+reranker는 `RERANKER` 설정으로 선택하며 프로세스마다 한 번만 생성.
+"""
+
+import asyncio
+import math
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from core.config import settings
+from utils.bm25 import tokenize
+
+
+class Reranker(ABC):
+    """질문과 후보 청크 목록을 받아 청크별 관련도 점수(클수록 관련 있음)를 반환."""
+
+    name: str
+
+    @abstractmethod
+    async def score(self, question: str, contents: List[str]) -> List[float]: ...
+
+
+class BM25Reranker(Reranker):
+    """IDF를 후보 청크 집합에서 계산하므로 적은 후보 중 질문 단어를 드물게 포함한 청크가 높은 점수를 받음."""
+
+    def __init__(self, k1: float, b: float):
+        self.name = "bm25"
+        self.k1 = k1
+        self.b = b
+
+    async def score(self, question: str, contents: List[str]) -> List[float]:
+        documents = [Counter(tokenize(content or "")) for content in contents]
+        if not documents:
+            return []
+        avg_length = sum(sum(terms.values()) for terms in documents) / len(documents)
+        query_terms = set(tokenize(question))
+        document_frequency = {
+            term: sum(1 for terms in documents if term in terms) for term in query_terms
+        }
+
+        scores = []
+        for terms in documents:
+            length_norm = (
+                1 - self.b + self.b * (sum(terms.values()) / (avg_length or 1))
+            )
+            score = 0.0
+            for term in query_terms:
+                count = terms.get(term, 0)
+                if not count:
+                    continue
+                df = document_frequency[term]
+                idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+                score += idf * count * (self.k1 + 1) / (count + self.k1 * length_norm)
+            scores.append(score)
+        return scores
+
+
+class CrossEncoderReranker(Reranker):
+    """(질문, 청크) 쌍을 함께 입력받아 관련도를 예측하는 로컬 cross-encoder 모델."""
+
+    def __init__(self, model_path: str, threads: int, batch_size: int):
+        # 선택 의존성이므로 사용할 때만 import
+        from sentence_transformers import CrossEncoder
+
+        self.name = f"cross-encoder:{model_path}"
+        self.model = CrossEncoder(model_path, device="cpu")
+        self.batch_size = max(1, batch_size)
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, threads), thread_name_prefix="rerank"
+        )
+
+    def _score_sync(self, question: str, contents: List[str]) -> List[float]:
+        scores = self.model.predict(
+            [(question, content) for content in contents],
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+        )
+        return scores.tolist()
+
+    async def score(self, question: str, contents: List[str]) -> List[float]:
+        if not contents:
+            return []
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self._score_sync, question, contents
+        )
+
+
+_reranker: Optional[Reranker] = None
+
+
+def get_reranker() -> Reranker:
+    """`RERANKER` 설정에 맞는 프로세스 전역 reranker 반환."""
+    global _reranker
+    if _reranker is None:
+        if settings.RERANKER == "bm25":
+            _reranker = BM25Reranker(k1=settings.BM25_K1, b=settings.BM25_B)
+        elif settings.RERANKER == "cross_encoder":
+            if not settings.RERANK_MODEL_PATH:
+                raise ValueError("RERANK_MODEL_PATH is required for cross_encoder")
+            _reranker = CrossEncoderReranker(
+                model_path=settings.RERANK_MODEL_PATH,
+                threads=settings.EMBEDDING_LOCAL_THREADS,
+                batch_size=settings.EMBEDDING_LOCAL_BATCH_SIZE,
+            )
+        else:
+            raise ValueError(f"Unknown reranker: {settings.RERANKER}")
+    return _reranker
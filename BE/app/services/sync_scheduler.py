@@ -0,0 +1,294 @@
+"""
+등록된 문서의 변경 사항을 주기적으로 감지해 벡터 DB에 다시 수집하는 백그라운드 스케줄러 모듈입니다.
+데이터 소스별로 마지막으로 반영한 수정 시간(high-water mark)을 저장하고, 그 이후 수정된 페이지만 다시 수집합니다.
+인덱스가 요청과 별도로 최신 상태를 유지하므로 질의 시 최신성 검증(MCP 호출)을 생략할 수 있습니다.
+스케줄러는 모든 워커 프로세스에서 시작되지만, DB lease를 획득한 프로세스만 동기화를 실행합니다.
+"""
+
+import asyncio
+import datetime
+import logging
+import os
+import socket
+import uuid
+from typing import Dict, List, Optional, Tuple
+from core.config import settings
+from crud.document import get_document_list
+from crud.ingestion_job import create_ingestion_job, get_ingestion_job_pages
+from crud.page_sync_state import get_page_sync_states, mark_page_edited
+from crud.sync_state import (
+    acquire_sync_lease,
+    get_sync_state,
+    release_sync_lease,
+    save_sync_state,
+)
+from db.database import async_session
+from db.models import (
+    DataSource,
+    DataSourceSyncState,
+    DocumentTB,
+    IngestionJob,
+    IngestionJobPage,
+    JobStatus,
+)
+from services.ingestion_job import ingestion_job_manager
+from utils.data_loader import NotionDataLoader
+from utils.datasource_url import context_url
+
+logger = logging.getLogger(__name__)
+
+IN_PROGRESS_STATUSES = {JobStatus.PENDING, JobStatus.RUNNING}
+# 다시 수집했거나 내용이 바뀌지 않아 생략된 페이지
+SYNCED_STATUSES = {JobStatus.SUCCEEDED, JobStatus.SKIPPED}
+
+
+def _to_notion_time(date: datetime.datetime) -> str:
+    """DB 날짜를 Notion의 수정 시간 형식(UTC, ISO 8601)으로 변환."""
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return date.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+class DocumentSyncScheduler:
+    """
+    일정 간격으로 Notion 검색 API를 최근 수정 순으로 조회해 수정된 페이지를 다시 수집.
+    수집은 등록 문서별 수집 작업(IngestionJob)으로 워커에 넘기며, 하위 페이지는 각각 따로 감지되므로
+    페이지 단위로 수집. 작업이 끝나면 실패한 페이지를 기준으로 high-water mark를 갱신.
+    lease는 동기화할 때마다 연장하므로, 소유 프로세스가 종료되어 만료되기 전까지 다른 프로세스는 실행하지 않음.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        # 프로세스마다 고유한 ID (동기화 lease 소유자로 기록)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if not settings.DOCUMENT_SYNC_ENABLED:
+            return
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self.task:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+            # 종료 시 lease를 해제해 다른 프로세스가 바로 이어받도록 함
+            try:
+                async with async_session() as session:
+                    await release_sync_lease(
+                        session, DataSource.NOTION.value, self.owner
+                    )
+            except Exception:
+                logger.exception("Failed to release document sync lease")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with async_session() as session:
+                    acquired = await acquire_sync_lease(
+                        session,
+                        DataSource.NOTION.value,
+                        self.owner,
+                        settings.DOCUMENT_SYNC_LEASE_SECONDS,
+                    )
+                if acquired:
+                    await self.sync_notion()
+            except Exception:
+                logger.exception("Document sync failed")
+            await asyncio.sleep(self.interval)
+
+    async def sync_notion(self) -> int:
+        """
+        마지막 동기화 이후 수정된 Notion 페이지를 다시 수집하고 high-water mark를 갱신합니다.
+
+        Returns:
+            int: 다시 수집한 페이지 수.
+        """
+        datasource = DataSource.NOTION.value
+        async with async_session() as session:
+            documents = await get_document_list(session, datasource=datasource)
+            sync_state = await get_sync_state(session, datasource)
+
+        if not documents:
+            return 0
+
+        # 등록된 문서는 page_id가 하이픈 없는 형태로 저장되어 있음
+        registered: Dict[str, DocumentTB] = {
+            document.page_id.replace("-", ""): document for document in documents
+        }
+        if sync_state and sync_state.last_edited_time:
+            since = sync_state.last_edited_time
+        else:
+            # 첫 동기화는 가장 오래전에 수집된 문서 시점부터 확인
+            since = min(_to_notion_time(document.update_date) for document in documents)
+
+        data_loader = NotionDataLoader()
+        edited_pages = await data_loader.get_edited_pages(since=since)
+
+        # 등록 문서별로 다시 수집할 페이지를 모아 문서마다 수집 작업 하나로 처리
+        targets: Dict[str, Tuple[DocumentTB, Dict[str, dict]]] = {}
+        high_water_mark = since
+        failed_times: List[str] = []
+        for page in edited_pages:
+            high_water_mark = max(high_water_mark, page["last_edited_time"])
+            try:
+                target = await self._find_document(page, registered)
+            except Exception:
+                logger.exception(f"Failed to sync page {page['page_id']}")
+                failed_times.append(page["last_edited_time"])
+                continue
+            if target:
+                document, upload_page_id = target
+                _, pages = targets.setdefault(document.page_id, (document, {}))
+                pages[upload_page_id] = page
+
+        page_statuses: Dict[str, JobStatus] = {}
+        if targets:
+            job_ids = [
+                await self._enqueue(document, list(pages))
+                for document, pages in targets.values()
+            ]
+            page_statuses = await self._wait_for_jobs(job_ids)
+            if page_statuses is None:
+                return 0
+
+        synced_count = 0
+        for _, pages in targets.values():
+            for upload_page_id, page in pages.items():
+                if page_statuses.get(upload_page_id) in SYNCED_STATUSES:
+                    synced_count += 1
+                else:
+                    failed_times.append(page["last_edited_time"])
+
+        # 실패한 페이지가 있으면 다음 동기화에서 다시 조회되도록 기준 시간을 되돌림
+        if failed_times:
+            high_water_mark = min(failed_times)
+
+        async with async_session() as session:
+            sync_state = await get_sync_state(
+                session, datasource
+            ) or DataSourceSyncState(datasource=datasource)
+            sync_state.last_edited_time = high_water_mark
+            sync_state.synced_page_count = synced_count
+            sync_state.last_synced_date = datetime.datetime.now(datetime.timezone.utc)
+            await save_sync_state(session, sync_state)
+
+        logger.info(
+            f"Notion sync finished: {len(edited_pages)} edited, {synced_count} synced, "
+            f"{len(failed_times)} failed (high-water mark={high_water_mark})"
+        )
+        return synced_count
+
+    async def _find_document(
+        self, page: dict, registered: Dict[str, DocumentTB]
+    ) -> Optional[Tuple[DocumentTB, str]]:
+        """
+        수정된 페이지가 속한 등록 문서를 찾고, 페이지의 최신 수정 시간을 기록합니다.
+        새로 추가된 하위 페이지는 부모 페이지가 속한 등록 문서로 판단합니다.
+
+        Returns:
+            Optional[Tuple[DocumentTB, str]]: (등록 문서, 다시 수집할 페이지 ID).
+                등록 문서로부터 수집된 페이지가 아니거나 이미 최신 버전이 수집되었으면 None.
+        """
+        datasource = DataSource.NOTION.value
+        page_id = page["page_id"]
+        page_ids = {page_id, page_id.replace("-", "")}
+        parent_page_id = page["parent_page_id"] or ""
+        parent_page_ids = {parent_page_id, parent_page_id.replace("-", "")} - {""}
+
+        async with async_session() as session:
+            page_sync_states = await get_page_sync_states(
+                session, datasource, list(page_ids | parent_page_ids)
+            )
+        page_states = [
+            page_sync_state
+            for page_sync_state in page_sync_states
+            if page_sync_state.page_id in page_ids
+        ]
+        parent_states = [
+            page_sync_state
+            for page_sync_state in page_sync_states
+            if page_sync_state.page_id in parent_page_ids
+        ]
+
+        # 이미 최신 버전이 수집된 페이지 (예: 직접 업로드)
+        if page_states and all(
+            page_sync_state.ingested_edited_time == page["last_edited_time"]
+            for page_sync_state in page_states
+        ):
+            return None
+
+        document = registered.get(page_id.replace("-", ""))
+        for page_sync_state in page_states + parent_states:
+            document = document or registered.get(
+                page_sync_state.root_page_id.replace("-", "")
+            )
+        if not document and parent_page_id:
+            document = registered.get(parent_page_id.replace("-", ""))
+        if not document:
+            return None
+
+        async with async_session() as session:
+            await mark_page_edited(
+                session, datasource, list(page_ids), page["last_edited_time"]
+            )
+
+        upload_page_id = document.page_id if document.page_id in page_ids else page_id
+        return document, upload_page_id
+
+    async def _enqueue(self, document: DocumentTB, page_ids: List[str]) -> str:
+        """등록 문서의 수정된 페이지들을 수집 작업으로 만들어 수집 워커에 넘김."""
+        job = IngestionJob(
+            datasource=document.datasource,
+            user_groups=document.user_groups,
+            chunk_strategy=document.chunk_strategy,
+            root_page_id=document.page_id,
+        )
+        pages = [
+            IngestionJobPage(
+                url=context_url(DataSource.NOTION, page_id), page_id=page_id
+            )
+            for page_id in page_ids
+        ]
+        async with async_session() as session:
+            created_job = await create_ingestion_job(
+                session=session, job=job, pages=pages
+            )
+        ingestion_job_manager.enqueue([page.id for page in pages])
+        return created_job.id
+
+    async def _wait_for_jobs(
+        self, job_ids: List[str]
+    ) -> Optional[Dict[str, JobStatus]]:
+        """
+        수집 작업이 끝날 때까지 기다리며 동기화 lease를 연장합니다.
+
+        Returns:
+            Optional[Dict[str, JobStatus]]: 페이지 ID별 처리 결과. 기다리는 중 lease를 잃으면 None.
+        """
+        while True:
+            await asyncio.sleep(settings.DOCUMENT_SYNC_POLL_INTERVAL)
+            async with async_session() as session:
+                if not await acquire_sync_lease(
+                    session,
+                    DataSource.NOTION.value,
+                    self.owner,
+                    settings.DOCUMENT_SYNC_LEASE_SECONDS,
+                ):
+                    logger.warning("Lost document sync lease while waiting for jobs")
+                    return None
+                job_pages = [
+                    job_page
+                    for job_id in job_ids
+                    for job_page in await get_ingestion_job_pages(session, job_id)
+                ]
+            if all(
+                job_page.status not in IN_PROGRESS_STATUSES for job_page in job_pages
+            ):
+                return {job_page.page_id: job_page.status for job_page in job_pages}
+
+
+document_sync_scheduler = DocumentSyncScheduler(
+    interval=settings.DOCUMENT_SYNC_INTERVAL
+)
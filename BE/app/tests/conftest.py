@@ -0,0 +1,27 @@
+"""
+오프라인 단위 테스트 공통 설정.
+외부 서비스(DB, Qdrant, Gemini, Notion) 없이 설정 객체를 만들 수 있도록 필수 설정값을 더미 값으로 채움.
+"""
+
+import os
+
+REQUIRED_SETTINGS = [
+    "GEMINI_API_KEY",
+    "NOTION_API_KEY",
+    "SMITHERY_API_KEY",
+    "DB_NAME",
+    "DB_PASSWORD",
+    "DB_USER",
+    "DB_HOST",
+    "DB_PORT",
+    "SECRET_KEY",
+    "ALGORITHM",
+    "INIT_USER_GROUP_NAME",
+    "INIT_USER_GROUP_AUTHORITY_LEVEL",
+    "INIT_USER_EMAIL",
+    "INIT_USER_PASSWORD",
+    "INIT_USER_NAME",
+]
+
+for key in REQUIRED_SETTINGS:
+    os.environ.setdefault(key, "test")
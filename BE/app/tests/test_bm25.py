@@ -0,0 +1,71 @@
+import pytest
+
+from core.config import settings
+from utils.bm25 import document_sparse_embedding, query_sparse_embedding, tokenize
+
+
+def _weights(text: str) -> dict:
+    embedding = document_sparse_embedding(text)
+    return dict(zip(embedding.indices, embedding.values))
+
+
+def _index(term: str) -> int:
+    return query_sparse_embedding(term).indices[0]
+
+
+def test_tokenize_lowercases_and_adds_hangul_bigrams():
+    assert tokenize("Notion 프로젝트에서 문서") == [
+        "notion",
+        "프로젝트에서",
+        "프로",
+        "로젝",
+        "젝트",
+        "트에",
+        "에서",
+        "문서",
+    ]
+
+
+def test_tokenize_splits_on_punctuation():
+    assert tokenize("Qdrant, BM25-search!") == ["qdrant", "bm25", "search"]
+
+
+def test_query_sparse_embedding_weights_each_term_once():
+    embedding = query_sparse_embedding("검색 검색 vector")
+
+    assert embedding.values == [1.0, 1.0]
+    assert embedding.indices == sorted(set(embedding.indices))
+
+
+def test_document_weight_saturates_with_term_frequency():
+    apple = _index("apple")
+    once = _weights("apple")[apple]
+    twice = _weights("apple apple")[apple]
+    many = _weights(" ".join(["apple"] * 50))[apple]
+
+    assert once < twice < many < settings.BM25_K1 + 1
+
+
+def test_document_weight_decreases_with_document_length():
+    apple = _index("apple")
+    short = _weights("apple pie")[apple]
+    long = _weights("apple " + " ".join(f"word{i}" for i in range(400)))[apple]
+
+    assert long < short
+
+
+def test_document_weight_matches_bm25_tf():
+    text = "apple apple pie"
+    length_norm = (
+        1 - settings.BM25_B + settings.BM25_B * 3 / settings.BM25_AVG_DOC_TOKENS
+    )
+    k1 = settings.BM25_K1
+
+    assert _weights(text)[_index("apple")] == pytest.approx(
+        2 * (k1 + 1) / (2 + k1 * length_norm)
+    )
+
+
+def test_empty_text_has_no_terms():
+    assert document_sparse_embedding("").indices == []
+    assert query_sparse_embedding("  ").indices == []
@@ -0,0 +1,70 @@
+from utils.chunking import split_sections
+from utils.token_counter import estimate_tokens
+
+
+def test_split_sections_cuts_at_headings():
+    blocks = [
+        ("Intro", "heading_1"),
+        ("a" * 40, "paragraph"),
+        ("Setup", "heading_2"),
+        ("b" * 40, "paragraph"),
+    ]
+
+    chunks = split_sections(blocks, max_tokens=100, min_tokens=5, overlap_tokens=0)
+
+    assert chunks == ["Intro\n" + "a" * 40, "Setup\n" + "b" * 40]
+
+
+def test_split_sections_keeps_small_sections_together():
+    blocks = [
+        ("Intro", "heading_1"),
+        ("a" * 8, "paragraph"),
+        ("Setup", "heading_2"),
+        ("b" * 8, "paragraph"),
+    ]
+
+    chunks = split_sections(blocks, max_tokens=100, min_tokens=50, overlap_tokens=0)
+
+    assert chunks == ["\n".join(text for text, _ in blocks)]
+
+
+def test_split_sections_prefixes_heading_path_when_section_overflows():
+    blocks = [
+        ("Guide", "heading_1"),
+        ("Install", "heading_2"),
+        ("x" * 40, "paragraph"),
+        ("y" * 40, "paragraph"),
+    ]
+
+    chunks = split_sections(blocks, max_tokens=15, min_tokens=100, overlap_tokens=0)
+
+    assert chunks == ["Guide\nInstall\n" + "x" * 40, "Guide > Install\n" + "y" * 40]
+
+
+def test_split_sections_cuts_around_lists():
+    blocks = [
+        ("p" * 40, "paragraph"),
+        ("item 1", "bulleted_list_item"),
+        ("item 2", "bulleted_list_item"),
+        ("q" * 40, "paragraph"),
+    ]
+
+    chunks = split_sections(blocks, max_tokens=100, min_tokens=1, overlap_tokens=0)
+
+    assert chunks == ["p" * 40, "item 1\nitem 2", "q" * 40]
+
+
+def test_split_sections_splits_oversized_block():
+    text = "word " * 160
+
+    chunks = split_sections(
+        [(text, "paragraph")], max_tokens=50, min_tokens=10, overlap_tokens=0
+    )
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 50 for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_split_sections_skips_empty_blocks():
+    assert split_sections([("", "paragraph"), ("  ", None)], 100, 10, 0) == []
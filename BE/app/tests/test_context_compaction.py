@@ -0,0 +1,36 @@
+from utils.context_compaction import stitch_chunks
+
+TEXT = "".join(f"sentence {i:03d}. " for i in range(60))
+
+
+def test_stitch_chunks_merges_overlap_in_page_order():
+    # 검색 순서가 뒤바뀐 인접 청크 (50자 겹침)
+    assert stitch_chunks([TEXT[350:750], TEXT[0:400]]) == [TEXT[0:750]]
+
+
+def test_stitch_chunks_merges_chain_of_chunks():
+    chunks = [TEXT[600:900], TEXT[0:400], TEXT[350:650]]
+
+    assert stitch_chunks(chunks) == [TEXT[0:900]]
+
+
+def test_stitch_chunks_drops_contained_chunks():
+    assert stitch_chunks([TEXT[0:400], TEXT[100:200]]) == [TEXT[0:400]]
+    assert stitch_chunks([TEXT[100:200], TEXT[0:400]]) == [TEXT[0:400]]
+
+
+def test_stitch_chunks_keeps_unrelated_chunks_in_retrieval_order():
+    chunks = [TEXT[500:700], TEXT[0:200]]
+
+    assert stitch_chunks(chunks) == chunks
+
+
+def test_stitch_chunks_ignores_short_overlap():
+    left = "left side of the page 0123456789"
+    right = "0123456789 right side of the page"
+
+    assert stitch_chunks([left, right]) == [left, right]
+
+
+def test_stitch_chunks_skips_empty_and_duplicate_chunks():
+    assert stitch_chunks(["", TEXT[0:100], TEXT[0:100]]) == [TEXT[0:100]]
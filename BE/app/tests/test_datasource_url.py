@@ -0,0 +1,39 @@
+import pytest
+
+from core.exception import CustomException
+from db.models import DataSource
+from utils.datasource_url import extract_page_id
+
+PAGE_ID = "1a2b3c4d5e6f47808192a3b4c5d6e7f8"
+HYPHENATED_PAGE_ID = "1a2b3c4d-5e6f-4780-8192-a3b4c5d6e7f8"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        f"https://www.notion.so/{PAGE_ID}",
+        f"https://www.notion.so/workspace/Project-Plan-{PAGE_ID}",
+        f"https://www.notion.so/Project-Plan-{PAGE_ID}?pvs=4",
+        f"https://www.notion.so/Project-Plan-{PAGE_ID}#heading",
+        f"https://www.notion.so/Project-Plan-{PAGE_ID}/",
+        f"https://workspace.notion.site/{HYPHENATED_PAGE_ID}",
+        f"https://www.notion.so/{PAGE_ID.upper()}",
+    ],
+)
+def test_extract_page_id(url):
+    assert extract_page_id(url, DataSource.NOTION).lower() == PAGE_ID
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.notion.so/",
+        "https://www.notion.so/Project-Plan",
+        f"https://www.notion.so/{PAGE_ID}/Project-Plan",
+    ],
+)
+def test_extract_page_id_rejects_url_without_page_id(url):
+    with pytest.raises(CustomException) as exc_info:
+        extract_page_id(url, DataSource.NOTION)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,24 @@
+from utils.mmr import mmr_select
+
+QUERY = [1.0, 0.0, 0.0]
+# 0: 질의와 가장 유사, 1: 0번과 거의 같은 청크, 2: 덜 유사하지만 다른 내용
+CANDIDATES = [[0.9, 0.1, 0.0], [0.9, 0.12, 0.0], [0.7, 0.0, 0.7]]
+
+
+def test_mmr_select_prefers_diverse_candidates():
+    assert mmr_select(QUERY, CANDIDATES, k=2, lambda_mult=0.3) == [0, 2]
+
+
+def test_mmr_select_with_lambda_one_orders_by_relevance():
+    assert mmr_select(QUERY, CANDIDATES, k=3, lambda_mult=1.0) == [0, 1, 2]
+
+
+def test_mmr_select_returns_each_candidate_once():
+    selected = mmr_select(QUERY, CANDIDATES + [[0.0, 0.0, 0.0]], k=10)
+
+    assert sorted(selected) == [0, 1, 2, 3]
+
+
+def test_mmr_select_without_candidates():
+    assert mmr_select(QUERY, [], k=3) == []
+    assert mmr_select(QUERY, CANDIDATES, k=0) == []
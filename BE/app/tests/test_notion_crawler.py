@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from notion_client.errors import APIErrorCode, APIResponseError
+
+from benchmarks.fake_notion import FakeNotionClient
+from utils.notion_crawler import ConcurrentNotionCrawler
+
+
+def _text(block: dict) -> str:
+    return "".join(
+        text["plain_text"] for text in block.get(block["type"], {}).get("rich_text", [])
+    )
+
+
+def _crawl(notion: FakeNotionClient, max_retries: int) -> tuple:
+    crawler = ConcurrentNotionCrawler(
+        notion=notion, text_extractor=_text, concurrency=4, max_retries=max_retries
+    )
+    pages = {}
+
+    async def page_sink(blocks: list) -> None:
+        for block in blocks:
+            pages.setdefault(block["page_id"], []).append(block["content"])
+
+    async def run() -> None:
+        updated_at = notion.page_data["root"]["last_edited_time"]
+        crawler.seed_page("root", updated_at)
+        await crawler.crawl_pages(
+            page_id="root",
+            updated_at=updated_at,
+            page_sink=page_sink,
+            recursive_page=True,
+        )
+
+    asyncio.run(run())
+    return pages, crawler.stats
+
+
+def test_crawl_retries_rate_limited_requests():
+    expected, _ = _crawl(FakeNotionClient.synthetic(pages=6, depth=2), max_retries=0)
+
+    notion = FakeNotionClient.synthetic(pages=6, depth=2, rate_limit_ratio=0.3)
+    pages, stats = _crawl(notion, max_retries=20)
+
+    assert notion.rate_limited > 0
+    assert stats.rate_limited == notion.rate_limited
+    assert pages == expected
+    assert set(pages) == {"root"} | {f"page-{i}" for i in range(1, 7)}
+
+
+def test_request_gives_up_after_max_retries():
+    notion = FakeNotionClient.synthetic(pages=0, depth=0, rate_limit_ratio=1.0)
+    crawler = ConcurrentNotionCrawler(
+        notion=notion, text_extractor=_text, concurrency=1, max_retries=2
+    )
+
+    with pytest.raises(APIResponseError) as exc_info:
+        asyncio.run(crawler._request(notion.pages.retrieve, page_id="root"))
+
+    assert exc_info.value.code == APIErrorCode.RateLimited
+    assert notion.requests["pages.retrieve"] == 3
+    assert crawler.stats.rate_limited == 2
@@ -0,0 +1,97 @@
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from rag_graph.prompt import llm_answer
+from schemas.schemas import Document
+from utils.token_counter import prompt_token_estimator
+
+QUESTION = "배포 절차를 알려줘"
+MESSAGES = [
+    (HumanMessage if i % 2 == 0 else AIMessage)(content=f"message {i} " + "y" * 200)
+    for i in range(10)
+]
+CONTEXT = [
+    Document(
+        content=f"document {i} " + "x" * 400,
+        datasource="notion",
+        updated_at="2025-01-01T00:00:00.000Z",
+        page_id=f"page{i}",
+    )
+    for i in range(3)
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_estimator_scale():
+    prompt_token_estimator.scale = 1.0
+
+
+def _tokens(prompt) -> int:
+    return sum(prompt_token_estimator.estimate(message.content) for message in prompt)
+
+
+def _answer(messages, context, max_tokens, history_max_tokens=2000):
+    return llm_answer(
+        QUESTION,
+        messages,
+        context,
+        max_tokens=max_tokens,
+        history_max_tokens=history_max_tokens,
+        history_min_tokens=100,
+    )
+
+
+def _overhead() -> int:
+    return _tokens(_answer([], None, max_tokens=100_000))
+
+
+def test_everything_fits_within_large_budget():
+    human = _answer(MESSAGES, CONTEXT, max_tokens=100_000)[1].content
+
+    assert all(f"message {i} " in human for i in range(10))
+    assert all(f"**Document {i + 1}**" in human for i in range(3))
+
+
+@pytest.mark.parametrize("extra_tokens", [50, 150, 300, 600, 1000])
+def test_prompt_stays_within_budget(extra_tokens):
+    max_tokens = _overhead() + extra_tokens
+
+    assert _tokens(_answer(MESSAGES, CONTEXT, max_tokens)) <= max_tokens
+
+
+def test_lowest_ranked_context_is_dropped_first():
+    human = _answer([], CONTEXT, max_tokens=_overhead() + 250)[1].content
+
+    assert "**Document 1**" in human and "**Document 2**" in human
+    assert "**Document 3**" not in human
+
+
+def test_oldest_history_is_dropped_first():
+    human = _answer(MESSAGES, None, max_tokens=_overhead() + 200)[1].content
+
+    assert "message 9 " in human
+    assert "message 0 " not in human
+
+
+def test_history_shrinks_to_make_room_for_context():
+    human = _answer(MESSAGES, CONTEXT, max_tokens=_overhead() + 500)[1].content
+
+    assert all(f"**Document {i + 1}**" in human for i in range(3))
+    assert "message 9 " in human and "message 0 " not in human
+
+
+def test_unused_context_budget_goes_to_history():
+    human = _answer(MESSAGES, None, max_tokens=100_000, history_max_tokens=60)[
+        1
+    ].content
+
+    assert all(f"message {i} " in human for i in range(10))
+
+
+def test_first_context_is_truncated_when_nothing_fits():
+    long_document = CONTEXT[0].model_copy(update={"content": "z" * 4000})
+    max_tokens = _overhead() + 200
+    prompt = _answer([], [long_document], max_tokens)
+
+    assert "**Document 1**" in prompt[1].content
+    assert _tokens(prompt) <= max_tokens
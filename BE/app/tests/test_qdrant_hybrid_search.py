@@ -0,0 +1,71 @@
+import asyncio
+from types import SimpleNamespace
+
+from qdrant_client import models
+
+from schemas.schemas import DocumentMetadata, SparseEmbedding
+from services.qdrant_service import QdrantService
+
+# RRF 결합 순서와 각 point의 dense 유사도
+FUSED = [("a", 0.5), ("b", 0.33), ("c", 0.25)]
+DENSE_SCORES = {"a": 0.82, "b": 0.41, "c": 0.77}
+
+
+class FakeQdrantClient:
+    def __init__(self):
+        self.calls = []
+
+    async def query_points(self, **kwargs):
+        self.calls.append(kwargs)
+        if "prefetch" in kwargs:
+            points = [_point(point_id, score) for point_id, score in FUSED]
+        else:
+            # 결합 결과의 dense 유사도 확인 (id 필터 + score_threshold)
+            point_ids = kwargs["query_filter"].must[0].has_id
+            points = [
+                _point(point_id, DENSE_SCORES[point_id])
+                for point_id in point_ids
+                if DENSE_SCORES[point_id] >= kwargs["score_threshold"]
+            ]
+        return SimpleNamespace(points=points)
+
+
+def _point(point_id: str, score: float) -> models.ScoredPoint:
+    return models.ScoredPoint(
+        id=point_id, version=0, score=score, payload={"page_id": point_id}
+    )
+
+
+def _hybrid_search(score_threshold):
+    qdrant = QdrantService()
+    qdrant.client = FakeQdrantClient()
+    qdrant._sparse_available = True
+    documents = asyncio.run(
+        qdrant.query_document(
+            embedding=[0.1, 0.2],
+            metadata=DocumentMetadata(user_groups=["group"]),
+            limit=3,
+            score_threshold=score_threshold,
+            sparse_embedding=SparseEmbedding(indices=[1], values=[1.0]),
+        )
+    )
+    return documents, qdrant.client.calls
+
+
+def test_hybrid_search_applies_threshold_to_fused_points():
+    documents, calls = _hybrid_search(score_threshold=0.7)
+
+    # BM25로만 올라온 "b"는 dense 유사도가 기준 미만이라 제외되고, RRF 순서와 점수는 유지
+    assert [(document.id, document.score) for document in documents] == [
+        ("a", 0.5),
+        ("c", 0.25),
+    ]
+    assert calls[0]["prefetch"][0].score_threshold == 0.7
+    assert calls[1]["query_filter"].must[0].has_id == ["a", "b", "c"]
+
+
+def test_hybrid_search_without_threshold_keeps_fused_points():
+    documents, calls = _hybrid_search(score_threshold=None)
+
+    assert [document.id for document in documents] == ["a", "b", "c"]
+    assert len(calls) == 1
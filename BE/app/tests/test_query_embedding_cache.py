@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from services.query_embedding_cache import QueryEmbeddingCache
+
+
+def _cache(**kwargs) -> QueryEmbeddingCache:
+    options = {"max_entries": 100, "max_bytes": 1024 * 1024, "ttl": 3600.0}
+    options.update(kwargs)
+    return QueryEmbeddingCache(**options)
+
+
+class GatedEmbedder:
+    """`release()` 전까지 임베딩을 끝내지 않는 임베딩 함수."""
+
+    def __init__(self, error: Exception = None):
+        self.calls = []
+        self.error = error
+        self.gate = asyncio.Event()
+
+    def release(self) -> None:
+        self.gate.set()
+
+    async def __call__(self, question: str) -> list:
+        self.calls.append(question)
+        await self.gate.wait()
+        if self.error:
+            raise self.error
+        return [float(len(question)), 1.0]
+
+
+def test_concurrent_requests_share_one_embedding():
+    async def run():
+        cache = _cache()
+        embed = GatedEmbedder()
+        first = asyncio.create_task(cache.get_or_embed("같은  질문 ", "m", 2, embed))
+        second = asyncio.create_task(cache.get_or_embed("같은 질문", "m", 2, embed))
+        await asyncio.sleep(0)
+        embed.release()
+        results = await asyncio.gather(first, second)
+        cached = await cache.get_or_embed("같은 질문", "m", 2, embed)
+        return cache, embed, results, cached
+
+    cache, embed, results, cached = asyncio.run(run())
+
+    assert embed.calls == ["같은 질문"]
+    assert results == [[5.0, 1.0], [5.0, 1.0]] and cached == [5.0, 1.0]
+    assert (cache.misses, cache.coalesced, cache.hits) == (1, 1, 1)
+
+
+def test_cancelled_request_does_not_cancel_shared_embedding():
+    async def run():
+        cache = _cache()
+        embed = GatedEmbedder()
+        first = asyncio.create_task(cache.get_or_embed("question", "m", 2, embed))
+        second = asyncio.create_task(cache.get_or_embed("question", "m", 2, embed))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        embed.release()
+        result = await second
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return cache, embed, result
+
+    cache, embed, result = asyncio.run(run())
+
+    assert result == [8.0, 1.0]
+    assert embed.calls == ["question"]
+    assert cache.get(("question", "m", 2)) == [8.0, 1.0]
+
+
+def test_failed_embedding_is_not_cached():
+    async def run():
+        cache = _cache()
+        embed = GatedEmbedder(error=RuntimeError("embedding failed"))
+        tasks = [
+            asyncio.create_task(cache.get_or_embed("question", "m", 2, embed))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        embed.release()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        retry = GatedEmbedder()
+        retry.release()
+        retried = await cache.get_or_embed("question", "m", 2, retry)
+        return embed, results, retry, retried
+
+    embed, results, retry, retried = asyncio.run(run())
+
+    assert len(embed.calls) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert retry.calls == ["question"] and retried == [8.0, 1.0]
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = _cache(max_entries=2)
+    cache.put(("a", "m", 2), [1.0, 0.0])
+    cache.put(("b", "m", 2), [0.0, 1.0])
+    cache.get(("a", "m", 2))
+    cache.put(("c", "m", 2), [1.0, 1.0])
+
+    assert cache.get(("b", "m", 2)) is None
+    assert cache.get(("a", "m", 2)) == [1.0, 0.0]
+    assert cache.stats["entries"] == 2
@@ -0,0 +1,23 @@
+import math
+
+import pytest
+
+from services.gemini import truncate_embedding
+
+
+def test_truncate_embedding_keeps_prefix_and_normalizes():
+    truncated = truncate_embedding([3.0, 4.0, 12.0, 1.0], 2)
+
+    assert truncated == pytest.approx([0.6, 0.8])
+    assert math.fsum(value * value for value in truncated) == pytest.approx(1.0)
+
+
+def test_truncate_embedding_returns_short_embedding_unchanged():
+    embedding = [3.0, 4.0]
+
+    assert truncate_embedding(embedding, 2) is embedding
+    assert truncate_embedding(embedding, 8) is embedding
+
+
+def test_truncate_embedding_keeps_zero_prefix():
+    assert truncate_embedding([0.0, 0.0, 1.0], 2) == [0.0, 0.0]
@@ -0,0 +1,66 @@
+"""
+하이브리드 검색용 BM25 sparse 벡터 생성 모듈.
+문서 벡터에는 BM25의 단어 빈도(TF) 가중치만 담고, IDF는 Qdrant가 컬렉션 통계로 계산함
+(sparse 벡터 설정의 `modifier=IDF`).
+단어는 해싱으로 sparse 인덱스(uint32)에 대응시키므로 별도의 어휘 사전이 필요 없음.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import List
+from core.config import settings
+from schemas.schemas import SparseEmbedding
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_HANGUL_PATTERN = re.compile("[\uac00-\ud7a3]")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    소문자로 바꾼 단어 목록.
+    한글 단어는 조사/어미가 붙어도 매칭되도록 글자 2-gram을 함께 추가 (예: "프로젝트에서" -> "프로", "로젝", ...).
+    """
+    tokens = []
+    for word in _TOKEN_PATTERN.findall(text.lower()):
+        tokens.append(word)
+        if len(word) > 2 and _HANGUL_PATTERN.search(word):
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _term_index(term: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(term.encode("utf-8"), digest_size=4).digest(), "little"
+    )
+
+
+def _merge(weights: dict) -> SparseEmbedding:
+    """해시 충돌로 같은 인덱스가 된 단어의 가중치는 합산."""
+    merged = Counter()
+    for term, weight in weights.items():
+        merged[_term_index(term)] += weight
+    indices = sorted(merged)
+    return SparseEmbedding(indices=indices, values=[merged[i] for i in indices])
+
+
+def document_sparse_embedding(text: str) -> SparseEmbedding:
+    """문서 청크의 BM25 TF 가중치 벡터."""
+    term_counts = Counter(tokenize(text or ""))
+    length_norm = (
+        1
+        - settings.BM25_B
+        + settings.BM25_B * (sum(term_counts.values()) / settings.BM25_AVG_DOC_TOKENS)
+    )
+    k1 = settings.BM25_K1
+    return _merge(
+        {
+            term: count * (k1 + 1) / (count + k1 * length_norm)
+            for term, count in term_counts.items()
+        }
+    )
+
+
+def query_sparse_embedding(text: str) -> SparseEmbedding:
+    """질의의 sparse 벡터. 질의에 포함된 단어마다 가중치 1."""
+    return _merge({term: 1.0 for term in tokenize(text or "")})
@@ -0,0 +1,211 @@
+"""
+페이지 텍스트를 청크로 나누는 모듈.
+- character: 페이지의 블록을 이어 붙인 뒤 글자 수 기준으로 청킹 (1000자, 200자 overlap)
+- structure: Notion 블록 구조(heading, toggle, 목록)를 기준으로 섹션 단위 청킹 (토큰 수 기준, overlap 최소화)
+
+청킹은 CPU 작업이므로 이벤트 루프(채팅 스트리밍 등)를 막지 않도록 프로세스 풀에서 실행.
+프로세스 풀에서 실행되는 함수는 pickle 가능하도록 모듈 최상위에 정의.
+"""
+
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from core.config import settings
+from db.models import ChunkStrategy
+from utils.token_counter import estimate_token_weight, estimate_tokens
+
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 200
+SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
+HEADING_LEVELS = {"heading_1": 1, "heading_2": 2, "heading_3": 3}
+# heading 외에 청크를 나눌 수 있는 위치: toggle 블록 앞, 목록(연속된 목록 블록) 앞뒤
+SECTION_BLOCK_TYPES = {"toggle"}
+LIST_BLOCK_TYPES = {"bulleted_list_item", "numbered_list_item", "to_do"}
+
+# (블록 텍스트, 블록 타입) 목록
+PageBlocks = List[Tuple[str, Optional[str]]]
+
+# 프로세스마다 한 번만 생성
+_text_splitter: Optional[RecursiveCharacterTextSplitter] = None
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_text_splitter() -> RecursiveCharacterTextSplitter:
+    global _text_splitter
+    if _text_splitter is None:
+        _text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=CHUNK_SIZE,
+            chunk_overlap=CHUNK_OVERLAP,
+            separators=SEPARATORS,
+            length_function=len,
+        )
+    return _text_splitter
+
+
+def split_corpora(corpora: List[str]) -> List[List[str]]:
+    """페이지별 텍스트 목록을 받아 페이지별 청크 목록 반환."""
+    text_splitter = _get_text_splitter()
+    return [text_splitter.split_text(corpus) for corpus in corpora]
+
+
+@functools.lru_cache(maxsize=8)
+def _get_token_splitter(
+    max_tokens: int, overlap_tokens: int
+) -> RecursiveCharacterTextSplitter:
+    return RecursiveCharacterTextSplitter(
+        chunk_size=max_tokens,
+        chunk_overlap=overlap_tokens,
+        separators=SEPARATORS,
+        # 조각별 올림 없이 더해야 청크 크기가 `max_tokens`에 맞음
+        length_function=estimate_token_weight,
+    )
+
+
+def split_sections(
+    blocks: PageBlocks, max_tokens: int, min_tokens: int, overlap_tokens: int
+) -> List[str]:
+    """
+    블록 구조를 기준으로 한 페이지를 청킹.
+    블록을 순서대로 `max_tokens`까지 채우며, 현재 청크가 `min_tokens` 이상이면
+    heading, toggle, 목록의 시작/끝에서 청크를 나눔.
+    heading이 아닌 블록으로 시작하는 청크에는 상위 heading 경로를 붙여 섹션 맥락을 유지.
+    `max_tokens`를 넘는 블록만 `overlap_tokens`만큼 겹치게 나눔.
+    """
+    chunks = []
+    headings: Dict[int, str] = {}
+    current: List[str] = []
+    current_tokens = 0
+    in_list = False
+
+    def flush() -> None:
+        nonlocal current, current_tokens
+        if current:
+            chunks.append("\n".join(current))
+        current, current_tokens = [], 0
+
+    def start_with_heading_path(block_tokens: int) -> None:
+        nonlocal current_tokens
+        heading_path = " > ".join(headings[level] for level in sorted(headings))
+        path_tokens = estimate_tokens(heading_path)
+        if heading_path and path_tokens + block_tokens <= max_tokens:
+            current.append(heading_path)
+            current_tokens += path_tokens
+
+    for text, block_type in blocks:
+        if not text or not text.strip():
+            continue
+        tokens = estimate_tokens(text)
+        level = HEADING_LEVELS.get(block_type)
+        is_list = block_type in LIST_BLOCK_TYPES
+
+        boundary = level or block_type in SECTION_BLOCK_TYPES or is_list != in_list
+        in_list = is_list
+        if boundary and current_tokens >= min_tokens:
+            flush()
+
+        if level:
+            headings = {
+                parent: heading
+                for parent, heading in headings.items()
+                if parent < level
+            }
+            headings[level] = text
+
+        if current_tokens + tokens > max_tokens:
+            flush()
+            if tokens > max_tokens:
+                chunks.extend(
+                    _get_token_splitter(max_tokens, overlap_tokens).split_text(text)
+                )
+                continue
+
+        # 나눈 블록 뒤에 남은 작은 블록도 heading 경로와 함께 다음 섹션으로 이어짐
+        if not current and not level:
+            start_with_heading_path(tokens)
+        current.append(text)
+        current_tokens += tokens
+
+    flush()
+    return chunks
+
+
+def split_structured_pages(
+    pages: List[PageBlocks], max_tokens: int, min_tokens: int, overlap_tokens: int
+) -> List[List[str]]:
+    """페이지별 블록 목록을 받아 페이지별 섹션 청크 목록 반환."""
+    return [
+        split_sections(blocks, max_tokens, min_tokens, overlap_tokens)
+        for blocks in pages
+    ]
+
+
+def get_chunking_executor() -> Optional[ProcessPoolExecutor]:
+    """프로세스 전역 청킹 프로세스 풀 반환. `CHUNKING_WORKERS = 0`이면 None."""
+    global _executor
+    if settings.CHUNKING_WORKERS <= 0:
+        return None
+    if _executor is None:
+        # 스레드가 있는 서버 프로세스를 fork하지 않도록 spawn 사용
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.CHUNKING_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def shutdown_chunking_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+async def _run_in_pool(
+    func: Callable[..., List[List[str]]], items: list, weight: int, *args
+) -> List[List[str]]:
+    """
+    `items`를 `CHUNKING_BATCH_PAGES`개씩 묶어 프로세스 풀에서 `func(batch, *args)` 실행.
+    프로세스 풀을 사용하지 않거나 입력이 `CHUNKING_INLINE_MAX_CHARS` 이하이면 현재 스레드에서 실행.
+    """
+    executor = get_chunking_executor()
+    # 작은 입력은 프로세스 간 전송 비용이 청킹 비용보다 크므로 바로 청킹
+    if executor is None or weight <= settings.CHUNKING_INLINE_MAX_CHARS:
+        return func(items, *args)
+
+    loop = asyncio.get_running_loop()
+    batch_size = max(1, settings.CHUNKING_BATCH_PAGES)
+    tasks = []
+    for start in range(0, len(items), batch_size):
+        end = start + batch_size
+        tasks.append(loop.run_in_executor(executor, func, items[start:end], *args))
+
+    results = []
+    for batch_result in await asyncio.gather(*tasks):
+        results.extend(batch_result)
+    return results
+
+
+async def asplit_corpora(corpora: List[str]) -> List[List[str]]:
+    """페이지별 텍스트를 글자 수 기준으로 청킹."""
+    return await _run_in_pool(split_corpora, corpora, sum(map(len, corpora)))
+
+
+async def asplit_pages(
+    pages: List[PageBlocks], strategy: ChunkStrategy = ChunkStrategy.CHARACTER
+) -> List[List[str]]:
+    """페이지별 블록 목록을 청킹 전략에 따라 청킹해서 페이지별 청크 목록 반환."""
+    if strategy == ChunkStrategy.STRUCTURE:
+        return await _run_in_pool(
+            split_structured_pages,
+            pages,
+            sum(len(text) for blocks in pages for text, _ in blocks),
+            settings.STRUCTURE_CHUNK_MAX_TOKENS,
+            settings.STRUCTURE_CHUNK_MIN_TOKENS,
+            settings.STRUCTURE_CHUNK_OVERLAP_TOKENS,
+        )
+    return await asplit_corpora(
+        ["\n".join(text for text, _ in blocks) for blocks in pages]
+    )
@@ -0,0 +1,93 @@
+"""
+프롬프트에 넣기 전 검색된 청크를 페이지 단위로 합치는 컨텍스트 압축 모듈.
+character 청킹은 인접 청크가 최대 200자 겹치므로, 같은 페이지의 청크 중 앞 청크의 끝과
+뒤 청크의 시작이 겹치는 쌍을 찾아 겹친 부분을 한 번만 남기고 이어 붙임.
+청크에는 위치 정보가 없으므로 겹침으로 연결되는 청크끼리 원래 순서가 복원되고,
+연결되지 않는 조각은 검색 순서(관련도 순)를 유지함.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from schemas.schemas import Document
+
+# 이어 붙이기 위해 필요한 최소 겹침 글자 수 (우연한 일치 방지)
+MIN_OVERLAP_CHARS = 20
+# 겹침을 찾을 앞 청크 끝부분의 길이 (청킹 overlap 200자보다 넉넉하게)
+MAX_OVERLAP_CHARS = 400
+# 같은 페이지에서 이어지지 않는 조각 사이의 구분자
+PIECE_SEPARATOR = "\n...\n"
+
+
+def _overlap(left: str, right: str) -> int:
+    """`left`의 끝과 `right`의 시작이 겹치는 가장 긴 글자 수 (없으면 0)."""
+    tail = left[-MAX_OVERLAP_CHARS:]
+    probe = right[:MIN_OVERLAP_CHARS]
+    if len(probe) < MIN_OVERLAP_CHARS:
+        return 0
+    start = tail.find(probe)
+    while start != -1:
+        length = len(tail) - start
+        if right.startswith(tail[start:]):
+            return length
+        start = tail.find(probe, start + 1)
+    return 0
+
+
+def stitch_chunks(chunks: Sequence[str]) -> List[str]:
+    """
+    겹치는 청크를 이어 붙인 조각 목록. 다른 청크에 완전히 포함된 청크는 제거.
+    조각 순서는 각 조각에 포함된 청크 중 가장 먼저 검색된 청크의 순서.
+    """
+    pieces: List[str] = []
+    for chunk in chunks:
+        if not chunk or any(chunk in piece for piece in pieces):
+            continue
+        contained = [i for i, piece in enumerate(pieces) if piece in chunk]
+        if contained:
+            # 새 청크에 포함된 조각은 첫 번째 조각 위치에서 새 청크로 대체
+            pieces[contained[0]] = chunk
+            pieces = [piece for i, piece in enumerate(pieces) if i not in contained[1:]]
+        else:
+            pieces.append(chunk)
+
+    merged = True
+    while merged:
+        merged = False
+        for i, left in enumerate(pieces):
+            for j, right in enumerate(pieces):
+                if i == j:
+                    continue
+                length = _overlap(left, right)
+                if length:
+                    pieces[min(i, j)] = left + right[length:]
+                    del pieces[max(i, j)]
+                    merged = True
+                    break
+            if merged:
+                break
+    return pieces
+
+
+def compact_context(context: Optional[Sequence[Document]]) -> List[Document]:
+    """
+    청크를 페이지별 문서 하나로 합쳐서 반환 (페이지 순서는 가장 먼저 검색된 청크 기준).
+    토큰 예산은 프롬프트 생성 시(`prompt.llm_answer`) 순위가 낮은 문서부터 제외하는 방식으로 적용.
+    """
+    pages: Dict[Tuple[Optional[str], Optional[str]], List[Document]] = {}
+    for document in context or []:
+        pages.setdefault((document.datasource, document.page_id), []).append(document)
+
+    compacted = []
+    for (datasource, page_id), documents in pages.items():
+        pieces = stitch_chunks([document.content for document in documents])
+        if pieces:
+            compacted.append(
+                Document(
+                    content=PIECE_SEPARATOR.join(pieces),
+                    datasource=datasource,
+                    updated_at=max(
+                        (d.updated_at for d in documents if d.updated_at), default=None
+                    ),
+                    page_id=page_id,
+                )
+            )
+    return compacted
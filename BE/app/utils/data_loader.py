@@ -2,32 +2,42 @@
 데이터소스(ex. notion)에서 문서를 가져오는 모듈
 """
 
-from typing import List, Dict, Any, Union
+import functools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from notion_client import AsyncClient
 from notion_client.errors import APIResponseError
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from core.config import settings
 from core.exception import CustomException, ExceptionCase
-from schemas.schemas import Document, DocumentInput, DocumentMetadata
+from schemas.schemas import Document, IngestionStats, PageCheckpoint, PageSyncInfo
 from services.qdrant_service import QdrantService
 from services.gemini import GeminiService
-from db.models import DataSource
+from db.models import ChunkStrategy, DataSource
+from utils.chunking import asplit_pages
+from utils.ingestion_pipeline import IngestionPipeline, PageSink, normalize_page_id
+from utils.notion_crawler import ConcurrentNotionCrawler, CrawlStats
+from utils.rate_limiter import TokenBucketRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# 모든 NotionDataLoader 인스턴스가 공유하는 Notion API 요청 제한
+notion_rate_limiter = TokenBucketRateLimiter(
+    rate=settings.NOTION_REQUESTS_PER_SECOND,
+    capacity=settings.NOTION_RATE_LIMIT_BURST,
+)
 
 
 class NotionDataLoader:
     DATASOURCE = DataSource.NOTION.value
 
-    def __init__(self):
-        self.notion = AsyncClient(auth=settings.NOTION_API_KEY)
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200,
-            separators=["\n\n", "\n", ". ", " ", ""],
-            length_function=len,
-        )
+    def __init__(self, notion: Optional[AsyncClient] = None):
+        # 벤치마크/검증 시 Notion API 대신 `benchmarks.fake_notion.FakeNotionClient` 주입 가능
+        self.notion = notion or AsyncClient(auth=settings.NOTION_API_KEY)
         self.gemini = GeminiService()
         self.qdrant = QdrantService()
+        self.crawl_stats = CrawlStats()
 
     def _get_text_from_block(self, block: Dict[str, Any]) -> str:
         """단일 블록에서 텍스트를 추출."""
@@ -74,6 +84,7 @@ class NotionDataLoader:
         try:
             # 페이지네이션을 처리하며 모든 자식 블록 가져오기
             paginated_blocks = await self.notion.blocks.children.list(block_id=block_id)
+            self.crawl_stats.requests += 1
             children_blocks = paginated_blocks.get("results", [])
 
             next_cursor = paginated_blocks.get("next_cursor")
@@ -81,8 +92,10 @@ class NotionDataLoader:
                 paginated_blocks = await self.notion.blocks.children.list(
                     block_id=block_id, start_cursor=next_cursor
                 )
+                self.crawl_stats.requests += 1
                 children_blocks.extend(paginated_blocks.get("results", []))
                 next_cursor = paginated_blocks.get("next_cursor")
+            self.crawl_stats.blocks_visited += len(children_blocks)
 
             for block in children_blocks:
                 # 현재 블록에서 텍스트 추출
@@ -98,6 +111,8 @@ class NotionDataLoader:
                         updated_at = cache_page_updated_at[page_id]
                     else:
                         page_info = await self.notion.pages.retrieve(page_id=page_id)
+                        self.crawl_stats.requests += 1
+                        self.crawl_stats.pages_visited += 1
                         updated_at = page_info["last_edited_time"]
                         cache_page_updated_at[page_id] = updated_at
 
@@ -136,8 +151,48 @@ class NotionDataLoader:
 
         return results
 
+    async def _retrieve_start_page(
+        self, start_page_id: str, include_title: bool = True
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        시작 페이지의 메타데이터(업데이트 시간)와 제목을 가져옴.
+        하위 페이지를 단독으로 다시 수집할 때는 `include_title = False`로 제목 행을 생략해,
+        루트 문서 크롤링에서 하위 페이지로 수집될 때와 같은 내용(내용 해시, Point ID)이 되도록 함.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], str]: 제목 데이터 리스트(생략 시 빈 리스트), 페이지 업데이트 시간
+        """
+        await notion_rate_limiter.acquire()
+        page_info = await self.notion.pages.retrieve(page_id=start_page_id)
+        self.crawl_stats.requests += 1
+        self.crawl_stats.pages_visited += 1
+        updated_at = page_info.get("last_edited_time")
+        if not include_title:
+            return [], updated_at
+
+        # 페이지 자체의 제목도 content에 포함시킵니다.
+        title_property = page_info.get("properties", {}).get("title", {})
+        if title_property.get("type") == "title":
+            page_title = "".join(
+                [t.get("plain_text", "") for t in title_property.get("title", [])]
+            )
+        else:
+            page_title = "제목 없음"
+
+        initial_data = [
+            {
+                "content": page_title,
+                "updated_at": updated_at,
+                "page_id": start_page_id,
+            }
+        ]
+        return initial_data, updated_at
+
     async def _extract_text_from_notion(
-        self, start_page_id: str, recursive_page: bool = False
+        self,
+        start_page_id: str,
+        recursive_page: bool = False,
+        is_root_page: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         시작 페이지 ID를 받아 해당 페이지와 모든 하위 블록의 텍스트를 추출.
@@ -145,43 +200,51 @@ class NotionDataLoader:
 
         Args:
             start_page_id (str): 텍스트 추출을 시작할 Notion 페이지의 ID
+            is_root_page (bool): 등록 문서(루트 페이지)이면 True. 하위 페이지면 제목 행을 생략
 
         Returns:
             List[Dict[str, Any]]: 벡터 DB에 저장될 데이터 딕셔너리 리스트
                                 (예: [{'content': '...', 'updated_at': '...', 'page_id': '...', 'block_id': '...'}])
         """
 
+        self.crawl_stats = CrawlStats()
+        start_time = time.perf_counter()
+
         try:
-            # 시작 페이지의 메타데이터(업데이트 시간)를 가져옵니다.
-            page_info = await self.notion.pages.retrieve(page_id=start_page_id)
-            updated_at = page_info.get("last_edited_time")
-
-            # 페이지 자체의 제목도 content에 포함시킵니다.
-            title_property = page_info.get("properties", {}).get("title", {})
-            if title_property.get("type") == "title":
-                page_title = "".join(
-                    [t.get("plain_text", "") for t in title_property.get("title", [])]
+            initial_data, updated_at = await self._retrieve_start_page(
+                start_page_id, include_title=is_root_page
+            )
+
+            # 페이지 하위의 블록들을 재귀적으로 탐색하여 텍스트를 추출합니다.
+            if settings.NOTION_CONCURRENT_CRAWL:
+                crawler = ConcurrentNotionCrawler(
+                    notion=self.notion,
+                    text_extractor=self._get_text_from_block,
+                    concurrency=settings.NOTION_CRAWL_CONCURRENCY,
+                    rate_limiter=notion_rate_limiter,
+                    stats=self.crawl_stats,
+                )
+                crawler.seed_page(start_page_id, updated_at)
+                block_data = await crawler.fetch_blocks(
+                    block_id=start_page_id,
+                    page_id=start_page_id,
+                    updated_at=updated_at,
+                    recursive_page=recursive_page,
                 )
             else:
-                page_title = "제목 없음"
-
-            initial_data = [
-                {
-                    "content": page_title,
-                    "updated_at": updated_at,
-                    "page_id": start_page_id,
-                }
-            ]
-
-            cache_page_updated_at = {start_page_id: updated_at}
+                cache_page_updated_at = {start_page_id: updated_at}
+                block_data = await self._recursively_fetch_blocks(
+                    block_id=start_page_id,
+                    page_id=start_page_id,
+                    updated_at=updated_at,
+                    cache_page_updated_at=cache_page_updated_at,
+                    recursive_page=recursive_page,
+                )
 
-            # 페이지 하위의 블록들을 재귀적으로 탐색하여 텍스트를 추출합니다.
-            block_data = await self._recursively_fetch_blocks(
-                block_id=start_page_id,
-                page_id=start_page_id,
-                updated_at=updated_at,
-                cache_page_updated_at=cache_page_updated_at,
-                recursive_page=recursive_page,
+            self.crawl_stats.wall_time = time.perf_counter() - start_time
+            logger.info(
+                f"Notion crawl finished (page_id={start_page_id}): "
+                f"{self.crawl_stats.model_dump()}"
             )
 
             return initial_data + block_data
@@ -197,12 +260,18 @@ class NotionDataLoader:
                 detail=str(e),
             )
 
-    def _chunk_context(self, extract_results: List[dict]) -> List[Document]:
+    async def _chunk_context(
+        self,
+        extract_results: List[dict],
+        chunk_strategy: ChunkStrategy = ChunkStrategy.CHARACTER,
+    ) -> List[Document]:
         """
         추출한 block 리스트를 받아서 청킹 후 document 반환.
+        청킹은 프로세스 풀에서 페이지 묶음 단위로 실행되어 이벤트 루프를 막지 않음.
 
         Args:
             extract_results: 노션 페이지에서 추출한 블록 리스트.
+            chunk_strategy: 청킹 전략. `STRUCTURE`이면 heading 기준 섹션 단위로 청킹.
         """
         try:
             extract_results_dict = {}
@@ -215,12 +284,19 @@ class NotionDataLoader:
                     extract_results_dict.update(
                         {page_id: {"updated_at": updated_at, "content": []}}
                     )
-                extract_results_dict[page_id]["content"].append(content)
+                extract_results_dict[page_id]["content"].append(
+                    (content, block.get("block_type"))
+                )
+
+            page_chunks = await asplit_pages(
+                [item["content"] for item in extract_results_dict.values()],
+                strategy=chunk_strategy,
+            )
 
             document_list = []
-            for page_id, item in extract_results_dict.items():
-                corpus = "\n".join(item["content"])
-                chunks = self.text_splitter.split_text(corpus)
+            for (page_id, item), chunks in zip(
+                extract_results_dict.items(), page_chunks
+            ):
                 for chunk in chunks:
                     document = Document(
                         content=chunk,
@@ -238,13 +314,18 @@ class NotionDataLoader:
             )
 
     async def get_documents(
-        self, page_id: str, recursive_page: bool = False
+        self,
+        page_id: str,
+        recursive_page: bool = False,
+        chunk_strategy: ChunkStrategy = ChunkStrategy.CHARACTER,
     ) -> List[Document]:
         try:
             extract_results = await self._extract_text_from_notion(
                 start_page_id=page_id, recursive_page=recursive_page
             )
-            document_list = self._chunk_context(extract_results)
+            document_list = await self._chunk_context(
+                extract_results, chunk_strategy=chunk_strategy
+            )
 
             return document_list
 
@@ -253,31 +334,164 @@ class NotionDataLoader:
                 exception_case=ExceptionCase.DATALOAD_ERROR, detail=str(e)
             )
 
+    async def get_edited_pages(self, since: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Notion 검색 API로 `since` 이후 수정된 페이지를 최근 수정 순으로 조회.
+        결과가 수정 시간 내림차순이므로 `since`보다 오래된 페이지가 나오면 조회를 멈춤.
+
+        Args:
+            since (Optional[str]): 마지막 동기화 기준 수정 시간 (ISO 8601). None이면 모든 페이지 조회
+
+        Returns:
+            List[Dict[str, Any]]: [{'page_id': ..., 'last_edited_time': ..., 'parent_page_id': ...}]
+        """
+        edited_pages = []
+        try:
+            next_cursor = None
+            while True:
+                await notion_rate_limiter.acquire()
+                response = await self.notion.search(
+                    filter={"property": "object", "value": "page"},
+                    sort={"direction": "descending", "timestamp": "last_edited_time"},
+                    page_size=100,
+                    **({"start_cursor": next_cursor} if next_cursor else {}),
+                )
+                for page in response.get("results", []):
+                    last_edited_time = page.get("last_edited_time")
+                    if since and last_edited_time < since:
+                        return edited_pages
+                    edited_pages.append(
+                        {
+                            "page_id": page["id"],
+                            "last_edited_time": last_edited_time,
+                            "parent_page_id": page.get("parent", {}).get("page_id"),
+                        }
+                    )
+
+                next_cursor = response.get("next_cursor")
+                if not response.get("has_more") or not next_cursor:
+                    return edited_pages
+
+        except APIResponseError as e:
+            raise CustomException(
+                exception_case=ExceptionCase.DATALOAD_ERROR,
+                detail=f"수정된 페이지 목록을 가져오는 데 실패했습니다: {e}",
+            )
+
     async def upload_documents(
         self,
         page_id: str,
         user_groups: List[str],
         recursive_page: bool = True,
-    ) -> None:
-        try:
-            extract_results = await self._extract_text_from_notion(
-                start_page_id=page_id, recursive_page=recursive_page
+        incremental: bool = True,
+        progress_callback: Optional[Callable[[IngestionStats], Awaitable[None]]] = None,
+        known_pages: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None,
+        chunk_strategy: ChunkStrategy = ChunkStrategy.CHARACTER,
+        checkpoints: Optional[Dict[str, PageCheckpoint]] = None,
+        checkpoint_callback: Optional[
+            Callable[[PageCheckpoint], Awaitable[None]]
+        ] = None,
+        is_root_page: bool = True,
+    ) -> IngestionStats:
+        """
+        페이지(및 하위 페이지)를 청킹, 임베딩하여 벡터 DB와 동기화.
+        Point ID는 (datasource, page_id, 청크 내용 해시)로 결정되므로 재업로드해도 중복 저장되지 않음.
+        `incremental = True`이면 이미 저장된 청크는 임베딩/업로드를 생략하고 새 청크만 업로드.
+        두 모드 모두 더 이상 페이지에 없는 청크는 삭제.
+
+        크롤링이 끝나기를 기다리지 않고 페이지 단위로 청킹/임베딩/업로드를 진행하므로
+        (IngestionPipeline), 먼저 크롤링된 페이지부터 검색 가능해짐.
+        `known_pages`(page_id -> (수정 시간, 내용 해시))의 내용 해시와 같은 페이지는 업로드를 생략.
+        청킹 전략을 바꾸면 청크 내용이 달라지므로 기존 청크는 삭제되고 새 청크로 교체됨.
+        크롤링이 끝나면 청크가 없는 페이지와 `known_pages` 중 트리에서 빠진 페이지의 청크도 삭제.
+
+        업로드가 끝난 페이지마다 `checkpoint_callback`이 호출되며, 중단된 작업을 재개할 때
+        `checkpoints`로 넘기면 수정되지 않은 완료 페이지는 다시 크롤링하지 않음 (동시 크롤링 모드).
+        등록 문서의 하위 페이지를 단독으로 다시 수집할 때는 `is_root_page = False`로 넘겨 제목 행을 생략.
+        """
+        self.crawl_stats = CrawlStats()
+        crawler = None
+        if settings.NOTION_CONCURRENT_CRAWL:
+            crawler = ConcurrentNotionCrawler(
+                notion=self.notion,
+                text_extractor=self._get_text_from_block,
+                concurrency=settings.NOTION_CRAWL_CONCURRENCY,
+                rate_limiter=notion_rate_limiter,
+                stats=self.crawl_stats,
+                completed_pages=checkpoints,
+                max_active_pages=settings.NOTION_CRAWL_MAX_ACTIVE_PAGES,
             )
-            document_list = self._chunk_context(extract_results)
-            document_input_list = [
-                DocumentInput(
-                    embedding=await self.gemini.generate_embedding(
-                        contents=document.content, task="RETRIEVAL_DOCUMENT"
-                    ),
-                    metadata=DocumentMetadata(
-                        user_groups=user_groups,
-                        **document.model_dump(),
-                    ),
+
+        async def on_page_done(sync_info: PageSyncInfo) -> None:
+            child_page_ids = crawler.child_pages.get(sync_info.page_id, [])
+            await checkpoint_callback(
+                PageCheckpoint(**sync_info.model_dump(), child_page_ids=child_page_ids)
+            )
+
+        pipeline = IngestionPipeline(
+            datasource=self.DATASOURCE,
+            chunker=functools.partial(
+                self._chunk_context, chunk_strategy=chunk_strategy
+            ),
+            gemini=self.gemini,
+            qdrant=self.qdrant,
+            user_groups=user_groups,
+            incremental=incremental,
+            batch_size=settings.EMBEDDING_BATCH_SIZE,
+            workers=settings.EMBEDDING_MAX_CONCURRENCY,
+            page_queue_size=settings.INGESTION_PAGE_QUEUE_SIZE,
+            chunk_batch_pages=settings.CHUNKING_BATCH_PAGES,
+            progress_callback=progress_callback,
+            known_pages=known_pages,
+            page_callback=on_page_done if crawler and checkpoint_callback else None,
+        )
+
+        async def crawl(page_sink: PageSink) -> None:
+            if not crawler:
+                await page_sink(
+                    await self._extract_text_from_notion(
+                        start_page_id=page_id,
+                        recursive_page=recursive_page,
+                        is_root_page=is_root_page,
+                    )
                 )
-                for document in document_list
-            ]
-            await self.qdrant.upsert_document(document_input_list)
+                return
 
+            start_time = time.perf_counter()
+            initial_data, updated_at = await self._retrieve_start_page(
+                page_id, include_title=is_root_page
+            )
+            crawler.seed_page(page_id, updated_at)
+            await crawler.crawl_pages(
+                page_id=page_id,
+                updated_at=updated_at,
+                page_sink=page_sink,
+                recursive_page=recursive_page,
+                initial_blocks=initial_data,
+            )
+            pipeline.crawled_page_ids.update(crawler.child_pages)
+            pipeline.live_page_ids.update(
+                normalize_page_id(checkpoint.page_id)
+                for checkpoint in crawler.resumed_pages
+            )
+            self.crawl_stats.wall_time = time.perf_counter() - start_time
+            logger.info(
+                f"Notion crawl finished (page_id={page_id}): "
+                f"{self.crawl_stats.model_dump()}"
+            )
+
+        try:
+            stats = await pipeline.run(crawl)
+            # 체크포인트로 생략한 페이지도 이번 수집 결과에 포함
+            for checkpoint in crawler.resumed_pages if crawler else []:
+                stats.page_count += 1
+                stats.chunk_count += checkpoint.chunk_count
+                stats.pages.append(PageSyncInfo(**checkpoint.model_dump()))
+            logger.info(f"Synced page {page_id}: {stats.model_dump()}")
+            return stats
+
+        except CustomException:
+            raise
         except Exception as e:
             raise CustomException(
                 exception_case=ExceptionCase.DATALOAD_ERROR, detail=str(e)
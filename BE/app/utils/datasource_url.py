@@ -2,6 +2,7 @@
 데이터소스(ex. notion)의 url을 생성하거나 page_id를 추출하는 전처리 모듈
 """
 
+import re
 from db.models import DataSource
 from core.exception import CustomException, ExceptionCase
 
@@ -15,14 +16,27 @@ def context_url(datasource: DataSource, page_id: str) -> str:
         )
 
 
+# URL 끝의 페이지 ID (하이픈 없는 32자리 또는 UUID 형식)
+NOTION_PAGE_ID_PATTERN = re.compile(
+    r"([0-9a-f]{8})-?([0-9a-f]{4})-?([0-9a-f]{4})-?([0-9a-f]{4})-?([0-9a-f]{12})$",
+    re.IGNORECASE,
+)
+
+
 def extract_page_id(url: str, datasource: DataSource) -> str:
     try:
         if datasource == DataSource.NOTION:
-            return url.split("?")[0].split("/")[-1].split("-")[-1]
+            path = url.split("?")[0].split("#")[0].rstrip("/").split("/")[-1]
+            match = NOTION_PAGE_ID_PATTERN.search(path)
+            if not match:
+                raise ValueError(f"{url} has no Notion page ID")
+            return "".join(match.groups())
         else:
             raise CustomException(
                 exception_case=ExceptionCase.INVALID_INPUT, detail="Invalid datasource"
             )
+    except CustomException:
+        raise
     except Exception as e:
         raise CustomException(
             exception_case=ExceptionCase.INVALID_INPUT,
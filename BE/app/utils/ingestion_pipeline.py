@@ -0,0 +1,337 @@
+"""
+크롤링 -> 청킹 -> 임베딩 -> 업로드를 큐로 연결된 비동기 단계(stage)로 처리하는 수집 파이프라인 모듈.
+각 큐의 크기가 제한되어 있어 느린 단계가 앞 단계를 대기시키므로(backpressure),
+전체 문서 크기와 관계없이 메모리 사용량이 일정하고 먼저 크롤링된 청크부터 검색 가능해짐.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from schemas.schemas import (
+    Document,
+    DocumentInput,
+    DocumentMetadata,
+    IngestionStats,
+    PageSyncInfo,
+)
+from services.gemini import GeminiService
+from services.qdrant_service import QdrantService
+from utils.bm25 import document_sparse_embedding
+from utils.point_id import content_hash, make_point_id
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_page_id(page_id: str) -> str:
+    """하이픈 유무와 관계없이 같은 페이지를 비교하기 위한 page_id."""
+    return page_id.replace("-", "")
+
+
+PageSink = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+class _PendingPage:
+    """업로드가 끝난 뒤 정리(오래된 청크 삭제, payload 갱신)가 필요한 페이지 상태"""
+
+    def __init__(
+        self,
+        page_id: str,
+        updated_at: str,
+        stale_point_ids: List[str],
+        kept: bool,
+        sync_info: PageSyncInfo,
+    ):
+        self.page_id = page_id
+        self.updated_at = updated_at
+        self.stale_point_ids = stale_point_ids
+        self.kept = kept
+        self.sync_info = sync_info
+        # 아직 업로드되지 않은 배치 수. sealed 이후 0이 되면 정리 수행
+        self.remaining_batches = 0
+        self.sealed = False
+
+
+class _Batch:
+    def __init__(self):
+        self.documents: List[Tuple[str, Document]] = []
+        self.pages: Set[_PendingPage] = set()
+
+
+class IngestionPipeline:
+    """
+    크롤러가 페이지를 넘겨주는 동안 청킹, 임베딩, 업로드를 고정 크기 배치로 동시에 수행.
+
+    - crawl stage: 페이지 블록 목록을 page queue에 넣음 (큐가 가득 차면 크롤링 대기)
+    - chunk stage: 페이지를 청킹하고 기존 청크와 비교한 뒤 새 청크만 batch queue에 넣음.
+      page queue에 이미 쌓인 페이지는 `chunk_batch_pages`개까지 한 번에 청킹
+    - embed/upsert stage: 배치를 임베딩 후 업로드. 페이지의 모든 배치가 끝나면 오래된 청크 삭제
+
+    `known_pages`(page_id -> (수정 시간, 내용 해시))가 주어지면 내용 해시가 같은 페이지는
+    벡터 DB 조회 없이 건너뜀.
+    `page_callback`은 페이지의 청크가 모두 업로드/정리된 뒤 호출됨 (체크포인트 기록용).
+
+    크롤링이 끝나면 청크가 하나도 만들어지지 않은 페이지(`crawled_page_ids`, `known_pages` 중
+    `live_page_ids`에 없는 페이지)의 청크를 삭제함. 비어 있거나 트리에서 빠진 페이지가 대상.
+    """
+
+    def __init__(
+        self,
+        datasource: str,
+        chunker: Callable[[List[Dict[str, Any]]], Awaitable[List[Document]]],
+        gemini: GeminiService,
+        qdrant: QdrantService,
+        user_groups: List[str],
+        incremental: bool = True,
+        batch_size: int = 100,
+        workers: int = 4,
+        page_queue_size: int = 16,
+        chunk_batch_pages: int = 8,
+        progress_callback: Optional[Callable[[IngestionStats], Awaitable[None]]] = None,
+        known_pages: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None,
+        page_callback: Optional[Callable[[PageSyncInfo], Awaitable[None]]] = None,
+    ):
+        self.datasource = datasource
+        self.chunker = chunker
+        self.gemini = gemini
+        self.qdrant = qdrant
+        self.user_groups = user_groups
+        self.incremental = incremental
+        self.batch_size = batch_size
+        self.workers = workers
+        self.chunk_batch_pages = max(1, chunk_batch_pages)
+        self.progress_callback = progress_callback
+        self.known_pages = known_pages or {}
+        self.page_callback = page_callback
+
+        self.page_queue: asyncio.Queue = asyncio.Queue(maxsize=page_queue_size)
+        self.batch_queue: asyncio.Queue = asyncio.Queue(maxsize=workers)
+        self.stats = IngestionStats()
+        # 크롤링에서 확인된 페이지 (블록이 없는 페이지 포함, 크롤러가 기록)
+        self.crawled_page_ids: Set[str] = set()
+        # 이번 수집에서 청크가 만들어졌거나 체크포인트로 유지된 페이지 (하이픈 제거한 ID)
+        self.live_page_ids: Set[str] = set()
+
+    async def run(self, crawl: Callable[[PageSink], Awaitable[None]]) -> IngestionStats:
+        """`crawl(page_sink)`이 넘겨주는 페이지들을 모두 처리하고 통계 반환."""
+        tasks = [
+            asyncio.create_task(self._crawl_stage(crawl)),
+            asyncio.create_task(self._chunk_stage()),
+            *[
+                asyncio.create_task(self._embed_upsert_stage())
+                for _ in range(self.workers)
+            ],
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        # 크롤링이 끝까지 완료된 경우에만 청크가 없어진 페이지 정리
+        await self._delete_removed_pages()
+
+        # `wait=False` 업로드가 모두 반영된 뒤 수집 완료로 처리
+        start_time = time.perf_counter()
+        await self.qdrant.wait_for_upserts()
+        self.stats.upsert_seconds += time.perf_counter() - start_time
+        return self.stats
+
+    async def _crawl_stage(self, crawl: Callable[[PageSink], Awaitable[None]]) -> None:
+        start_time = time.perf_counter()
+        try:
+            await crawl(self.page_queue.put)
+        finally:
+            self.stats.crawl_seconds = time.perf_counter() - start_time
+        await self.page_queue.put(None)
+
+    async def _chunk_stage(self) -> None:
+        batch = _Batch()
+
+        async def flush() -> None:
+            nonlocal batch
+            for page in batch.pages:
+                page.remaining_batches += 1
+            await self.batch_queue.put(batch)
+            batch = _Batch()
+
+        crawl_finished = False
+        while not crawl_finished:
+            blocks = await self.page_queue.get()
+            if blocks is None:
+                break
+
+            # 이미 크롤링되어 기다리는 페이지는 함께 청킹 (프로세스 풀 호출 횟수 감소)
+            page_count = 1
+            while page_count < self.chunk_batch_pages and not self.page_queue.empty():
+                next_blocks = self.page_queue.get_nowait()
+                if next_blocks is None:
+                    crawl_finished = True
+                    break
+                blocks = blocks + next_blocks
+                page_count += 1
+
+            page_documents: Dict[str, Dict[str, Document]] = {}
+            for document in await self.chunker(blocks):
+                point_id = make_point_id(
+                    self.datasource, document.page_id, document.content
+                )
+                page_documents.setdefault(document.page_id, {})[point_id] = document
+
+            for page_id, documents in page_documents.items():
+                self.live_page_ids.add(normalize_page_id(page_id))
+                updated_at = next(iter(documents.values())).updated_at
+                sync_info = PageSyncInfo(
+                    page_id=page_id,
+                    updated_at=updated_at,
+                    chunk_count=len(documents),
+                    content_hash=content_hash(
+                        "\n".join(document.content for document in documents.values())
+                    ),
+                )
+                self.stats.page_count += 1
+                self.stats.chunk_count += len(documents)
+
+                known_updated_at, known_hash = self.known_pages.get(
+                    page_id, (None, None)
+                )
+                if self.incremental and known_hash == sync_info.content_hash:
+                    # 내용이 같으면 수정 시간만 갱신
+                    page = _PendingPage(
+                        page_id=page_id,
+                        updated_at=updated_at,
+                        stale_point_ids=[],
+                        kept=known_updated_at != updated_at,
+                        sync_info=sync_info,
+                    )
+                    await self._finalize_page(page)
+                    continue
+
+                stored = await self.qdrant.get_point_ids(
+                    datasource=self.datasource, page_id=page_id
+                )
+                page = _PendingPage(
+                    page_id=page_id,
+                    updated_at=updated_at,
+                    stale_point_ids=list(stored - documents.keys()),
+                    kept=self.incremental and bool(stored & documents.keys()),
+                    sync_info=sync_info,
+                )
+
+                for point_id, document in documents.items():
+                    if self.incremental and point_id in stored:
+                        continue
+                    batch.documents.append((point_id, document))
+                    batch.pages.add(page)
+                    if len(batch.documents) >= self.batch_size:
+                        await flush()
+
+                page.sealed = True
+                if page.remaining_batches == 0 and page not in batch.pages:
+                    await self._finalize_page(page)
+
+            # 다음 페이지가 바로 없으면 남은 청크를 먼저 업로드해서 검색 가능하게 함
+            if self.page_queue.empty() and batch.documents:
+                await flush()
+
+        if batch.documents:
+            await flush()
+        for _ in range(self.workers):
+            await self.batch_queue.put(None)
+
+    async def _embed_upsert_stage(self) -> None:
+        while True:
+            batch = await self.batch_queue.get()
+            if batch is None:
+                break
+
+            start_time = time.perf_counter()
+            embeddings = await self.gemini.generate_embeddings(
+                contents=[document.content for _, document in batch.documents],
+                task="RETRIEVAL_DOCUMENT",
+                max_concurrency=1,
+            )
+            self.stats.embed_seconds += time.perf_counter() - start_time
+            self.stats.embedded_count += len(embeddings)
+
+            start_time = time.perf_counter()
+            await self.qdrant.upsert_document(
+                [
+                    DocumentInput(
+                        id=point_id,
+                        embedding=embedding,
+                        sparse_embedding=document_sparse_embedding(document.content),
+                        metadata=DocumentMetadata(
+                            user_groups=self.user_groups,
+                            **document.model_dump(),
+                        ),
+                    )
+                    for (point_id, document), embedding in zip(
+                        batch.documents, embeddings
+                    )
+                ]
+            )
+            self.stats.upsert_seconds += time.perf_counter() - start_time
+            self.stats.upserted_count += len(batch.documents)
+
+            for page in batch.pages:
+                page.remaining_batches -= 1
+                if page.sealed and page.remaining_batches == 0:
+                    await self._finalize_page(page)
+
+            await self._report_progress()
+
+    async def _finalize_page(self, page: _PendingPage) -> None:
+        """페이지의 새 청크가 모두 업로드된 뒤 오래된 청크 삭제 및 유지된 청크의 payload 갱신."""
+        start_time = time.perf_counter()
+        if page.stale_point_ids:
+            await self.qdrant.delete_document(page.stale_point_ids)
+            self.stats.deleted_count += len(page.stale_point_ids)
+        if page.kept:
+            await self.qdrant.update_document_payload(
+                datasource=self.datasource,
+                page_id=page.page_id,
+                update_metadata=DocumentMetadata(
+                    user_groups=self.user_groups, updated_at=page.updated_at
+                ),
+            )
+        self.stats.upsert_seconds += time.perf_counter() - start_time
+        self.stats.pages.append(page.sync_info)
+        if self.page_callback:
+            await self.page_callback(page.sync_info)
+        await self._report_progress()
+
+    async def _delete_removed_pages(self) -> None:
+        """이번 수집에서 청크가 만들어지지 않은 페이지의 저장된 청크 삭제."""
+        # 벡터 DB에 저장된 형식(`known_pages`의 키)을 우선 사용
+        candidates = {
+            normalize_page_id(page_id): page_id for page_id in self.crawled_page_ids
+        }
+        candidates.update(
+            {normalize_page_id(page_id): page_id for page_id in self.known_pages}
+        )
+
+        start_time = time.perf_counter()
+        for key, page_id in candidates.items():
+            if key in self.live_page_ids:
+                continue
+            stored = await self.qdrant.get_point_ids(
+                datasource=self.datasource, page_id=page_id
+            )
+            if stored:
+                await self.qdrant.delete_document(list(stored))
+                self.stats.deleted_count += len(stored)
+            self.stats.removed_page_ids.append(page_id)
+        self.stats.upsert_seconds += time.perf_counter() - start_time
+
+        if self.stats.removed_page_ids:
+            logger.info(
+                f"Deleted chunks of {len(self.stats.removed_page_ids)} removed pages "
+                f"(datasource={self.datasource})"
+            )
+
+    async def _report_progress(self) -> None:
+        if self.progress_callback:
+            await self.progress_callback(self.stats)
@@ -0,0 +1,50 @@
+"""
+검색 결과 다양화를 위한 MMR(Maximal Marginal Relevance) 모듈.
+질의와의 유사도는 높고 이미 선택한 청크와의 유사도는 낮은 후보를 차례로 선택.
+"""
+
+from typing import List, Sequence
+import numpy as np
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def mmr_select(
+    query_embedding: Sequence[float],
+    candidate_embeddings: Sequence[Sequence[float]],
+    k: int,
+    lambda_mult: float = 0.5,
+) -> List[int]:
+    """
+    MMR로 후보 중 k개를 골라 선택 순서대로 인덱스 반환.
+
+    Args:
+        query_embedding: 질의 임베딩.
+        candidate_embeddings: 후보 청크 임베딩 목록.
+        k: 선택할 개수.
+        lambda_mult: 1이면 질의 유사도만, 0이면 다양성만 고려.
+
+    Returns:
+        List[int]: 선택된 후보의 인덱스 목록.
+    """
+    if not candidate_embeddings or k <= 0:
+        return []
+
+    query = _normalize(np.asarray(query_embedding, dtype=np.float32))
+    candidates = _normalize(np.asarray(candidate_embeddings, dtype=np.float32))
+    query_similarity = candidates @ query
+    candidate_similarity = candidates @ candidates.T
+
+    selected = [int(np.argmax(query_similarity))]
+    # 후보별로 이미 선택된 청크와의 최대 유사도
+    max_similarity = candidate_similarity[selected[0]].copy()
+    while len(selected) < min(k, len(candidates)):
+        scores = lambda_mult * query_similarity - (1 - lambda_mult) * max_similarity
+        scores[selected] = -np.inf
+        index = int(np.argmax(scores))
+        selected.append(index)
+        np.maximum(max_similarity, candidate_similarity[index], out=max_similarity)
+    return selected
@@ -0,0 +1,265 @@
+"""
+Notion 블록 트리를 동시에(concurrent) 탐색하는 크롤러 모듈.
+형제 블록과 하위 페이지를 병렬로 탐색하되, 동시 요청 수와 초당 요청 수를 제한함.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from pydantic import BaseModel
+from notion_client import AsyncClient
+from notion_client.errors import APIResponseError, APIErrorCode
+
+from core.exception import CustomException, ExceptionCase
+from schemas.schemas import PageCheckpoint
+from utils.rate_limiter import TokenBucketRateLimiter
+
+
+class CrawlStats(BaseModel):
+    """크롤링 통계 (순차/동시 탐색 비교용)"""
+
+    mode: str = "sequential"
+    requests: int = 0
+    pages_visited: int = 0
+    blocks_visited: int = 0
+    pages_resumed: int = 0
+    rate_limited: int = 0
+    wall_time: float = 0.0
+
+
+class ConcurrentNotionCrawler:
+    """
+    블록 트리를 동시에 탐색하는 크롤러.
+    반환 결과의 순서와 메타데이터(page_id, updated_at, block_type)는
+    `NotionDataLoader._recursively_fetch_blocks`(순차 탐색)와 동일함.
+
+    `completed_pages`(page_id -> 체크포인트)에 있고 수정 시간이 같은 페이지는 `crawl_pages`에서
+    블록을 탐색하지 않고, 체크포인트에 기록된 하위 페이지만 이어서 탐색함.
+
+    `crawl_pages`는 페이지마다 탐색 슬롯(`max_active_pages`)을 얻은 뒤 블록을 조회하고
+    `page_sink`에 전달할 때까지 유지하므로, `page_sink`가 대기하면 새 페이지 탐색도 멈춤.
+    """
+
+    def __init__(
+        self,
+        notion: AsyncClient,
+        text_extractor: Callable[[Dict[str, Any]], str],
+        concurrency: int,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        stats: Optional[CrawlStats] = None,
+        max_retries: int = 3,
+        completed_pages: Optional[Dict[str, PageCheckpoint]] = None,
+        max_active_pages: int = 4,
+    ):
+        self.notion = notion
+        self.text_extractor = text_extractor
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.page_slots = asyncio.Semaphore(max_active_pages)
+        self.rate_limiter = rate_limiter
+        self.stats = stats or CrawlStats()
+        self.stats.mode = "concurrent"
+        self.max_retries = max_retries
+        self.completed_pages = completed_pages or {}
+        # page_id -> 탐색 중 발견한 하위 페이지 ID 목록 (체크포인트 기록용)
+        self.child_pages: Dict[str, List[str]] = {}
+        # 체크포인트로 블록 탐색을 생략한 페이지
+        self.resumed_pages: List[PageCheckpoint] = []
+        # page_id -> last_edited_time 조회 task (같은 페이지를 중복 조회하지 않도록 공유)
+        self._page_updated_at: Dict[str, asyncio.Future] = {}
+
+    def seed_page(self, page_id: str, updated_at: str) -> None:
+        """이미 조회한 페이지의 수정 시간을 캐시에 등록."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(updated_at)
+        self._page_updated_at[page_id] = future
+
+    async def _request(self, func: Callable, **kwargs) -> Dict[str, Any]:
+        """동시 요청 수와 초당 요청 수를 제한하며 Notion API 호출. 429 응답은 재시도."""
+        for attempt in range(self.max_retries + 1):
+            async with self.semaphore:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire()
+                self.stats.requests += 1
+                try:
+                    return await func(**kwargs)
+                except APIResponseError as e:
+                    if (
+                        e.code != APIErrorCode.RateLimited
+                        or attempt == self.max_retries
+                    ):
+                        raise
+                    self.stats.rate_limited += 1
+                    retry_after = float(e.headers.get("retry-after", 2**attempt))
+            await asyncio.sleep(retry_after)
+
+    async def _list_children(self, block_id: str) -> List[Dict[str, Any]]:
+        """페이지네이션을 처리하며 모든 자식 블록 가져오기 (커서는 순차적으로만 진행 가능)"""
+        paginated_blocks = await self._request(
+            self.notion.blocks.children.list, block_id=block_id
+        )
+        children_blocks = paginated_blocks.get("results", [])
+
+        next_cursor = paginated_blocks.get("next_cursor")
+        while next_cursor:
+            paginated_blocks = await self._request(
+                self.notion.blocks.children.list,
+                block_id=block_id,
+                start_cursor=next_cursor,
+            )
+            children_blocks.extend(paginated_blocks.get("results", []))
+            next_cursor = paginated_blocks.get("next_cursor")
+
+        self.stats.blocks_visited += len(children_blocks)
+        return children_blocks
+
+    async def _retrieve_updated_at(self, page_id: str) -> str:
+        page_info = await self._request(self.notion.pages.retrieve, page_id=page_id)
+        self.stats.pages_visited += 1
+        return page_info["last_edited_time"]
+
+    async def _get_updated_at(self, page_id: str) -> str:
+        if page_id not in self._page_updated_at:
+            self._page_updated_at[page_id] = asyncio.ensure_future(
+                self._retrieve_updated_at(page_id)
+            )
+        return await self._page_updated_at[page_id]
+
+    async def fetch_blocks(
+        self,
+        block_id: str,
+        page_id: str,
+        updated_at: str,
+        recursive_page: bool = False,
+        child_page_handler: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        주어진 블록 ID 하위의 모든 블록을 동시에 탐색하고
+        메타데이터와 함께 텍스트 데이터를 추출.
+        `child_page_handler`가 주어지면 하위 페이지는 결과에 이어붙이지 않고 handler에 넘김.
+        """
+        try:
+            children_blocks = await self._list_children(block_id)
+
+            # 블록별 page_id, updated_at 결정 (순차 탐색과 동일한 규칙)
+            resolved_blocks = []
+            for block in children_blocks:
+                parent_page_id = block.get("parent", {}).get("page_id")
+                if parent_page_id:
+                    page_id = parent_page_id
+                    updated_at = await self._get_updated_at(page_id)
+                resolved_blocks.append((block, page_id, updated_at))
+
+            # 자식을 가진 블록들은 병렬로 탐색
+            subtree_tasks = {}
+            for i, (block, block_page_id, block_updated_at) in enumerate(
+                resolved_blocks
+            ):
+                # `recursive_page = False`일 경우 현재 페이지의 내용만 추출.
+                if block.get("type") == "child_page" and not recursive_page:
+                    continue
+                # 비어 있는 하위 페이지도 탐색 대상으로 넘겨야 이전 청크가 정리됨
+                if block.get("type") == "child_page" and child_page_handler:
+                    child_page_handler(block)
+                elif block.get("has_children"):
+                    subtree_tasks[i] = self.fetch_blocks(
+                        block_id=block["id"],
+                        page_id=block_page_id,
+                        updated_at=block_updated_at,
+                        recursive_page=recursive_page,
+                        child_page_handler=child_page_handler,
+                    )
+            subtree_results = dict(
+                zip(subtree_tasks.keys(), await asyncio.gather(*subtree_tasks.values()))
+            )
+
+            results = []
+            for i, (block, block_page_id, block_updated_at) in enumerate(
+                resolved_blocks
+            ):
+                text_content = self.text_extractor(block)
+                if text_content:  # 텍스트가 있는 경우에만 추가
+                    results.append(
+                        {
+                            "content": text_content,
+                            "updated_at": block_updated_at,
+                            "page_id": block_page_id,
+                            "block_id": block_id,
+                            "block_type": block.get("type"),
+                        }
+                    )
+                results.extend(subtree_results.get(i, []))
+
+        except APIResponseError as e:
+            raise CustomException(
+                exception_case=ExceptionCase.DATALOAD_ERROR,
+                detail=f"Error fetching blocks for {block_id}: {e}",
+            )
+
+        return results
+
+    async def crawl_pages(
+        self,
+        page_id: str,
+        updated_at: str,
+        page_sink: Callable[[List[Dict[str, Any]]], Awaitable[None]],
+        recursive_page: bool = False,
+        initial_blocks: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        페이지 단위로 블록을 탐색하여, 한 페이지의 블록 탐색이 끝날 때마다 `page_sink`로 전달.
+        하위 페이지는 별도 단위로 동시에 탐색하되 탐색 슬롯을 얻은 페이지만 진행하며,
+        슬롯은 `page_sink` 전달까지 유지되므로 `page_sink`가 대기하면 탐색도 함께 대기(backpressure).
+        """
+        child_page_tasks = []
+        child_page_ids = self.child_pages.setdefault(page_id, [])
+
+        def on_child_page(block: Dict[str, Any]) -> None:
+            child_page_ids.append(block["id"])
+            child_page_tasks.append(
+                asyncio.ensure_future(self._crawl_child_page(block["id"], page_sink))
+            )
+
+        try:
+            checkpoint = self.completed_pages.get(page_id)
+            if checkpoint and checkpoint.updated_at == updated_at:
+                # 이미 업로드된 버전이므로 하위 페이지만 이어서 탐색
+                self.stats.pages_resumed += 1
+                self.resumed_pages.append(checkpoint)
+                if recursive_page:
+                    for child_page_id in checkpoint.child_page_ids:
+                        on_child_page({"id": child_page_id})
+            else:
+                async with self.page_slots:
+                    blocks = await self.fetch_blocks(
+                        block_id=page_id,
+                        page_id=page_id,
+                        updated_at=updated_at,
+                        recursive_page=recursive_page,
+                        child_page_handler=on_child_page if recursive_page else None,
+                    )
+                    await page_sink((initial_blocks or []) + blocks)
+            # 하위 페이지는 슬롯을 반납한 뒤 기다림 (부모가 슬롯을 점유하면 교착 상태)
+            await asyncio.gather(*child_page_tasks)
+        except BaseException:
+            for task in child_page_tasks:
+                task.cancel()
+            raise
+
+    async def _crawl_child_page(
+        self,
+        page_id: str,
+        page_sink: Callable[[List[Dict[str, Any]]], Awaitable[None]],
+    ) -> None:
+        try:
+            async with self.page_slots:
+                updated_at = await self._get_updated_at(page_id)
+        except APIResponseError as e:
+            raise CustomException(
+                exception_case=ExceptionCase.DATALOAD_ERROR,
+                detail=f"Error fetching page {page_id}: {e}",
+            )
+        await self.crawl_pages(
+            page_id=page_id,
+            updated_at=updated_at,
+            page_sink=page_sink,
+            recursive_page=True,
+        )
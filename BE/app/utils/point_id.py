@@ -0,0 +1,18 @@
+"""
+벡터 DB에 저장되는 청크의 Point ID를 결정적으로(deterministic) 생성하는 모듈.
+같은 데이터 소스, 같은 페이지, 같은 내용의 청크는 항상 같은 ID를 가짐.
+"""
+
+import hashlib
+import uuid
+
+
+def content_hash(content: str) -> str:
+    """텍스트 내용의 SHA-256 해시."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def make_point_id(datasource: str, page_id: str, content: str) -> str:
+    """(datasource, page_id, 청크 내용 해시)로부터 UUID5 Point ID 생성."""
+    name = f"{datasource}:{page_id}:{content_hash(content)}"
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, name))
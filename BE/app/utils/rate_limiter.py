@@ -0,0 +1,38 @@
+"""
+외부 API 호출량을 제한하기 위한 토큰 버킷(token bucket) 레이트 리미터 모듈
+"""
+
+import asyncio
+import time
+
+
+class TokenBucketRateLimiter:
+    """
+    초당 `rate`개의 토큰이 채워지고 최대 `capacity`개까지 쌓이는 토큰 버킷.
+    여러 코루틴이 하나의 인스턴스를 공유하면 전체 호출량이 `rate`를 넘지 않음.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """토큰을 얻을 때까지 대기. lock을 잡고 대기하므로 요청 순서(FIFO)가 보장됨."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
@@ -0,0 +1,57 @@
+"""
+토크나이저 없이 텍스트의 토큰 수를 빠르게 추정하는 모듈.
+한글/한자/가나(CJK)는 글자당 약 1토큰, 그 외(영문, 숫자, 공백 등)는 약 4글자당 1토큰으로 계산.
+`TokenEstimator`는 모델이 보고한 실제 토큰 수로 추정값을 보정함.
+"""
+
+import math
+import re
+from typing import Optional
+
+CHARS_PER_TOKEN = 4.0
+
+_CJK_PATTERN = re.compile(
+    "[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]"
+)
+
+
+def estimate_token_weight(text: str) -> float:
+    """
+    올림하지 않은 토큰 수 추정값.
+    나눈 조각의 값을 더하면 전체 값과 같으므로(additive) 텍스트 분할기의 길이 함수로 사용.
+    """
+    if not text:
+        return 0.0
+    cjk_count = len(_CJK_PATTERN.findall(text))
+    other_count = len(text) - cjk_count
+    return cjk_count + other_count / CHARS_PER_TOKEN
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수 추정값."""
+    return math.ceil(estimate_token_weight(text))
+
+
+class TokenEstimator:
+    """
+    `estimate_tokens` 추정값에 보정 배수를 곱하는 추정기.
+    모델이 보고한 실제 입력 토큰 수로 `calibrate`를 호출하면 배수를 지수 이동 평균으로 갱신.
+    """
+
+    def __init__(self, scale: float = 1.0, smoothing: float = 0.1):
+        self.scale = scale
+        self.smoothing = smoothing
+
+    def estimate(self, text: str) -> int:
+        return math.ceil(estimate_tokens(text) * self.scale)
+
+    def calibrate(self, estimated: int, actual: Optional[int]) -> None:
+        """`estimated`는 보정 전 추정값(`estimate_tokens`), `actual`은 모델이 보고한 토큰 수."""
+        if not estimated or not actual:
+            return
+        ratio = min(max(actual / estimated, 0.25), 4.0)
+        self.scale += self.smoothing * (ratio - self.scale)
+
+
+# 답변 프롬프트 토큰 예산 계산용 (프로세스 전역으로 보정)
+prompt_token_estimator = TokenEstimator()